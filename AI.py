@@ -1,11 +1,302 @@
 from __future__ import annotations
-import random
+import time
 import Board
+import Zobrist
+from MoveOrdering import MoveOrdering
+from TranspositionTable import TranspositionTable
+
+HEURISTIC_MODE = "heuristic"
+SEARCH_MODE = "search"
+MCTS_MODE = "mcts"
+MODES = (HEURISTIC_MODE, SEARCH_MODE, MCTS_MODE)
+
+# Share of the turn budget used by the search, the rest is kept for the protocol and the system
+TURN_SAFETY_RATIO = 0.8
+# Seconds always kept free at the end of a turn
+TURN_SAFETY_MARGIN = 0.05
+# Turn budget in seconds when the manager sends 'timeout_turn 0' (play as fast as possible)
+FAST_TURN = 0.1
+# Moves the remaining match time is shared between
+MOVES_TO_GO = 25
 
 class Ai:
-    def __init__(self, board_size: int, symbol: str | None):
+    def __init__(self, board_size: int, symbol: str | None, max_memory: int = 0, mode: str = HEURISTIC_MODE):
         self._board_size = board_size
         self._symbol = symbol
+        self._max_memory = max_memory
+        self._tt = TranspositionTable(max_memory)
+        self._ordering = MoveOrdering()
+        self._workers = 1
+        # The parts below are imported and created on first use, by the stage or the mode that needs them:
+        # ParallelSearch only when more than one worker is allowed
+        self._parallel_search = None
+        self._search: Search | None = None
+        self._threat_search: ThreatSpaceSearch | None = None
+        self._evaluator: Evaluator | None = None
+        self._mcts: MCTS | None = None
+        self._seed: int | None = None
+        self._state: GameState | None = None
+        self._reuse_state = True
+        # the search scores its leaves with the line scores of the threat index unless this is enabled
+        self._evaluate_leaves = False
+        self._mode = mode if mode in MODES else HEURISTIC_MODE
+        self._timeout_turn = 5000
+        self._timeout_match = 0
+        self._time_left = 2147483647
+        self._profiler: Profiler | None = None
+        from Profiler import get_profile_path
+        self.set_profile_path(get_profile_path())
+        self._ponder: Ponder | None = None
+        self._pondering = False
+        self._book_path: str | None = None
+        self._book: OpeningBook | None = None
+
+    def set_mode(self, mode: str) -> bool:
+        """
+        :param mode: 'heuristic' for the chain of heuristics, 'search' for the alpha-beta search, 'mcts' for the
+                     Monte Carlo tree search
+        :return: True if the mode is known and has been set, else False
+        """
+        if mode not in MODES:
+            return False
+        self._mode = mode
+        return True
+
+    def get_mode(self) -> str:
+        """
+        :return: return the move selection mode of the AI
+        """
+        return self._mode
+
+    def set_seed(self, seed: int | None):
+        """
+        :param seed: seed of the random choices of the AI, None to seed from the system; the random moves of the
+                     heuristics are drawn by the board, see Board.set_seed
+        :return: None
+        """
+        self._seed = seed
+        if self._mcts != None:
+            self._mcts.set_seed(seed)
+
+    def set_state_reuse(self, reuse: bool):
+        """
+        :param reuse: True to keep the search state from one turn to the next, False to start every turn from nothing
+        :return: None
+        """
+        self._reuse_state = reuse
+
+    def set_leaf_evaluation(self, evaluate_leaves: bool):
+        """
+        :param evaluate_leaves: True for the search mode to score its leaves with the pattern evaluator, False for the
+                                line scores of the threat index
+        :return: None
+        """
+        self._evaluate_leaves = evaluate_leaves
+        if self._search != None:
+            self._search.set_evaluator(self.get_evaluator() if evaluate_leaves else None)
+        if self._ponder != None:
+            self._ponder.set_leaf_evaluation(evaluate_leaves)
+        if self._parallel_search != None:
+            self._parallel_search.set_leaf_evaluation(evaluate_leaves)
+
+    def new_game(self):
+        """
+        :return: None, forget the search state of the game: three gains, forced win line, failed threat searches
+                 and Monte Carlo tree; the transposition table is kept, its entries only depend on the position
+        """
+        if self._state != None:
+            self._state.reset()
+        if self._threat_search != None:
+            self._threat_search.reset()
+        if self._mcts != None:
+            self._mcts.reset()
+
+    def get_game_state(self) -> GameState:
+        """
+        :return: return the search state kept between the turns, see its get_stats() for the reused values
+        """
+        if self._state == None:
+            from GameState import GameState
+            self._state = GameState()
+        return self._state
+
+    def set_time_control(self, timeout_turn: int, timeout_match: int, time_left: int):
+        """
+        :param timeout_turn: time limit of a turn in milliseconds, 0 to play as fast as possible
+        :param timeout_match: time limit of the match in milliseconds, 0 for no limit
+        :param time_left: remaining time of the match in milliseconds
+        :return: None
+        """
+        self._timeout_turn = timeout_turn
+        self._timeout_match = timeout_match
+        self._time_left = time_left
+
+    def get_turn_budget(self) -> float:
+        """
+        :return: return the time in seconds the AI can think about this turn
+        """
+        budget = self._timeout_turn / 1000 if self._timeout_turn > 0 else FAST_TURN
+        if self._timeout_match > 0:
+            budget = min(budget, self._time_left / 1000 / MOVES_TO_GO)
+        return max(0.0, budget * TURN_SAFETY_RATIO - TURN_SAFETY_MARGIN)
+
+    def set_max_memory(self, max_memory: int):
+        """
+        :param max_memory: memory limit sent by the manager in bytes, 0 for no limit
+        :return: None
+        """
+        self._max_memory = max_memory
+        self._tt.set_max_memory(max_memory)
+        if self._mcts != None:
+            self._mcts.set_max_memory(max_memory)
+        self.set_workers(self._workers)
+
+    def set_workers(self, workers: int) -> int:
+        """
+        :param workers: number of processes the search mode can use, capped by the cores and the memory limit
+        :return: the number of processes that will be used
+        """
+        self._workers = max(1, workers)
+        if self._workers > 1:
+            from ParallelSearch import ParallelSearch, get_max_workers
+            workers = min(self._workers, get_max_workers(self._max_memory))
+        else:
+            workers = 1
+        if workers <= 1:
+            self.stop_workers()
+            self._parallel_search = None
+        elif self._parallel_search == None:
+            self._parallel_search = ParallelSearch(workers, self._evaluate_leaves)
+        else:
+            self._parallel_search.set_workers(workers)
+        return workers
+
+    def start_workers(self):
+        """
+        :return: None, start the worker processes of the parallel search if it is enabled
+        """
+        if self._parallel_search != None:
+            self._parallel_search.start()
+
+    def stop_workers(self):
+        """
+        :return: None, stop the worker processes of the parallel search
+        """
+        if self._parallel_search != None:
+            self._parallel_search.stop()
+
+    def set_profile_path(self, path: str | None):
+        """
+        :param path: file the profile of every turn is appended to, None to disable the profiling
+        :return: None
+        """
+        if path == None:
+            self._profiler = None
+        elif self._profiler == None or self._profiler.get_path() != path:
+            from Profiler import Profiler
+            self._profiler = Profiler(path)
+
+    def get_profiler(self) -> Profiler | None:
+        """
+        :return: return the profiler of the AI, None if the profiling is disabled
+        """
+        return self._profiler
+
+    def _run_stage(self, name: str, board: Board, compute) -> tuple(int, int) | None:
+        """
+        :param name: name of the stage of the move selection
+        :param board: current state of the board (Board Class)
+        :param compute: function of the stage, called without arguments
+        :return: the move found by the stage, recorded by the profiler if it is enabled
+        """
+        if self._profiler == None:
+            return compute()
+        return self._profiler.run_stage(name, board, compute)
+
+    def get_move_ordering(self) -> MoveOrdering:
+        """
+        :return: return the move ordering shared by the heuristics, the search and the threat-space search
+        """
+        return self._ordering
+
+    def set_book_path(self, path: str | None):
+        """
+        :param path: opening book file, opened on the first turn and mapped on the first lookup; None or a missing
+                     file disables the book
+        :return: None
+        """
+        if path == self._book_path:
+            return
+        if self._book != None:
+            self._book.close()
+        self._book_path = path
+        self._book = None
+
+    def get_opening_book(self) -> OpeningBook | None:
+        """
+        :return: return the opening book of the AI, None if there is none
+        """
+        if self._book == None and self._book_path != None:
+            from OpeningBook import OpeningBook
+            self._book = OpeningBook(self._book_path)
+        return self._book
+
+    def set_pondering(self, pondering: bool):
+        """
+        :param pondering: True to keep searching on the opponent's time in search mode
+        :return: None
+        """
+        self._pondering = pondering
+        if not pondering:
+            self.stop_pondering()
+
+    def start_pondering(self, board: Board):
+        """
+        :param board: current state of the board (Board Class), after the move of the AI
+        :return: None, start searching the answer to the predicted reply in the background if pondering is enabled
+        """
+        if self._pondering and self._mode == SEARCH_MODE and not board.is_full():
+            self.get_ponder().start(board, self._symbol)
+
+    def stop_pondering(self):
+        """
+        :return: None, stop the background search, it must be called before using the AI or the board again
+        """
+        if self._ponder != None:
+            self._ponder.stop()
+
+    def get_ponder(self) -> Ponder:
+        """
+        :return: return the ponderer of the AI, see its get_stats() for the prediction hits
+        """
+        if self._ponder == None:
+            from Ponder import Ponder
+            self._ponder = Ponder(self._tt, self._evaluate_leaves)
+        return self._ponder
+
+    def get_transposition_table(self) -> TranspositionTable:
+        """
+        :return: return the transposition table of the AI, see its stats() for hit/miss/eviction counters
+        """
+        return self._tt
+
+    def _cached(self, query: str, board: Board, symbol: str | None, compute) -> tuple(int, int) | None:
+        """
+        :param query: name of the question asked about the position
+        :param board: current state of the board (Board Class)
+        :param symbol: player the question is asked for
+        :param compute: function answering the question when the position is not in the transposition table
+        :return: the move answering the question for this position; answers are stored in canonical coordinates
+                 so the 8 symmetric positions share them
+        """
+        canonical_hash, symmetry = board.get_canonical_hash()
+        key = canonical_hash ^ Zobrist.get_query_key(query, symbol)
+        entry = self._tt.get(key)
+        if entry is not None:
+            return board.from_canonical(entry[2], symmetry)
+        move = compute(board, symbol)
+        self._tt.store(key, move=board.to_canonical(move, symmetry))
+        return move
 
     def get_symbol(self) -> str | None:
         """
@@ -27,13 +318,16 @@ class Ai:
         :param board: current state of the board (Board Class)
         :return: return a tuple with the position of the winning move, otherwise None
         """
-        for position in board.get_empty_positions():
-            if not board.check_if_there_is_symbol_next(position):
-                continue
-            tmp = board.copy_board()
-            tmp.update_board(symbol, (position[0], position[1]))
-            if tmp.check_winner(symbol):
-                return position
+        return self._cached("winning_move", board, symbol, self._get_winning_move)
+
+    def _get_winning_move(self, board: Board, symbol: str | None) -> tuple(int, int) | None:
+        if not board.check_winner(symbol):
+            positions = board.get_winning_positions(symbol)
+            return min(positions) if len(positions) > 0 else None
+        for position in board.get_frontier(1):
+            with board.trial(symbol, position) as played:
+                if played and board.check_winner(symbol):
+                    return position
         return None
 
     def get_opponent_winning_move(self, board: Board) -> tuple(int, int) | None:
@@ -48,17 +342,15 @@ class Ai:
         :param board: current state of the board (Board Class)
         :return: return a tuple with the position of the winning move, otherwise None
         """
-        res = []
-        for position in board.get_empty_positions():
-            if not board.check_if_there_is_symbol_next_two(position):
-                continue
-            tmp = board.copy_board()
-
-            _, res = tmp.block_threat_of_three(symbol)
-            nb = len(res)
-            tmp.update_board(symbol, (position[0], position[1]))
-            _, res = tmp.block_threat_of_three(symbol)
-            if len(res) - nb > 1:
+        return self._cached("double_threat", board, symbol, self._can_do_a_double_threat)
+
+    def _can_do_a_double_threat(self, board: Board, symbol: str | None) -> tuple(int, int) | None:
+        state = self.get_game_state()
+        state.sync(board)
+        for position in self._ordering.order(board, symbol, board.get_frontier(2)):
+            if state.get_three_gain(board, symbol, position) > 1:
+                with board.trial(symbol, position):
+                    _, res = board.block_threat_of_three(symbol)
                 vec1 = (position[0]-res[0][0], position[1]-res[0][1])
                 vec2 = (position[0]-res[1][0], position[1]-res[1][1])
                 if vec1[0] * vec2[0] + vec1[1] * vec2[1] == 0:
@@ -75,61 +367,216 @@ class Ai:
         :param board: current state of the board (Board Class)
         :return: return a tuple with the position of the winning move, otherwise None
         """
-        for position in board.get_empty_positions():
-            if not board.check_if_there_is_symbol_next_two(position):
-                continue
-            tmp = board.copy_board()
+        return self._cached("double_win", board, symbol, self._can_do_double_win)
 
-            a = self.get_winning_move(tmp, symbol)
-            if tmp.update_board(self.get_other_symbol(symbol), a):
-                a = self.get_winning_move(tmp, symbol)
-                if tmp.update_board(self.get_other_symbol(symbol), a):
-                    return position
+    def _can_do_double_win(self, board: Board, symbol: str | None) -> tuple(int, int) | None:
+        for position in self._ordering.order(board, symbol, board.get_frontier(2)):
+            a = self.get_winning_move(board, symbol)
+            with board.trial(self.get_other_symbol(symbol), a) as blocked:
+                if blocked:
+                    a = self.get_winning_move(board, symbol)
+                    with board.trial(self.get_other_symbol(symbol), a) as blocked_twice:
+                        if blocked_twice:
+                            return position
         return None
     
+    def get_forced_win(self, board: Board, symbol: str | None) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class)
+        :return: return the first move of a forced win by continuous fours (VCF) or threats (VCT), otherwise None
+        """
+        return self._cached("forced_win", board, symbol, self._get_forced_win)
+
+    def _get_forced_win(self, board: Board, symbol: str | None) -> tuple(int, int) | None:
+        state = self.get_game_state()
+        line = state.get_line(board, symbol)
+        if line != None:
+            return line[0]
+        threat_search = self.get_threat_search()
+        line = threat_search.find_vcf(board, symbol)
+        if line == None:
+            line = threat_search.find_vct(board, symbol)
+        if line == None:
+            return None
+        state.set_line(board, symbol, line)
+        return line[0]
+
+    def get_evaluated_move(self, board: Board, symbol: str | None) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class)
+        :return: the cell next to a stone where a stone of symbol makes the best shapes plus the best shapes it
+                 prevents the opponent from making, see Evaluator, None if there is no stone on the board
+        """
+        return self._cached("evaluation", board, symbol, self._get_evaluated_move)
+
+    def _get_evaluated_move(self, board: Board, symbol: str | None) -> tuple(int, int) | None:
+        other = self.get_other_symbol(symbol)
+        evaluator = self.get_evaluator()
+        best, best_score = None, 0
+        for position in board.get_frontier(1):
+            score = evaluator.get_move_score(board, position, symbol) + evaluator.get_move_score(board, position, other)
+            if score > best_score:
+                best, best_score = position, score
+        return best
+
+    def get_evaluator(self) -> Evaluator:
+        """
+        :return: return the pattern evaluator of the AI, its pattern table is built with the first one
+        """
+        if self._evaluator == None:
+            from Evaluator import Evaluator
+            self._evaluator = Evaluator()
+        return self._evaluator
+
+    def get_threat_search(self) -> ThreatSpaceSearch:
+        """
+        :return: return the threat-space search of the AI, see its get_stats() for the last search
+        """
+        if self._threat_search == None:
+            from ThreatSpaceSearch import ThreatSpaceSearch
+            self._threat_search = ThreatSpaceSearch(ordering=self._ordering)
+        return self._threat_search
+
+    def play_search_move(self, board: Board) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class)
+        :return: play and return the best move the alpha-beta search finds within the turn budget
+        """
+        deadline = time.perf_counter() + self.get_turn_budget()
+        if self._ponder != None:
+            self._ponder.check_hit(board)
+        move = self._run_stage("forced_win", board, lambda: self.get_forced_win(board, self._symbol))
+        if board.update_board(self._symbol, move):
+            return move
+        if self._parallel_search != None:
+            move = self._run_stage("search", board,
+                                   lambda: self._parallel_search.search(board, self._symbol, deadline))
+        else:
+            move = self._run_stage("search", board, lambda: self.get_search().search(board, self._symbol, deadline))
+        if board.update_board(self._symbol, move):
+            return move
+        return self._run_stage("random", board, lambda: board.random_play(self._symbol))
+
+    def play_mcts_move(self, board: Board) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class)
+        :return: play and return the winning or blocking move if there is one, else a forced win, else the most
+                 visited move of the Monte Carlo tree search within the turn budget
+        """
+        deadline = time.perf_counter() + self.get_turn_budget()
+        move = self._run_stage("winning_move", board, lambda: self.get_winning_move(board, self._symbol))
+        if board.update_board(self._symbol, move):
+            return move
+        move = self._run_stage("opponent_winning_move", board, lambda: self.get_opponent_winning_move(board))
+        if board.update_board(self._symbol, move):
+            return move
+        move = self._run_stage("forced_win", board, lambda: self.get_forced_win(board, self._symbol))
+        if board.update_board(self._symbol, move):
+            return move
+        move, _ = self._run_stage("opponent_threat_of_three", board,
+                                  lambda: board.block_threat_of_three(self.get_opponent_symbol()))
+        if board.update_board(self._symbol, move):
+            return move
+        mcts = self.get_mcts()
+        move = self._run_stage("mcts", board, lambda: mcts.search(board, self._symbol, deadline))
+        if self._profiler != None:
+            self._profiler.set_stats(mcts.get_stats())
+        if board.update_board(self._symbol, move):
+            return move
+        return self._run_stage("random", board, lambda: board.random_play(self._symbol))
+
+    def get_mcts(self) -> MCTS:
+        """
+        :return: return the Monte Carlo tree search of the AI, see its get_stats() for the playouts and the tree size
+        """
+        if self._mcts == None:
+            from MCTS import MCTS
+            self._mcts = MCTS(self._max_memory, seed=self._seed)
+        return self._mcts
+
+    def get_search(self) -> Search:
+        """
+        :return: return the search of the AI, see its get_stats() for the last turn
+        """
+        if self._search == None:
+            from Search import Search
+            evaluator = self.get_evaluator() if self._evaluate_leaves else None
+            self._search = Search(self._tt, ordering=self._ordering, evaluator=evaluator)
+        return self._search
+
     def play_best_move(self, board: Board) -> Board:
         """
         :param board: current state of the board (Board Class)
         :return: return the board updated with the new play
         """
-        a = self.get_winning_move(board, self._symbol)
+        if not self._reuse_state:
+            self.new_game()
+        if self._profiler == None:
+            return self._play_stages(board)
+        self._profiler.begin_turn()
+        move = self._play_stages(board)
+        self._profiler.end_turn(board, self._symbol, self._mode, move)
+        return move
+
+    def _play_stages(self, board: Board) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class)
+        :return: play and return the move of the first stage that finds one
+        """
+        opening_book = self.get_opening_book()
+        if opening_book != None:
+            book = self._run_stage("book", board, lambda: opening_book.lookup(board, self._symbol))
+            if board.update_board(self._symbol, book):
+                return book
+        if self._mode == SEARCH_MODE:
+            return self.play_search_move(board)
+        if self._mode == MCTS_MODE:
+            return self.play_mcts_move(board)
+        a = self._run_stage("winning_move", board, lambda: self.get_winning_move(board, self._symbol))
         if board.update_board(self._symbol, a):
             return a
-        b = self.get_opponent_winning_move(board)
+        b = self._run_stage("opponent_winning_move", board, lambda: self.get_opponent_winning_move(board))
         if board.update_board(self._symbol, b):
             return b
-        c, _ = board.block_threat_of_three(self._symbol)
+        v = self._run_stage("forced_win", board, lambda: self.get_forced_win(board, self._symbol))
+        if board.update_board(self._symbol, v):
+            return v
+        c, _ = self._run_stage("threat_of_three", board, lambda: board.block_threat_of_three(self._symbol))
         if board.update_board(self._symbol, c):
             return c
-        d, _ = board.block_threat_of_three(self.get_opponent_symbol())
+        d, _ = self._run_stage("opponent_threat_of_three", board,
+                               lambda: board.block_threat_of_three(self.get_opponent_symbol()))
         if board.update_board(self._symbol, d):
             return d
         
-        if board._board_size <= 50:
-            h = self.can_do_double_win(board, self._symbol)
-            if board.update_board(self._symbol, h):
-                return h
-            i = self.can_do_double_win(board, self.get_opponent_symbol())
-            if board.update_board(self._symbol, i):
-                return i
-
-            f = self.can_do_a_double_threat(board, self._symbol)
-            if board.update_board(self._symbol, f):
-                return f
-            g = self.can_do_a_double_threat(board, self.get_opponent_symbol())
-            if board.update_board(self._symbol, g):
-                return g
+        h = self._run_stage("double_win", board, lambda: self.can_do_double_win(board, self._symbol))
+        if board.update_board(self._symbol, h):
+            return h
+        i = self._run_stage("opponent_double_win", board,
+                            lambda: self.can_do_double_win(board, self.get_opponent_symbol()))
+        if board.update_board(self._symbol, i):
+            return i
 
-        if self._symbol == 'X':
-            e = board.is_one_side_tile_empty(board._last_X_played)
-        else:
-            e = board.is_one_side_tile_empty(board._last_O_played)
+        f = self._run_stage("double_threat", board, lambda: self.can_do_a_double_threat(board, self._symbol))
+        if board.update_board(self._symbol, f):
+            return f
+        g = self._run_stage("opponent_double_threat", board,
+                            lambda: self.can_do_a_double_threat(board, self.get_opponent_symbol()))
+        if board.update_board(self._symbol, g):
+            return g
+
+        e = self._run_stage("evaluation", board, lambda: self.get_evaluated_move(board, self._symbol))
         if board.update_board(self._symbol, e):
             return e
+
         if self._symbol == 'X':
-            e = board.is_one_side_tile_empty(board._last_O_played)
+            last, opponent_last = board._last_X_played, board._last_O_played
         else:
-            e = board.is_one_side_tile_empty(board._last_X_played)
+            last, opponent_last = board._last_O_played, board._last_X_played
+        e = self._run_stage("neighbour", board, lambda: board.is_one_side_tile_empty(last))
+        if board.update_board(self._symbol, e):
+            return e
+        e = self._run_stage("opponent_neighbour", board, lambda: board.is_one_side_tile_empty(opponent_last))
         if board.update_board(self._symbol, e):
             return e
-        return board.random_play(self._symbol)
+        return self._run_stage("random", board, lambda: board.random_play(self._symbol))
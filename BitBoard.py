@@ -0,0 +1,140 @@
+# This is a 'BitBoard' Class in python for a gomoku game:
+#
+# Same public API as 'Board', but each player's stones are also packed into python integers,
+# one bitboard per direction (row-major, column-major and both diagonals).
+# In every layout the cells of a line are consecutive bits followed by one empty padding bit,
+# so five in a row is found with four shifts and ANDs, only on the lines through the last move.
+from __future__ import annotations
+
+from Board import Board
+
+# Directions as (row step, col step), in the same order as Board.check_winner
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+
+
+class BitBoard(Board):
+    def __init__(self, board_size):
+        self._stride = board_size + 1
+        self._line_mask = (1 << self._stride) - 1
+        self._bits = {'X': [0, 0, 0, 0], 'O': [0, 0, 0, 0]}
+        self._won = {'X': False, 'O': False}
+        super().__init__(board_size)
+
+    def _line_and_bit(self, direction: int, position: tuple(int, int)) -> tuple(int, int):
+        """
+        :param direction: index in DIRECTIONS
+        :param position: position on the board (x, y)
+        :return: the line number of position in this direction and the bit index of position in its bitboard
+        """
+        row, col = position
+        if direction == 0:
+            line, offset = col, row
+        elif direction == 1:
+            line, offset = row, col
+        elif direction == 2:
+            line, offset = row - col + self._board_size - 1, col
+        else:
+            line, offset = row + col, col
+        return line, line * self._stride + offset
+
+    def _five_on_line(self, symbol: str, direction: int, line: int) -> bool:
+        """
+        :param symbol: 'X' or 'O'
+        :param direction: index in DIRECTIONS
+        :param line: line number in this direction
+        :return: True if there is five in a row of symbol on this line
+        """
+        bits = (self._bits[symbol][direction] >> (line * self._stride)) & self._line_mask
+        bits &= bits >> 1
+        bits &= bits >> 1
+        bits &= bits >> 2
+        return bits != 0
+
+    def _set_bits(self, symbol: str, position: tuple(int, int)):
+        """
+        :param symbol: 'X' or 'O'
+        :param position: position on the board (x, y)
+        :return: None, set the bit of position in every direction and check the lines through it
+        """
+        bits = self._bits[symbol]
+        for direction in range(4):
+            line, bit = self._line_and_bit(direction, position)
+            bits[direction] |= 1 << bit
+            if not self._won[symbol] and self._five_on_line(symbol, direction, line):
+                self._won[symbol] = True
+
+    def update_board(self, symbol: str | None, position: tuple(int, int)):
+        """
+        :param symbol: 'X' 'O' or None
+        :param position: position on the board (x, y)
+        :return: True if the move has been played, else False
+        """
+        if not super().update_board(symbol, position):
+            return False
+        if symbol in self._bits:
+            self._set_bits(symbol, position)
+        return True
+
+    def load_stones(self, stones: list[tuple(tuple(int, int), str)]) -> list[tuple(tuple(int, int), str)]:
+        """
+        :param stones: (position, symbol) of the stones, in play order
+        :return: the stones that have not been played, see Board.load_stones
+        """
+        start = len(self._moves)
+        rejected = super().load_stones(stones)
+        for position, symbol, _, _ in self._moves[start:]:
+            if symbol in self._bits:
+                self._set_bits(symbol, position)
+        return rejected
+
+    def pop(self) -> tuple(int, int) | None:
+        """
+        :return: undo the last move played and return its position, None if no move has been played
+        """
+        if len(self._moves) == 0:
+            return None
+        symbol = self._moves[-1][1]
+        position = super().pop()
+        if symbol in self._bits:
+            bits = self._bits[symbol]
+            for direction in range(4):
+                bits[direction] &= ~(1 << self._line_and_bit(direction, position)[1])
+            if self._won[symbol]:
+                self._won[symbol] = self._has_five(symbol)
+        return position
+
+    def _has_five(self, symbol: str) -> bool:
+        """
+        :param symbol: 'X' or 'O'
+        :return: True if there is five in a row of symbol anywhere on the board
+        """
+        for bits in self._bits[symbol]:
+            bits &= bits >> 1
+            bits &= bits >> 1
+            bits &= bits >> 2
+            if bits != 0:
+                return True
+        return False
+
+    def check_winner(self, symbol: str | None) -> bool:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: True if the player that played the symbol have won, else False
+        """
+        if symbol not in self._won:
+            return super().check_winner(symbol)
+        return self._won[symbol]
+
+    def get_empty_positions(self) -> list[(int, int)]:
+        """
+        :return: return a list of tuples with all the empty positions on the board
+        """
+        return [(i, j) for i, row in enumerate(self._board) for j, cell in enumerate(row) if cell is None]
+
+    def reset_board(self):
+        """
+        :return: reset the board to all None
+        """
+        super().reset_board()
+        self._bits = {'X': [0, 0, 0, 0], 'O': [0, 0, 0, 0]}
+        self._won = {'X': False, 'O': False}
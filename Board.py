@@ -5,15 +5,112 @@
 from __future__ import annotations
 
 import random
-import AI
+from contextlib import contextmanager
+from ThreatIndex import ThreatIndex, SYMBOLS
+import Symmetry
+import Zobrist
+
+# Index of each symbol in Board.serialize, following the protocol numbering of the players
+SERIALIZED_SYMBOLS = (None, 'X', 'O')
+# Distance of the frontier: the empty cells at most FRONTIER_DISTANCE cells away from a stone
+FRONTIER_DISTANCE = 2
+
+# (board_size, position) -> ((neighbour position, index, True if at distance 1), ...) shared by every board
+_neighbours_cache: dict = {}
 
 
 class Board:
+    __slots__ = ("_board_size", "_board", "_last_X_played", "_last_O_played", "_moves", "_threats", "_zobrist",
+                 "_hash", "_symmetric_keys", "_symmetric_hashes", "_random", "_trials", "_copies", "_near",
+                 "_frontier", "_empty", "_empty_index")
+
     def __init__(self, board_size):
         self._board_size = board_size
-        self._board = [[None for _ in range(self._board_size)] for _ in range(self._board_size)]
+        self._clear_cells()
         self._last_X_played: tuple(int, int) | None = None
         self._last_O_played: tuple(int, int) | None = None
+        self._moves: list[tuple] = []
+        self._zobrist = Zobrist.get_keys(self._board_size)
+        self._symmetric_keys = Symmetry.get_symmetric_keys(self._board_size)
+        self._random = random.Random()
+        self._trials = 0
+        self._copies = 0
+        self._clear_indexes()
+        self._clear_empty()
+
+    def set_seed(self, seed: int | None):
+        """
+        :param seed: seed of the random moves of this board, None to seed from the system
+        :return: None
+        """
+        self._random.seed(seed)
+
+    def get_trial_count(self) -> int:
+        """
+        :return: number of moves tried with trial since the board has been created
+        """
+        return self._trials
+
+    def get_copy_count(self) -> int:
+        """
+        :return: number of copies made with copy_board or create_sub_board since the board has been created
+        """
+        return self._copies
+
+    def _clear_cells(self):
+        """
+        :return: None, empty every cell of the board
+        """
+        self._board = [[None for _ in range(self._board_size)] for _ in range(self._board_size)]
+
+    def _clear_indexes(self):
+        """
+        :return: None, reset the threat index, the hashes, the neighbour counts and the frontier to an empty board
+        """
+        self._threats = ThreatIndex(self._board_size)
+        self._hash = 0
+        self._symmetric_hashes = [0] * Symmetry.NB_SYMMETRIES
+        # number of stones at distance <= 1 and <= 2 of every cell, and the empty cells where it is not 0
+        self._near = ([0] * (self._board_size * self._board_size), [0] * (self._board_size * self._board_size))
+        self._frontier = (set(), set())
+
+    def _clear_empty(self):
+        """
+        :return: None, mark every cell as empty in the list of the empty cells
+        """
+        # indexes (row * board_size + col) of the empty cells in any order, and the place of each cell in the list
+        self._empty = list(range(self._board_size * self._board_size))
+        self._empty_index = list(range(self._board_size * self._board_size))
+
+    def _take_empty(self, index: int):
+        """
+        :param index: row * board_size + col of an empty cell a stone is placed on
+        :return: None, remove the cell from the empty cells by moving the last one in its place
+        """
+        empty = self._empty
+        place = self._empty_index[index]
+        last = empty.pop()
+        if last != index:
+            empty[place] = last
+            self._empty_index[last] = place
+
+    def _give_empty(self, index: int):
+        """
+        :param index: row * board_size + col of a cell a stone is removed from
+        :return: None, add the cell to the empty cells
+        """
+        self._empty_index[index] = len(self._empty)
+        self._empty.append(index)
+
+    @classmethod
+    def from_lists(cls, rows: list[list[str | None]]) -> Board:
+        """
+        :param rows: the cells of a square board row by row, as returned by get_board
+        :return: a new board with these stones, played row by row
+        """
+        board = cls(len(rows))
+        board.load_stones([((i, j), cell) for i, row in enumerate(rows) for j, cell in enumerate(row) if cell != None])
+        return board
 
     def get_board(self) -> list[list[str | None]]:
         """
@@ -21,6 +118,50 @@ class Board:
         """
         return self._board
 
+    def get_hash(self) -> int:
+        """
+        :return: return the 64 bits Zobrist hash of the stones on the board
+        """
+        return self._hash
+
+    def _update_symmetric_hashes(self, symbol: str, position: tuple(int, int)):
+        """
+        :param symbol: 'X' or 'O', placed on or removed from position
+        :param position: position on the board (x, y)
+        :return: None, xor the key of the moved position into the hash of every symmetry
+        """
+        keys = self._symmetric_keys[symbol][position[0] * self._board_size + position[1]]
+        self._symmetric_hashes = [value ^ key for value, key in zip(self._symmetric_hashes, keys)]
+
+    def get_symmetric_hashes(self) -> list[int]:
+        """
+        :return: the Zobrist hash of the board moved by each of the 8 symmetries, index 0 being get_hash()
+        """
+        return list(self._symmetric_hashes)
+
+    def get_canonical_hash(self) -> tuple(int, int):
+        """
+        :return: (canonical hash, symmetry), the hash is the same for the 8 symmetric boards and the symmetry
+                 moves this board to the canonical one
+        """
+        return Symmetry.canonical(self._symmetric_hashes)
+
+    def to_canonical(self, position: tuple(int, int) | None, symmetry: int) -> tuple(int, int) | None:
+        """
+        :param position: position on the board (x, y), or None
+        :param symmetry: symmetry returned by get_canonical_hash
+        :return: the position in the coordinates of the canonical board
+        """
+        return None if position == None else Symmetry.to_canonical(symmetry, position, self._board_size)
+
+    def from_canonical(self, position: tuple(int, int) | None, symmetry: int) -> tuple(int, int) | None:
+        """
+        :param position: position in the coordinates of the canonical board, or None
+        :param symmetry: symmetry returned by get_canonical_hash
+        :return: the position on this board
+        """
+        return None if position == None else Symmetry.from_canonical(symmetry, position, self._board_size)
+
     def get_row_col(self, row: int, col: int) -> str | None:
         """
         :param row: position X of the board
@@ -31,13 +172,14 @@ class Board:
 
     def print_board(self):
         print("\n")
-        for i in range(len(self._board)):
+        rows = self.get_board()
+        for i in range(len(rows)):
             temp = []
-            for j in range(len(self._board[i])):
-                if self._board[i][j] == None:
+            for j in range(len(rows[i])):
+                if rows[i][j] == None:
                     temp.append(".")
                 else:
-                    temp.append(self._board[i][j])
+                    temp.append(rows[i][j])
             print(" ".join(temp))
 
     def update_board(self, symbol: str | None,
@@ -51,13 +193,228 @@ class Board:
             return False
         if position == None or self._board[position[0]][position[1]] != None:
             return False
+        self._moves.append((position, symbol, self._last_X_played, self._last_O_played))
         self._board[position[0]][position[1]] = symbol
+        if symbol != None:
+            self._take_empty(position[0] * self._board_size + position[1])
+            self._threats.place(symbol, position)
+            self._update_frontier(position, 1)
+        if symbol in self._zobrist:
+            self._hash ^= self._zobrist[symbol][position[0] * self._board_size + position[1]]
+            self._update_symmetric_hashes(symbol, position)
         if symbol == 'X' and position != None:
             self._last_X_played = position
         elif symbol == 'O' and position != None:
             self._last_O_played = position
         return True
 
+    def load_stones(self, stones: list[tuple(tuple(int, int), str)]) -> list[tuple(tuple(int, int), str)]:
+        """
+        Play many stones at once, e.g. the position sent with BOARD: the stones are validated in one pass, then the
+        threat index, the hashes and the frontier are built once instead of being updated after every stone
+        :param stones: (position, symbol) of the stones, in play order
+        :return: the stones that have not been played: out of the board, on an occupied cell, given twice or
+                 without a symbol
+        """
+        size = self._board_size
+        board = self._board
+        accepted = []
+        rejected = []
+        taken = set()
+        for stone in stones:
+            position, symbol = stone
+            if symbol is None or position is None or position in taken or not (0 <= position[0] < size) \
+                    or not (0 <= position[1] < size) or board[position[0]][position[1]] is not None:
+                rejected.append(stone)
+                continue
+            taken.add(position)
+            accepted.append(stone)
+
+        near1, near2 = self._near
+        symmetric_hashes = self._symmetric_hashes
+        touched = set()
+        for position, symbol in accepted:
+            self._moves.append((position, symbol, self._last_X_played, self._last_O_played))
+            board[position[0]][position[1]] = symbol
+            if symbol == 'X':
+                self._last_X_played = position
+            elif symbol == 'O':
+                self._last_O_played = position
+            self._take_empty(position[0] * size + position[1])
+            if symbol in self._zobrist:
+                self._hash ^= self._zobrist[symbol][position[0] * size + position[1]]
+                keys = self._symmetric_keys[symbol][position[0] * size + position[1]]
+                symmetric_hashes = [value ^ key for value, key in zip(symmetric_hashes, keys)]
+            for cell, index, close in self._get_neighbours(position):
+                near2[index] += 1
+                if close:
+                    near1[index] += 1
+                touched.add(cell)
+        self._symmetric_hashes = symmetric_hashes
+        self._threats.place_all(accepted)
+
+        frontier1, frontier2 = self._frontier
+        for cell in touched:
+            if board[cell[0]][cell[1]] == None:
+                frontier2.add(cell)
+                if near1[cell[0] * size + cell[1]] > 0:
+                    frontier1.add(cell)
+        frontier1.difference_update(taken)
+        frontier2.difference_update(taken)
+        return rejected
+
+    def push(self, symbol: str | None, position: tuple(int, int)) -> bool:
+        """
+        :param symbol: 'X' 'O' or None
+        :param position: position on the board (x, y)
+        :return: True if the move has been played and can be undone with pop, else False
+        """
+        return self.update_board(symbol, position)
+
+    def pop(self) -> tuple(int, int) | None:
+        """
+        :return: undo the last move played and return its position, None if no move has been played
+        """
+        if len(self._moves) == 0:
+            return None
+        position, symbol, self._last_X_played, self._last_O_played = self._moves.pop()
+        self._board[position[0]][position[1]] = None
+        if symbol != None:
+            self._give_empty(position[0] * self._board_size + position[1])
+            self._threats.remove(symbol, position)
+            self._update_frontier(position, -1)
+        if symbol in self._zobrist:
+            self._hash ^= self._zobrist[symbol][position[0] * self._board_size + position[1]]
+            self._update_symmetric_hashes(symbol, position)
+        return position
+
+    def _get_neighbours(self, position: tuple(int, int)) -> tuple:
+        """
+        :param position: position on the board (x, y)
+        :return: a tuple of (position, index, True if at distance 1) for every cell of the board at distance 1 or 2
+        """
+        key = (self._board_size, position)
+        neighbours = _neighbours_cache.get(key)
+        if neighbours is None:
+            size = self._board_size
+            neighbours = tuple(((i, j), i * size + j, abs(i - position[0]) <= 1 and abs(j - position[1]) <= 1)
+                               for i in range(max(0, position[0] - 2), min(size, position[0] + 3))
+                               for j in range(max(0, position[1] - 2), min(size, position[1] + 3))
+                               if (i, j) != position)
+            _neighbours_cache[key] = neighbours
+        return neighbours
+
+    def _update_frontier(self, position: tuple(int, int), delta: int):
+        """
+        :param position: position of the stone placed (delta 1) or removed (delta -1), already set on the board
+        :param delta: 1 or -1
+        :return: None, update the neighbour counts around position and the frontier sets
+        """
+        near1, near2 = self._near
+        frontier1, frontier2 = self._frontier
+        board = self._board
+        for cell, index, close in self._get_neighbours(position):
+            near2[index] += delta
+            if close:
+                near1[index] += delta
+            if board[cell[0]][cell[1]] == None:
+                if near2[index] > 0:
+                    frontier2.add(cell)
+                    if near1[index] > 0:
+                        frontier1.add(cell)
+                    else:
+                        frontier1.discard(cell)
+                else:
+                    frontier2.discard(cell)
+                    frontier1.discard(cell)
+        index = position[0] * self._board_size + position[1]
+        if delta > 0:
+            frontier1.discard(position)
+            frontier2.discard(position)
+        else:
+            if near1[index] > 0:
+                frontier1.add(position)
+            if near2[index] > 0:
+                frontier2.add(position)
+
+    def get_frontier(self, distance: int = FRONTIER_DISTANCE) -> list[tuple(int, int)]:
+        """
+        :param distance: 1 or 2
+        :return: the empty positions at most distance cells away from a stone, in the order of get_empty_positions
+        """
+        return sorted(self._frontier[distance - 1])
+
+    def get_neighbour_count(self, position: tuple(int, int), distance: int = FRONTIER_DISTANCE) -> int:
+        """
+        :param position: position on the board (x, y)
+        :param distance: 1 or 2
+        :return: number of stones at most distance cells away from position, position excluded
+        """
+        return self._near[distance - 1][position[0] * self._board_size + position[1]]
+
+    @contextmanager
+    def trial(self, symbol: str | None, position: tuple(int, int)):
+        """
+        Play a move for the duration of a with block, then undo it
+        :param symbol: 'X' 'O' or None
+        :param position: position on the board (x, y)
+        :return: True if the move has been played, else False
+        """
+        self._trials += 1
+        played = self.push(symbol, position)
+        try:
+            yield played
+        finally:
+            if played:
+                self.pop()
+
+    def get_played_positions(self) -> list[tuple(int, int)]:
+        """
+        :return: return the positions of the stones on the board, in the order they have been played
+        """
+        return [move[0] for move in self._moves if move[1] != None]
+
+    def get_moves(self) -> list[tuple(tuple(int, int), str | None)]:
+        """
+        :return: return the (position, symbol) of the moves on the board, in the order they have been played
+        """
+        return [(move[0], move[1]) for move in self._moves]
+
+    def get_move_count(self) -> int:
+        """
+        :return: return the number of moves on the board
+        """
+        return len(self._moves)
+
+    def get_move(self, index: int) -> tuple:
+        """
+        :param index: index of the move in play order, negative to count from the last one
+        :return: the entry of the move, (position, symbol, ...); every move played gets a new entry, so two calls
+                 return the same object only if the move has not been undone in between
+        """
+        return self._moves[index]
+
+    def serialize(self) -> bytes:
+        """
+        :return: the board size then the row, column and player (1 for 'X', 2 for 'O') of each stone in play order
+        """
+        data = bytearray([self._board_size])
+        for position, symbol, _, _ in self._moves:
+            if symbol in SERIALIZED_SYMBOLS:
+                data += bytes([position[0], position[1], SERIALIZED_SYMBOLS.index(symbol)])
+        return bytes(data)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> Board:
+        """
+        :param data: bytes returned by serialize
+        :return: a new board with the same stones, played in the same order
+        """
+        board = cls(data[0])
+        for i in range(1, len(data), 3):
+            board.update_board(SERIALIZED_SYMBOLS[data[i + 2]], (data[i], data[i + 1]))
+        return board
+
     def is_valid_move(self, position: tuple(int, int)) -> bool:
         """
         :param position: position on the board (x, y)
@@ -75,17 +432,15 @@ class Board:
         """
         :return: True if the board is full, else false
         """
-        for i in range(len(self._board)):
-            for j in range(len(self._board[i])):
-                if self._board[i][j] == None:
-                    return False
-        return True
+        return len(self._empty) == 0
 
     def check_winner(self, symbol: str | None) -> bool:
         """
         :param symbol: 'X' 'O' or None
         :return: True if the player that played the symbol have won, else False
         """
+        if symbol in SYMBOLS:
+            return self._threats.has_five(symbol)
         # Check horizontal wins
         for i in range(len(self._board) - 4):
             for j in range(len(self._board[i])):
@@ -118,20 +473,17 @@ class Board:
     def random_play(self, symbol: str | None) -> tuple(int, int) | None:  # fill the board with a random position
         """
         :param symbol: 'X' 'O' or None
-        :return: None
+        :return: the position played, the center if it is empty, else a cell drawn from the empty cells in
+                 constant time; None if the board is full
         """
         if self.is_valid_move((self._board_size//2, self._board_size//2)):
             self.update_board(symbol, (self._board_size//2, self._board_size//2))
             return (self._board_size//2, self._board_size//2)
-        if len(self.get_empty_positions()) == 0:
+        if len(self._empty) == 0:
             return None
-        row = random.randint(0, self._board_size - 1)
-        col = random.randint(0, self._board_size - 1)
-        while not self.is_valid_move((row, col)):
-            row = random.randint(0, self._board_size - 1)
-            col = random.randint(0, self._board_size - 1)
-        self.update_board(symbol, (row, col))
-        return (row, col)
+        position = divmod(self._empty[self._random.randrange(len(self._empty))], self._board_size)
+        self.update_board(symbol, position)
+        return position
 
     def get_empty_positions(self) -> list[(int, int)]:
         """
@@ -149,11 +501,13 @@ class Board:
         """
         :return: return a copy of the current board
         """
-        new_board = Board(self._board_size)
+        self._copies += 1
+        new_board = type(self)(self._board_size)
+        # the copy draws from the same random stream, so a seeded game stays reproducible
+        new_board._random = self._random
 
-        for i in range(self._board_size):
-            for j in range(self._board_size):
-                new_board.update_board(self._board[i][j], (i, j))
+        for position, symbol, _, _ in self._moves:
+            new_board.update_board(symbol, position)
         return new_board
 
     #check if position is in range of the board
@@ -175,6 +529,7 @@ class Board:
         :param position: position on the board (x, y)
         :return: return a copy of the current board
         """
+        self._copies += 1
         new_board = Board(min(min(self._board_size, position[0] + 5) - max(0, position[0] - 5) + 1, self._board_size))
 
         for i in range(max(0, position[0] - 5), min(self._board_size, position[0] + 5)):
@@ -186,73 +541,80 @@ class Board:
         """
         :return: reset the board to all None
         """
-        self._board = [[None for _ in range(self._board_size)] for _ in range(self._board_size)]
+        self._clear_cells()
+        self._last_X_played = None
+        self._last_O_played = None
+        self._moves = []
+        self._clear_indexes()
+        self._clear_empty()
 
     def block_threat_of_three(self, symbol: str | None) -> tuple(int, int) | None:
         """
         :param symbol: 'X' 'O' or None
-        :return: True if the player that played the symbol have won, else False
+        :return: the first cell completing a threat of three of symbol and the list of all of them, (None, []) if none
         """
-        # Check horizontal threat
-        res: list[tuple(int, int)] = []
-        for i in range(len(self._board) - 4):
-            for j in range(len(self._board[i])):
-                if self.is_valid_move((i, j)) and self.is_valid_move((i + 5, j)):
-                    empty: list[tuple(int, int)] = []
-                    for k in range(1, 5):
-                        if self._board[i + k][j] != symbol and self._board[i + k][j] != None:
-                            empty = []
-                            break
-                        if self.is_valid_move((i + k, j)):
-                            empty.append((i + k, j))
-                    if len(empty) == 1:
-                        res.append(empty[0])
-
-        # Check vertical threat
-        for i in range(len(self._board)):
-            for j in range(len(self._board[i]) - 4):
-                if self.is_valid_move((i, j)) and self.is_valid_move((i, j + 5)):
-                    empty: list[tuple(int, int)] = []
-                    for k in range(1, 5):
-                        if self._board[i][j + k] != symbol and self._board[i][j + k] != None:
-                            empty = []
-                            break
-                        if self.is_valid_move((i, j + k)):
-                            empty.append((i, j + k))
-                    if len(empty) == 1:
-                        res.append(empty[0])
-
-        # Check positive slope diagonal threat
-        for i in range(len(self._board) - 4):
-            for j in range(len(self._board[i]) - 4):
-                if self.is_valid_move((i, j)) and self.is_valid_move((i + 5, j + 5)):
-                    empty: list[tuple(int, int)] = []
-                    for k in range(1, 5):
-                        if self._board[i + k][j + k] != symbol and self._board[i + k][j + k] != None:
-                            empty = []
-                            break
-                        if self.is_valid_move((i + k, j + k)):
-                            empty.append((i + k, j + k))
-                    if len(empty) == 1:
-                        res.append(empty[0])
-
-        # Check negative slope diagonal threat
-        for i in range(4, len(self._board)):
-            for j in range(len(self._board[i]) - 4):
-                if self.is_valid_move((i, j)) and self.is_valid_move((i - 5, j + 5)):
-                    empty: list[tuple(int, int)] = []
-                    for k in range(1, 5):
-                        if self._board[i - k][j + k] != symbol and self._board[i - k][j + k] != None:
-                            empty = []
-                            break
-                        if self.is_valid_move((i - k, j + k)):
-                            empty.append((i - k, j + k))
-                    if len(empty) == 1:
-                        res.append(empty[0])
+        res = self._threats.threats_of_three(symbol)
         if len(res) > 0:
             return res[0], res
         return None, []
 
+    def count_threats_of_three(self, symbol: str | None) -> int:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: number of threats of three of symbol (3 stones and an empty cell between two empty ends)
+        """
+        return self._threats.count_threats_of_three(symbol)
+
+    def count_fours(self, symbol: str | None) -> int:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: number of 5 cells lines with 4 stones of symbol and one empty cell
+        """
+        return self._threats.count_fours(symbol)
+
+    def get_four_making_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of empty positions where symbol makes four stones in a 5 cells line
+        """
+        return self._threats.four_making_positions(symbol)
+
+    def get_three_making_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of empty positions where symbol makes a new threat of three
+        """
+        return self._threats.three_making_positions(symbol)
+
+    def get_three_defense_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of empty positions that break a threat of three of symbol
+        """
+        return self._threats.three_defense_positions(symbol)
+
+    def get_line_score(self, symbol: str | None) -> int:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: static score of the 5 cells lines that only hold stones of symbol
+        """
+        return self._threats.line_score(symbol)
+
+    def get_cell_score(self, position: tuple(int, int), symbol: str | None) -> int:
+        """
+        :param position: an empty position on the board (x, y)
+        :param symbol: player about to play on position
+        :return: static score of the move, how much it extends lines of symbol and cuts the other player's
+        """
+        return self._threats.cell_score(position, symbol)
+
+    def get_winning_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of empty positions that make five in a row for symbol
+        """
+        return self._threats.winning_positions(symbol)
+
     def is_one_side_tile_empty(self, position: tuple(int, int)) -> tuple(int, int) | None:
         """
         :param position: position on the board (x, y)
@@ -267,40 +629,22 @@ class Board:
                     res.append((position[0] + i - 1, position[1] + j - 1))
         if len(res) == 0:
             return None
-        return res[random.randint(0, len(res) - 1)]
+        return res[self._random.randint(0, len(res) - 1)]
 
     def check_if_there_is_symbol_next(self, position: tuple(int, int)) -> bool:
         """
         :param position: position on the board (x, y)
-        :return: True if there is a symbol 'O' or 'X' on the 3x3 square, else False
+        :return: True if there is a symbol 'O' or 'X' on the 3x3 square around position, else False
         """
-        if position == None:
+        if position == None or not self.is_position_in_range(position):
             return False
-        for i in range(3):
-            for j in range(3):
-                if position[0] == i and position[1] == j:
-                    continue
-                try:
-                    if self._board[position[0] + i - 1][position[1] + j - 1] != None:
-                        return True
-                except IndexError:
-                    continue
-        return False
-    
+        return self.get_neighbour_count(position, 1) > 0
+
     def check_if_there_is_symbol_next_two(self, position: tuple(int, int)) -> bool:
         """
         :param position: position on the board (x, y)
-        :return: True if there is a symbol 'O' or 'X' on the 3x3 square, else False
+        :return: True if there is a symbol 'O' or 'X' on the 5x5 square around position, else False
         """
-        if position == None:
+        if position == None or not self.is_position_in_range(position):
             return False
-        for i in range(5):
-            for j in range(5):
-                if position[0] == i and position[1] == j:
-                    continue
-                try:
-                    if self._board[position[0] + i - 2][position[1] + j - 2] != None:
-                        return True
-                except IndexError:
-                    continue
-        return False
+        return self.get_neighbour_count(position, 2) > 0
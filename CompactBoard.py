@@ -0,0 +1,294 @@
+# This is a 'CompactBoard' Class in python for a gomoku game:
+#
+# Same public API as 'Board', but the cells are one flat bytearray, one byte per cell at row * board_size + col
+# (0 empty, 1 'X', 2 'O', then codes given to other symbols on first use), and the class has __slots__,
+# so a board holds no __dict__ and no list of lists of references.
+# The indexes are packed the same way: the window bitmasks of the threat index and the neighbour counts are
+# bytearrays, the empty cells and their places are arrays of unsigned shorts and the 8 symmetric hashes an
+# array of 64 bits integers, instead of lists of Python ints.
+# Copies duplicate the buffers, the move stack and the threat index with slice copies instead of replaying
+# every move; get_board and from_lists convert to and from the list-of-lists view of 'Board'.
+from __future__ import annotations
+
+from array import array
+
+from Board import Board
+from ThreatIndex import ThreatIndex
+import Symmetry
+
+# code -> symbol, codes of other symbols than 'X' and 'O' are added on first use
+SYMBOLS = [None, 'X', 'O']
+CODES = {None: 0, 'X': 1, 'O': 2}
+
+
+def get_code(symbol: str | None) -> int:
+    """
+    :param symbol: symbol of a cell
+    :return: the byte stored for the symbol
+    """
+    code = CODES.get(symbol)
+    if code is None:
+        if len(SYMBOLS) > 255:
+            raise ValueError(f"too many symbols for a CompactBoard: {symbol!r}")
+        code = len(SYMBOLS)
+        SYMBOLS.append(symbol)
+        CODES[symbol] = code
+    return code
+
+
+class CompactBoard(Board):
+    __slots__ = ("_cells",)
+
+    def _clear_cells(self):
+        """
+        :return: None, empty every cell of the board
+        """
+        self._cells = bytearray(self._board_size * self._board_size)
+
+    def _clear_indexes(self):
+        """
+        :return: None, reset the indexes to an empty board, in bytearrays and arrays
+        """
+        nb_cells = self._board_size * self._board_size
+        self._threats = ThreatIndex(self._board_size, compact=True)
+        self._hash = 0
+        self._symmetric_hashes = array('Q', [0] * Symmetry.NB_SYMMETRIES)
+        # at most 8 and 24 neighbours, a byte per cell is enough
+        self._near = (bytearray(nb_cells), bytearray(nb_cells))
+        self._frontier = (set(), set())
+
+    def _clear_empty(self):
+        """
+        :return: None, mark every cell as empty in the list of the empty cells, kept in arrays
+        """
+        nb_cells = self._board_size * self._board_size
+        # unsigned shorts up to 255x255 boards, the protocol stops at 100x100
+        typecode = 'H' if nb_cells <= 0xFFFF else 'I'
+        self._empty = array(typecode, range(nb_cells))
+        self._empty_index = array(typecode, range(nb_cells))
+
+    def _update_symmetric_hashes(self, symbol: str, position: tuple(int, int)):
+        """
+        :param symbol: 'X' or 'O', placed on or removed from position
+        :param position: position on the board (x, y)
+        :return: None, xor the key of the moved position into the hash of every symmetry, in place
+        """
+        hashes = self._symmetric_hashes
+        for symmetry, key in enumerate(self._symmetric_keys[symbol][position[0] * self._board_size + position[1]]):
+            hashes[symmetry] ^= key
+
+    def get_cells(self) -> bytearray:
+        """
+        :return: the cells of the board, one byte per cell in row-major order, see CODES
+        """
+        return self._cells
+
+    def get_board(self) -> list[list[str | None]]:
+        """
+        :return: a list of lists copy of the cells, like Board.get_board
+        """
+        size = self._board_size
+        cells = self._cells
+        return [[SYMBOLS[code] for code in cells[row * size:(row + 1) * size]] for row in range(size)]
+
+    def get_row_col(self, row: int, col: int) -> str | None:
+        """
+        :param row: position X of the board
+        :param col: position Y of the board
+        :return: return the symbol at a specific position on the board
+        """
+        return SYMBOLS[self._cells[row * self._board_size + col]]
+
+    def is_valid_move(self, position: tuple(int, int)) -> bool:
+        """
+        :param position: position on the board (x, y)
+        :return: True if the move is valid, False if not
+        """
+        if position == None or position[0] == None or position[1] == None:
+            return False
+        if not self.is_position_in_range(position):
+            return False
+        return self._cells[position[0] * self._board_size + position[1]] == 0
+
+    def update_board(self, symbol: str | None, position: tuple(int, int)):
+        """
+        :param symbol: 'X' 'O' or None
+        :param position: position on the board (x, y)
+        :return: True if the move has been played, else False
+        """
+        if not self.is_valid_move(position):
+            return False
+        index = position[0] * self._board_size + position[1]
+        self._moves.append((position, symbol, self._last_X_played, self._last_O_played))
+        self._cells[index] = get_code(symbol)
+        if symbol != None:
+            self._take_empty(index)
+            self._threats.place(symbol, position)
+            self._update_frontier(position, 1)
+        if symbol in self._zobrist:
+            self._hash ^= self._zobrist[symbol][index]
+            self._update_symmetric_hashes(symbol, position)
+        if symbol == 'X':
+            self._last_X_played = position
+        elif symbol == 'O':
+            self._last_O_played = position
+        return True
+
+    def pop(self) -> tuple(int, int) | None:
+        """
+        :return: undo the last move played and return its position, None if no move has been played
+        """
+        if len(self._moves) == 0:
+            return None
+        position, symbol, self._last_X_played, self._last_O_played = self._moves.pop()
+        index = position[0] * self._board_size + position[1]
+        self._cells[index] = 0
+        if symbol != None:
+            self._give_empty(index)
+            self._threats.remove(symbol, position)
+            self._update_frontier(position, -1)
+        if symbol in self._zobrist:
+            self._hash ^= self._zobrist[symbol][index]
+            self._update_symmetric_hashes(symbol, position)
+        return position
+
+    def _update_frontier(self, position: tuple(int, int), delta: int):
+        """
+        :param position: position of the stone placed (delta 1) or removed (delta -1), already set on the board
+        :param delta: 1 or -1
+        :return: None, update the neighbour counts around position and the frontier sets
+        """
+        near1, near2 = self._near
+        frontier1, frontier2 = self._frontier
+        cells = self._cells
+        for cell, index, close in self._get_neighbours(position):
+            near2[index] += delta
+            if close:
+                near1[index] += delta
+            if cells[index] == 0:
+                if near2[index] > 0:
+                    frontier2.add(cell)
+                    if near1[index] > 0:
+                        frontier1.add(cell)
+                    else:
+                        frontier1.discard(cell)
+                else:
+                    frontier2.discard(cell)
+                    frontier1.discard(cell)
+        index = position[0] * self._board_size + position[1]
+        if delta > 0:
+            frontier1.discard(position)
+            frontier2.discard(position)
+        else:
+            if near1[index] > 0:
+                frontier1.add(position)
+            if near2[index] > 0:
+                frontier2.add(position)
+
+    def load_stones(self, stones: list[tuple(tuple(int, int), str)]) -> list[tuple(tuple(int, int), str)]:
+        """
+        :param stones: (position, symbol) of the stones, in play order
+        :return: the stones that have not been played, see Board.load_stones
+        """
+        size = self._board_size
+        cells = self._cells
+        accepted = []
+        rejected = []
+        for stone in stones:
+            position, symbol = stone
+            if symbol is None or position is None or not (0 <= position[0] < size) \
+                    or not (0 <= position[1] < size) or cells[position[0] * size + position[1]] != 0:
+                rejected.append(stone)
+                continue
+            # the cell is marked at once so a second stone on it is rejected
+            cells[position[0] * size + position[1]] = get_code(symbol)
+            accepted.append(stone)
+
+        near1, near2 = self._near
+        symmetric_hashes = self._symmetric_hashes
+        touched = set()
+        for position, symbol in accepted:
+            self._moves.append((position, symbol, self._last_X_played, self._last_O_played))
+            if symbol == 'X':
+                self._last_X_played = position
+            elif symbol == 'O':
+                self._last_O_played = position
+            self._take_empty(position[0] * size + position[1])
+            if symbol in self._zobrist:
+                self._hash ^= self._zobrist[symbol][position[0] * size + position[1]]
+                keys = self._symmetric_keys[symbol][position[0] * size + position[1]]
+                symmetric_hashes = [value ^ key for value, key in zip(symmetric_hashes, keys)]
+            for cell, index, close in self._get_neighbours(position):
+                near2[index] += 1
+                if close:
+                    near1[index] += 1
+                touched.add((cell, index))
+        self._symmetric_hashes = array('Q', symmetric_hashes)
+        self._threats.place_all(accepted)
+
+        frontier1, frontier2 = self._frontier
+        for cell, index in touched:
+            if cells[index] == 0:
+                frontier2.add(cell)
+                if near1[index] > 0:
+                    frontier1.add(cell)
+        for position, _ in accepted:
+            frontier1.discard(position)
+            frontier2.discard(position)
+        return rejected
+
+    def check_winner(self, symbol: str | None) -> bool:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: True if the player that played the symbol have won, else False
+        """
+        if symbol in self._zobrist:
+            return self._threats.has_five(symbol)
+        return Board.from_lists(self.get_board()).check_winner(symbol)
+
+    def get_empty_positions(self) -> list[(int, int)]:
+        """
+        :return: return a list of tuples with all the empty positions on the board
+        """
+        size = self._board_size
+        return [divmod(index, size) for index, code in enumerate(self._cells) if code == 0]
+
+    def copy_board(self) -> CompactBoard:
+        """
+        :return: return a copy of the current board, made with one copy of the cell buffer and of each index
+        """
+        self._copies += 1
+        board = type(self).__new__(type(self))
+        board._board_size = self._board_size
+        board._cells = self._cells[:]
+        board._last_X_played = self._last_X_played
+        board._last_O_played = self._last_O_played
+        board._moves = self._moves[:]
+        board._threats = self._threats.copy()
+        board._zobrist = self._zobrist
+        board._hash = self._hash
+        board._symmetric_keys = self._symmetric_keys
+        board._symmetric_hashes = self._symmetric_hashes[:]
+        # the copy draws from the same random stream, so a seeded game stays reproducible
+        board._random = self._random
+        board._trials = 0
+        board._copies = 0
+        board._near = (self._near[0][:], self._near[1][:])
+        board._frontier = (set(self._frontier[0]), set(self._frontier[1]))
+        board._empty = self._empty[:]
+        board._empty_index = self._empty_index[:]
+        return board
+
+    def create_sub_board(self, position: tuple(int, int)) -> Board:
+        """
+        :param position: position on the board (x, y)
+        :return: return a copy of the cells around position, like Board.create_sub_board
+        """
+        self._copies += 1
+        size = self._board_size
+        top, left = max(0, position[0] - 5), max(0, position[1] - 5)
+        board = type(self)(min(min(size, position[0] + 5) - top + 1, size))
+        board.load_stones([((i - top, j - left), SYMBOLS[self._cells[i * size + j]])
+                           for i in range(top, min(size, position[0] + 5))
+                           for j in range(left, min(size, position[1] + 5)) if self._cells[i * size + j] != 0])
+        return board
@@ -0,0 +1,306 @@
+# This is an 'Evaluator' Class in python for a gomoku game:
+#
+# Static evaluation with a pattern table. The 9 cells of a line centered on a cell (4 on each side) are encoded,
+# from the point of view of one player, as a base 3 number: 0 for an empty cell, 1 for a stone of the player,
+# 2 for a stone of the opponent or a cell out of the board. PATTERN_TABLE gives, for every code with a stone of
+# the player in the center, the score of the best shape through it (five, open four, four, open three, ...).
+# The codes of every cell and direction are kept for both players, and a stone changes only one digit of the
+# codes of the 36 cells of its 4 lines, so the totals are updated incrementally. The evaluator follows the move
+# stack of its board: it undoes and replays only the moves that changed since the last call, so pushes and pops of
+# a search cost a few table lookups per evaluation, and the board itself carries no extra work.
+from __future__ import annotations
+
+# Directions as (row step, col step), in the same order as ThreatIndex
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+SYMBOLS = ('X', 'O')
+# Cells on each side of the center of an encoded line
+REACH = 4
+LINE_LENGTH = 2 * REACH + 1
+POWERS = tuple(3 ** digit for digit in range(LINE_LENGTH))
+CENTER = POWERS[REACH]
+EMPTY, MINE, BLOCKED = 0, 1, 2
+
+# Shapes, from the strongest
+FIVE = "five"
+OPEN_FOUR = "open_four"
+FOUR = "four"
+OPEN_THREE = "open_three"
+THREE = "three"
+OPEN_TWO = "open_two"
+TWO = "two"
+ONE = "one"
+DEAD = "dead"
+SHAPE_SCORES = {
+    FIVE: 100000,
+    OPEN_FOUR: 10000,
+    FOUR: 1000,
+    OPEN_THREE: 1000,
+    THREE: 100,
+    OPEN_TWO: 100,
+    TWO: 10,
+    ONE: 1,
+    DEAD: 0,
+}
+
+# code -> score of the shape, built on first use
+_pattern_table: list[int] | None = None
+# (board_size, position) -> ((cell, code index, digit weight), ...) of the cells whose lines go through position
+_lines_cache: dict = {}
+# board_size -> codes of an empty board, the cells out of the board are BLOCKED
+_empty_codes_cache: dict = {}
+
+
+def decode(code: int) -> list[int]:
+    """
+    :param code: encoded line
+    :return: the LINE_LENGTH digits of the line, from the offset -REACH to +REACH
+    """
+    digits = []
+    for _ in range(LINE_LENGTH):
+        code, digit = divmod(code, 3)
+        digits.append(digit)
+    return digits
+
+
+def encode(digits: list[int]) -> int:
+    """
+    :param digits: the LINE_LENGTH digits of a line
+    :return: the code of the line
+    """
+    return sum(digit * power for digit, power in zip(digits, POWERS))
+
+
+def classify(digits: list[int]) -> str:
+    """
+    :param digits: a line with a stone of the player in the center
+    :return: the best shape made through the center: the most stones in a 5 cells window without a blocked cell,
+             open when a 6 cells window with empty ends holds them in its 4 inner cells
+    """
+    best = 0
+    for start in range(REACH + 1):
+        window = digits[start:start + 5]
+        if BLOCKED not in window:
+            best = max(best, window.count(MINE))
+    if best == 0:
+        return DEAD
+    if best == 5:
+        return FIVE
+    open_best = 0
+    for start in range(REACH):
+        window = digits[start:start + 6]
+        if window[0] == EMPTY and window[5] == EMPTY and BLOCKED not in window:
+            open_best = max(open_best, window.count(MINE))
+    if best == 4:
+        return OPEN_FOUR if open_best == 4 else FOUR
+    if best == 3:
+        return OPEN_THREE if open_best == 3 else THREE
+    if best == 2:
+        return OPEN_TWO if open_best == 2 else TWO
+    return ONE
+
+
+def get_pattern_table() -> list[int]:
+    """
+    :return: the score of every code, 0 for the codes without a stone of the player in the center
+    """
+    global _pattern_table
+    if _pattern_table is None:
+        table = [0] * (3 ** LINE_LENGTH)
+        for code in range(len(table)):
+            digits = decode(code)
+            if digits[REACH] == MINE:
+                table[code] = SHAPE_SCORES[classify(digits)]
+        _pattern_table = table
+    return _pattern_table
+
+
+def get_lines(board_size: int, position: tuple(int, int)) -> tuple:
+    """
+    :param board_size: size of the board
+    :param position: position on the board (x, y)
+    :return: (cell index, code index, weight of the digit of position in the code) for every cell of the board
+             less than REACH cells away from position on one of its 4 lines, position excluded
+    """
+    key = (board_size, position)
+    lines = _lines_cache.get(key)
+    if lines is None:
+        lines = []
+        for direction, (dr, dc) in enumerate(DIRECTIONS):
+            for offset in range(-REACH, REACH + 1):
+                # position is at offset cells from the center cell of the line
+                row, col = position[0] - offset * dr, position[1] - offset * dc
+                if offset != 0 and 0 <= row < board_size and 0 <= col < board_size:
+                    cell = row * board_size + col
+                    lines.append((cell, cell * 4 + direction, POWERS[offset + REACH]))
+        lines = tuple(lines)
+        _lines_cache[key] = lines
+    return lines
+
+
+def get_empty_codes(board_size: int) -> list[int]:
+    """
+    :param board_size: size of the board
+    :return: the code of every cell and direction, at cell * 4 + direction, on an empty board; shared, copy it
+    """
+    codes = _empty_codes_cache.get(board_size)
+    if codes is None:
+        codes = [0] * (4 * board_size * board_size)
+        for row in range(board_size):
+            for col in range(board_size):
+                for direction, (dr, dc) in enumerate(DIRECTIONS):
+                    code = 0
+                    for offset in range(-REACH, REACH + 1):
+                        i, j = row + offset * dr, col + offset * dc
+                        if not (0 <= i < board_size and 0 <= j < board_size):
+                            code += BLOCKED * POWERS[offset + REACH]
+                    codes[(row * board_size + col) * 4 + direction] = code
+        _empty_codes_cache[board_size] = codes
+    return codes
+
+
+class Evaluator:
+    def __init__(self):
+        self._table = get_pattern_table()
+        self._board = None
+        self._board_size = 0
+        self._applied: list[tuple] = []
+        self._owners: list[str | None] = []
+        self._codes = {symbol: [] for symbol in SYMBOLS}
+        self._totals = {symbol: 0 for symbol in SYMBOLS}
+        self.evaluations = 0
+        self.replayed = 0
+
+    def _bind(self, board):
+        """
+        :param board: board to follow from now on
+        :return: None, start from an empty board of its size
+        """
+        size = board._board_size
+        self._board = board
+        self._board_size = size
+        self._applied = []
+        self._owners = [None] * (size * size)
+        empty = get_empty_codes(size)
+        self._codes = {symbol: empty[:] for symbol in SYMBOLS}
+        self._totals = {symbol: 0 for symbol in SYMBOLS}
+
+    def sync(self, board):
+        """
+        :param board: current state of the board (Board Class)
+        :return: None, undo the moves that are no longer on the board and apply the new ones
+        """
+        if board is not self._board or board._board_size != self._board_size:
+            self._bind(board)
+        count = board.get_move_count()
+        applied = self._applied
+        common = min(count, len(applied))
+        # the moves are a stack: below the last move both stacks share, all the moves are the same
+        while common > 0 and board.get_move(common - 1) is not applied[common - 1]:
+            common -= 1
+        while len(applied) > common:
+            self._apply(applied.pop(), False)
+        for index in range(common, count):
+            move = board.get_move(index)
+            applied.append(move)
+            self._apply(move, True)
+
+    def _apply(self, move: tuple, placing: bool):
+        """
+        :param move: entry of the move stack of the board, (position, symbol, ...)
+        :param placing: True to place the stone, False to remove it
+        :return: None, update the digit of the stone in the codes of its lines and the totals of the stones on them
+        """
+        position, symbol = move[0], move[1]
+        if symbol is None:
+            return
+        self.replayed += 1
+        size = self._board_size
+        table = self._table
+        owners = self._owners
+        totals = self._totals
+        x_codes, o_codes = self._codes['X'], self._codes['O']
+        x_digit = MINE if symbol == 'X' else BLOCKED
+        o_digit = MINE if symbol == 'O' else BLOCKED
+        cell = position[0] * size + position[1]
+        if not placing:
+            self._remove_center(cell, symbol)
+        sign = 1 if placing else -1
+        for other, index, weight in get_lines(size, position):
+            old_x, old_o = x_codes[index], o_codes[index]
+            new_x = old_x + sign * x_digit * weight
+            new_o = old_o + sign * o_digit * weight
+            x_codes[index] = new_x
+            o_codes[index] = new_o
+            owner = owners[other]
+            if owner == 'X':
+                totals['X'] += table[new_x] - table[old_x]
+            elif owner == 'O':
+                totals['O'] += table[new_o] - table[old_o]
+        if placing:
+            owners[cell] = symbol
+            if symbol in totals:
+                codes = self._codes[symbol]
+                for direction in range(4):
+                    codes[cell * 4 + direction] += CENTER
+                    totals[symbol] += table[codes[cell * 4 + direction]]
+            else:
+                for codes in self._codes.values():
+                    for direction in range(4):
+                        codes[cell * 4 + direction] += BLOCKED * CENTER
+
+    def _remove_center(self, cell: int, symbol: str):
+        """
+        :return: None, take the stone out of the codes of its own cell and out of the totals
+        """
+        self._owners[cell] = None
+        if symbol in self._totals:
+            codes = self._codes[symbol]
+            for direction in range(4):
+                self._totals[symbol] -= self._table[codes[cell * 4 + direction]]
+                codes[cell * 4 + direction] -= CENTER
+        else:
+            for codes in self._codes.values():
+                for direction in range(4):
+                    codes[cell * 4 + direction] -= BLOCKED * CENTER
+
+    def get_total(self, board, symbol: str) -> int:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: 'X' or 'O'
+        :return: sum of the pattern scores of the 4 lines of every stone of symbol
+        """
+        self.sync(board)
+        return self._totals.get(symbol, 0)
+
+    def evaluate(self, board, symbol: str) -> int:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: player to move
+        :return: static score of the position for symbol, its total minus the opponent's
+        """
+        self.evaluations += 1
+        self.sync(board)
+        return self._totals[symbol] - self._totals['O' if symbol == 'X' else 'X']
+
+    def get_line_code(self, board, position: tuple(int, int), direction: int, symbol: str) -> int:
+        """
+        :param board: current state of the board (Board Class)
+        :param position: position on the board (x, y)
+        :param direction: index in DIRECTIONS
+        :param symbol: 'X' or 'O', point of view of the code
+        :return: the code of the line of position in this direction, the cached value
+        """
+        self.sync(board)
+        return self._codes[symbol][(position[0] * self._board_size + position[1]) * 4 + direction]
+
+    def get_move_score(self, board, position: tuple(int, int), symbol: str) -> int:
+        """
+        :param board: current state of the board (Board Class)
+        :param position: an empty position on the board (x, y)
+        :param symbol: player about to play on position
+        :return: the pattern scores of the 4 lines a stone of symbol would make on position
+        """
+        self.sync(board)
+        codes = self._codes[symbol]
+        index = (position[0] * self._board_size + position[1]) * 4
+        return sum(self._table[codes[index + direction] + CENTER] for direction in range(4))
@@ -0,0 +1,142 @@
+# This is a 'GameState' Class in python for a gomoku game:
+#
+# Search state the AI keeps from one turn to the next instead of recomputing it from the board:
+# - the three gains of the candidate cells, how many threats of three a stone of a player on the cell adds.
+#   A gain only depends on the 6 cells windows through the cell, so a stone only changes the gains of the cells
+#   of its 4 lines less than 6 cells away. Between two turns only these cells are forgotten.
+# - the principal variation of the last forced win found: when the opponent answers with the reply of the line,
+#   the rest of the line is still a forced win and is played without searching again.
+# The state follows the stones of the board it is synced with: the moves added or removed since the last sync
+# invalidate the cells around them, and the whole state is dropped when too many moves changed or the size did.
+from __future__ import annotations
+
+# Cells on each side of a stone whose gains it changes, a 6 cells window spans 5 cells from the stone
+REACH = 5
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+# Moves changed since the last sync above which the state is dropped instead of being updated
+MAX_CHANGED_MOVES = 16
+
+
+class GameState:
+    def __init__(self):
+        self._board_size = 0
+        self._moves: list[tuple] = []
+        self._three_gains: dict[str, dict[tuple(int, int), int]] = {}
+        self._line_moves: list[tuple] | None = None
+        self._line_attacker: str | None = None
+        self._line: list[tuple(int, int)] = []
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self.line_hits = 0
+        self.resets = 0
+
+    def reset(self):
+        """
+        :return: None, forget the whole state, e.g. for a new game
+        """
+        self._moves = []
+        self._three_gains = {}
+        self._line_moves = None
+        self._line_attacker = None
+        self._line = []
+        self.resets += 1
+
+    def get_stats(self) -> dict:
+        """
+        :return: three gains reused and computed, cells invalidated, forced win lines reused and resets
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / (self.hits + self.misses) if self.hits + self.misses > 0 else 0.0,
+            "invalidated": self.invalidated,
+            "line_hits": self.line_hits,
+            "resets": self.resets,
+        }
+
+    def sync(self, board):
+        """
+        :param board: current state of the board (Board Class)
+        :return: None, forget the gains of the cells around the moves played or undone since the last sync
+        """
+        moves = board.get_moves()
+        if board._board_size != self._board_size:
+            if self._board_size != 0:
+                self.reset()
+            self._board_size = board._board_size
+            self._moves = moves
+            return
+        known = self._moves
+        common = 0
+        while common < len(known) and common < len(moves) and known[common] == moves[common]:
+            common += 1
+        changed = known[common:] + moves[common:]
+        if len(changed) > MAX_CHANGED_MOVES:
+            self.reset()
+        elif len(self._three_gains) > 0:
+            for position, _ in changed:
+                self._invalidate(position)
+        self._moves = moves
+
+    def _invalidate(self, position: tuple(int, int)):
+        """
+        :param position: position of a stone placed or removed
+        :return: None, forget the gains of the cells of its 4 lines less than REACH + 1 cells away
+        """
+        for gains in self._three_gains.values():
+            for dr, dc in DIRECTIONS:
+                for offset in range(-REACH, REACH + 1):
+                    if gains.pop((position[0] + offset * dr, position[1] + offset * dc), None) is not None:
+                        self.invalidated += 1
+
+    def get_three_gain(self, board, symbol: str | None, position: tuple(int, int)) -> int:
+        """
+        :param board: current state of the board (Board Class), synced with sync()
+        :param symbol: player about to play on position
+        :param position: an empty position on the board (x, y)
+        :return: number of threats of three of symbol the stone adds, minus the ones it breaks
+        """
+        gains = self._three_gains.setdefault(symbol, {})
+        gain = gains.get(position)
+        if gain is not None:
+            self.hits += 1
+            return gain
+        self.misses += 1
+        before = board.count_threats_of_three(symbol)
+        with board.trial(symbol, position):
+            gain = board.count_threats_of_three(symbol) - before
+        gains[position] = gain
+        return gain
+
+    def set_line(self, board, attacker: str | None, line: list[tuple(int, int)]):
+        """
+        :param board: current state of the board (Board Class), the line starts from it
+        :param attacker: player the line is a forced win of
+        :param line: the moves of the line, alternately attacker and defender
+        :return: None
+        """
+        self._line_moves = board.get_moves()
+        self._line_attacker = attacker
+        self._line = list(line)
+
+    def get_line(self, board, attacker: str | None) -> list[tuple(int, int)] | None:
+        """
+        :param board: current state of the board (Board Class)
+        :param attacker: player to move
+        :return: the rest of the last forced win line of attacker if every move played since it was found follows
+                 it, None otherwise
+        """
+        base = self._line_moves
+        if base is None or attacker != self._line_attacker:
+            return None
+        moves = board.get_moves()
+        played = len(moves) - len(base)
+        if played <= 0 or played % 2 != 0 or played >= len(self._line) or moves[:len(base)] != base:
+            return None
+        defender = 'O' if attacker == 'X' else 'X'
+        for index, (position, symbol) in enumerate(moves[len(base):]):
+            if position != self._line[index] or symbol != (attacker if index % 2 == 0 else defender):
+                return None
+        self.line_hits += 1
+        return self._line[played:]
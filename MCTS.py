@@ -0,0 +1,392 @@
+# This is a 'MCTS' Class in python for a gomoku game:
+#
+# Monte Carlo tree search with UCT selection. A playout descends the tree, expands one node and finishes the game
+# with random moves among the empty cells next to a stone. Playouts never touch the board: they play on a flat list
+# of cell codes copied from the root position, keep the candidate cells in a list with lazy deletion, and only look
+# for a five through the stone just placed, so a playout costs a few list operations per move.
+# The nodes live in a pool of parallel lists whose size is capped from max_memory. Between two turns the tree is
+# advanced along the moves played since its root (the AI's move, then the opponent's) instead of being rebuilt,
+# and the pool is compacted to the subtree that is kept.
+from __future__ import annotations
+
+import math
+import random
+import time
+
+# Codes of the cells during a playout: other symbols than 'X' and 'O' are BLOCKED, CANDIDATE is an empty cell
+# next to a stone
+EMPTY = 0
+CODES = {'X': 1, 'O': 2}
+BLOCKED = 3
+CANDIDATE = 4
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+# Exploration constant of UCT
+EXPLORATION = 1.4
+# Moves of a rollout after which the game is scored as a draw
+ROLLOUT_MOVES = 60
+# Playouts between two checks of the deadline
+CHECK_EVERY = 16
+# Score of a playout for the player that made the move of a node, a loss scores 0
+WIN, DRAW = 1.0, 0.5
+
+
+class MCTS:
+    # Measured with tracemalloc (about 170 bytes: one slot in each list of the pool, the children and untried lists,
+    # the score float), rounded up for the longer untried lists of deep trees
+    NODE_SIZE = 250
+    # Part of the manager's max_memory given to the tree, the transposition table has its own share
+    MEMORY_SHARE = 0.25
+    # Used when the manager sends max_memory 0 (no limit)
+    DEFAULT_MEMORY = 64 * 1024 * 1024
+
+    def __init__(self, max_memory: int = 0, exploration: float = EXPLORATION, rollout_moves: int = ROLLOUT_MOVES,
+                 seed: int | None = None):
+        self._exploration = exploration
+        self._rollout_moves = rollout_moves
+        self._random = random.Random(seed)
+        self._capacity = 1
+        self._size = 0
+        self._neighbours: list[tuple] = []
+        self._root_moves: list[tuple] = []
+        self._clear_pool()
+        self.set_max_memory(max_memory)
+        self.playouts = 0
+        self.elapsed = 0.0
+        self.reused = 0
+        self.max_ply = 0
+
+    def set_seed(self, seed: int | None):
+        """
+        :param seed: seed of the expansions and rollouts, None to seed from the system
+        :return: None
+        """
+        self._random.seed(seed)
+
+    def _clear_pool(self):
+        """
+        :return: None, empty the node pool; node 0 is the root
+        """
+        # index of the cell played to reach the node, -1 for the root
+        self._move: list[int] = [-1]
+        # code of the player that made the move of the node
+        self._mover: list[int] = [0]
+        self._parent: list[int] = [-1]
+        self._children: list[list[int] | None] = [None]
+        # cells not expanded yet, None until the node is expanded for the first time
+        self._untried: list[list[int] | None] = [None]
+        self._visits: list[int] = [0]
+        self._score: list[float] = [0.0]
+        # True if the move of the node made a five
+        self._terminal: list[bool] = [False]
+
+    def set_max_memory(self, max_memory: int):
+        """
+        :param max_memory: memory limit of the brain in bytes, as sent by 'INFO max_memory', 0 for no limit
+        :return: None, the tree stops growing when the pool is full and is dropped if it is over its new capacity
+        """
+        budget = int(max_memory * self.MEMORY_SHARE) if max_memory > 0 else self.DEFAULT_MEMORY
+        self._capacity = max(1, budget // self.NODE_SIZE)
+        if self.get_tree_size() > self._capacity:
+            self.reset()
+
+    def get_capacity(self) -> int:
+        """
+        :return: maximum number of nodes of the tree
+        """
+        return self._capacity
+
+    def get_tree_size(self) -> int:
+        """
+        :return: number of nodes of the tree
+        """
+        return len(self._move)
+
+    def reset(self):
+        """
+        :return: None, drop the tree, the next search starts from a new root
+        """
+        self._root_moves = []
+        self._clear_pool()
+
+    def get_stats(self) -> dict:
+        """
+        :return: playouts, time, playouts per second and deepest ply of the last search, size of the tree
+                 and number of nodes kept from the previous search
+        """
+        return {
+            "playouts": self.playouts,
+            "elapsed": self.elapsed,
+            "playouts_per_second": self.playouts / self.elapsed if self.elapsed > 0 else 0.0,
+            "tree_size": self.get_tree_size(),
+            "capacity": self._capacity,
+            "reused": self.reused,
+            "root_visits": self._visits[0],
+            "max_ply": self.max_ply,
+        }
+
+    def _get_neighbours(self, size: int) -> list[tuple]:
+        """
+        :param size: size of the board
+        :return: for every cell, the indexes of the cells around it, built once per board size
+        """
+        if self._size != size:
+            neighbours = []
+            for row in range(size):
+                for col in range(size):
+                    neighbours.append(tuple((row + i) * size + col + j for i in (-1, 0, 1) for j in (-1, 0, 1)
+                                            if (i, j) != (0, 0) and 0 <= row + i < size and 0 <= col + j < size))
+            self._size = size
+            self._neighbours = neighbours
+        return self._neighbours
+
+    def _advance(self, moves: list[tuple]) -> bool:
+        """
+        :param moves: (position, symbol) of every move on the board, in play order
+        :return: True if the tree has been moved down to the node of the current position, else False
+        """
+        root_moves = self._root_moves
+        if len(root_moves) == 0 or len(moves) < len(root_moves) or moves[:len(root_moves)] != root_moves:
+            return False
+        node = 0
+        size = self._size
+        for (row, col), symbol in moves[len(root_moves):]:
+            children = self._children[node]
+            if children is None or symbol not in CODES:
+                return False
+            cell = row * size + col
+            for child in children:
+                if self._move[child] == cell and self._mover[child] == CODES[symbol]:
+                    node = child
+                    break
+            else:
+                return False
+        if node != 0:
+            self._compact(node)
+        return True
+
+    def _compact(self, root: int):
+        """
+        :param root: node that becomes the root
+        :return: None, keep only the subtree of root in the pool, renumbered from 0
+        """
+        old = (self._move, self._mover, self._children, self._untried, self._visits, self._score, self._terminal)
+        self._clear_pool()
+        self._move[0] = old[0][root]
+        self._mover[0] = old[1][root]
+        self._untried[0] = old[3][root]
+        self._visits[0] = old[4][root]
+        self._score[0] = old[5][root]
+        self._terminal[0] = old[6][root]
+        queue = [(root, 0)]
+        for old_node, node in queue:
+            children = old[2][old_node]
+            if children is None:
+                continue
+            self._children[node] = []
+            for old_child in children:
+                child = self._add_node(node, old[0][old_child], old[1][old_child])
+                self._untried[child] = old[3][old_child]
+                self._visits[child] = old[4][old_child]
+                self._score[child] = old[5][old_child]
+                self._terminal[child] = old[6][old_child]
+                queue.append((old_child, child))
+
+    def _add_node(self, parent: int, cell: int, mover: int) -> int:
+        """
+        :return: the index of a new child of parent, reached by mover playing cell
+        """
+        node = len(self._move)
+        self._move.append(cell)
+        self._mover.append(mover)
+        self._parent.append(parent)
+        self._children.append(None)
+        self._untried.append(None)
+        self._visits.append(0)
+        self._score.append(0.0)
+        self._terminal.append(False)
+        self._children[parent].append(node)
+        return node
+
+    def _get_root_cells(self, board) -> tuple(list[int], list[int]):
+        """
+        :param board: current state of the board (Board Class)
+        :return: the code of every cell and the empty cells next to a stone, the center if the board is empty
+        """
+        size = board._board_size
+        cells = [EMPTY] * (size * size)
+        for (row, col), symbol in self._get_moves(board):
+            cells[row * size + col] = CODES.get(symbol, BLOCKED)
+        candidates = [row * size + col for row, col in board.get_frontier(1)]
+        if len(candidates) == 0 and cells[(size // 2) * size + size // 2] == EMPTY:
+            candidates = [(size // 2) * size + size // 2]
+        for cell in candidates:
+            cells[cell] = CANDIDATE
+        return cells, candidates
+
+    @staticmethod
+    def _get_moves(board) -> list[tuple]:
+        """
+        :return: (position, symbol) of the stones of the board, in play order
+        """
+        return [move for move in board.get_moves() if move[1] is not None]
+
+    def _is_five(self, cells: list[int], cell: int, code: int) -> bool:
+        """
+        :return: True if the stone of code on cell is in a line of at least 5 stones of code
+        """
+        size = self._size
+        row, col = divmod(cell, size)
+        for dr, dc in DIRECTIONS:
+            count = 1
+            i, j = row + dr, col + dc
+            while 0 <= i < size and 0 <= j < size and cells[i * size + j] == code:
+                count += 1
+                i, j = i + dr, j + dc
+            i, j = row - dr, col - dc
+            while 0 <= i < size and 0 <= j < size and cells[i * size + j] == code:
+                count += 1
+                i, j = i - dr, j - dc
+            if count >= 5:
+                return True
+        return False
+
+    def search(self, board, symbol: str, deadline: float, max_playouts: int = 0) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class), left unchanged
+        :param symbol: 'X' or 'O', player to move
+        :param deadline: time.perf_counter() value the search must stop at
+        :param max_playouts: stop after this number of playouts, 0 for no limit
+        :return: the most visited move of the root, None if there is no empty cell next to a stone
+        """
+        start = time.perf_counter()
+        size = board._board_size
+        if size != self._size:
+            self.reset()
+        neighbours = self._get_neighbours(size)
+        moves = self._get_moves(board)
+        code = CODES[symbol]
+        if self._advance(moves) and self._mover[0] != code:
+            self.reused = self.get_tree_size() - 1
+        else:
+            self.reset()
+            self.reused = 0
+        self._root_moves = moves
+        root_cells, root_candidates = self._get_root_cells(board)
+        if len(root_candidates) == 0:
+            self.elapsed = time.perf_counter() - start
+            return None
+        # the root is reached by the opponent's move
+        self._mover[0] = 3 - code
+        self.playouts = 0
+        self.max_ply = 0
+        while True:
+            for _ in range(CHECK_EVERY):
+                self._playout(root_cells, root_candidates, neighbours)
+            self.playouts += CHECK_EVERY
+            if time.perf_counter() >= deadline or 0 < max_playouts <= self.playouts:
+                break
+        self.elapsed = time.perf_counter() - start
+        return self.get_best_move()
+
+    def get_best_move(self) -> tuple(int, int) | None:
+        """
+        :return: the most visited move of the root, None if the root has no child
+        """
+        children = self._children[0]
+        if not children:
+            return None
+        best = max(children, key=lambda child: (self._visits[child], self._score[child]))
+        return divmod(self._move[best], self._size)
+
+    def _playout(self, root_cells: list[int], root_candidates: list[int], neighbours: list[tuple]):
+        """
+        :return: None, run one selection, expansion, rollout and backpropagation from the root
+        """
+        cells = root_cells[:]
+        candidates = root_candidates[:]
+        rng = self._random
+        node = 0
+        ply = 0
+        winner = 0
+
+        # selection: down the fully expanded nodes with the best UCT value
+        while not self._terminal[node] and self._untried[node] is not None and len(self._untried[node]) == 0:
+            children = self._children[node]
+            if len(children) == 0:
+                break
+            log_visits = math.log(self._visits[node])
+            exploration = self._exploration
+            visits, score = self._visits, self._score
+            node = max(children, key=lambda child: score[child] / visits[child]
+                       + exploration * math.sqrt(log_visits / visits[child]))
+            self._place(cells, candidates, neighbours, self._move[node], self._mover[node])
+            ply += 1
+        mover = self._mover[node]
+        if self._terminal[node]:
+            winner = mover
+        else:
+            # expansion: one untried cell of the node becomes a child, if the pool has room
+            untried = self._untried[node]
+            if untried is None:
+                untried = [cell for cell in candidates if cells[cell] == CANDIDATE]
+                self._untried[node] = untried
+                self._children[node] = []
+            if len(untried) > 0 and len(self._move) < self._capacity:
+                index = rng.randrange(len(untried))
+                untried[index], untried[-1] = untried[-1], untried[index]
+                cell = untried.pop()
+                mover = 3 - mover
+                node = self._add_node(node, cell, mover)
+                self._place(cells, candidates, neighbours, cell, mover)
+                ply += 1
+                if self._is_five(cells, cell, mover):
+                    self._terminal[node] = True
+                    winner = mover
+            if winner == 0:
+                winner = self._rollout(cells, candidates, neighbours, mover)
+        self.max_ply = max(self.max_ply, ply)
+
+        # backpropagation, from the point of view of the player that made the move of each node
+        visits, score, parent, movers = self._visits, self._score, self._parent, self._mover
+        while node != -1:
+            visits[node] += 1
+            if winner == 0:
+                score[node] += DRAW
+            elif movers[node] == winner:
+                score[node] += WIN
+            node = parent[node]
+
+    @staticmethod
+    def _place(cells: list[int], candidates: list[int], neighbours: list[tuple], cell: int, code: int):
+        """
+        :return: None, put a stone of code on cell and add its empty neighbours to the candidates
+        """
+        cells[cell] = code
+        for other in neighbours[cell]:
+            if cells[other] == EMPTY:
+                cells[other] = CANDIDATE
+                candidates.append(other)
+
+    def _rollout(self, cells: list[int], candidates: list[int], neighbours: list[tuple], mover: int) -> int:
+        """
+        :param mover: code of the player that made the last move
+        :return: code of the winner of a random game among the cells next to a stone, 0 for a draw
+        """
+        randrange = self._random.randrange
+        for _ in range(self._rollout_moves):
+            cell = -1
+            while len(candidates) > 0:
+                index = randrange(len(candidates))
+                cell = candidates[index]
+                candidates[index] = candidates[-1]
+                candidates.pop()
+                if cells[cell] == CANDIDATE:
+                    break
+                cell = -1
+            if cell == -1:
+                return 0
+            mover = 3 - mover
+            self._place(cells, candidates, neighbours, cell, mover)
+            if self._is_five(cells, cell, mover):
+                return mover
+        return 0
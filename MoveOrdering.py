@@ -0,0 +1,123 @@
+# This is a 'MoveOrdering' Class in python for a gomoku game:
+#
+# It sorts candidate moves from the most to the least promising, for the alpha-beta search, the threat-space
+# search and the heuristics of the AI:
+# - the transposition table move first,
+# - then by static threat score (Board.get_cell_score),
+# - ties broken by the killer moves of the ply (the last moves that caused a cutoff at the same distance
+#   from the root), then by the history heuristic (the sum of depth * depth over the cutoffs the move
+#   has caused) and by position.
+# Threat scores span several orders of magnitude, so the killers and the history only rank moves of equal
+# static value: putting them first makes the search slower on the benchmark positions.
+# It also counts the cutoffs and the moves searched per node, to measure how much pruning the ordering buys.
+from __future__ import annotations
+
+# Killer moves kept per ply
+KILLER_SLOTS = 2
+
+
+class MoveOrdering:
+    def __init__(self, history: bool = True, killers: bool = True):
+        self._use_history = history
+        self._use_killers = killers
+        self._history = {'X': {}, 'O': {}}
+        self._killers: list[list[tuple(int, int)]] = []
+        self.nodes = 0
+        self.moves_searched = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def new_search(self):
+        """
+        :return: None, forget the killer moves, age the history and reset the statistics before a new search
+        """
+        self._killers = []
+        for table in self._history.values():
+            for move in list(table):
+                table[move] //= 2
+                if table[move] == 0:
+                    del table[move]
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        :return: None, reset the node and cutoff counters
+        """
+        self.nodes = 0
+        self.moves_searched = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def get_stats(self) -> dict:
+        """
+        :return: searched nodes, cutoffs, rate of cutoffs made by the first move and average number of moves searched
+        """
+        return {
+            "nodes": self.nodes,
+            "cutoffs": self.cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoffs / self.cutoffs if self.cutoffs > 0 else 0.0,
+            "branching_factor": self.moves_searched / self.nodes if self.nodes > 0 else 0.0,
+        }
+
+    def get_killers(self, ply: int) -> list[tuple(int, int)]:
+        """
+        :param ply: distance to the root
+        :return: the killer moves of the ply, the most recent first
+        """
+        return self._killers[ply] if ply < len(self._killers) else []
+
+    def get_history(self, symbol: str | None, move: tuple(int, int)) -> int:
+        """
+        :param symbol: player of the move
+        :param move: position on the board (x, y)
+        :return: history score of the move
+        """
+        return self._history.get(symbol, {}).get(move, 0)
+
+    def order(self, board, symbol: str | None, moves, tt_move: tuple(int, int) | None = None,
+              ply: int | None = None) -> list[tuple(int, int)]:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: player to move
+        :param moves: candidate moves
+        :param tt_move: move to try first, e.g. from the transposition table
+        :param ply: distance to the root for the killer moves, None to ignore them
+        :return: the moves sorted from the most to the least promising
+        """
+        killers = self.get_killers(ply) if self._use_killers and ply is not None else []
+        history = self._history.get(symbol, {}) if self._use_history else {}
+        return sorted(moves, key=lambda move: (move != tt_move, -board.get_cell_score(move, symbol),
+                                               move not in killers, -history.get(move, 0), move))
+
+    def record_node(self, moves_searched: int, cutoff_index: int | None):
+        """
+        :param moves_searched: number of moves searched at the node
+        :param cutoff_index: index of the move that caused a cutoff, None if there was none
+        :return: None
+        """
+        self.nodes += 1
+        self.moves_searched += moves_searched
+        if cutoff_index is not None:
+            self.cutoffs += 1
+            if cutoff_index == 0:
+                self.first_move_cutoffs += 1
+
+    def record_cutoff(self, symbol: str | None, move: tuple(int, int), depth: int, ply: int):
+        """
+        :param symbol: player of the move
+        :param move: move that caused the cutoff
+        :param depth: remaining depth of the node
+        :param ply: distance of the node to the root
+        :return: None, update the history and the killer moves of the ply
+        """
+        if self._use_history and symbol in self._history:
+            table = self._history[symbol]
+            table[move] = table.get(move, 0) + depth * depth
+        if self._use_killers:
+            while len(self._killers) <= ply:
+                self._killers.append([])
+            killers = self._killers[ply]
+            if move in killers:
+                killers.remove(move)
+            killers.insert(0, move)
+            del killers[KILLER_SLOTS:]
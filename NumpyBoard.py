@@ -0,0 +1,188 @@
+# This is a 'NumpyBoard' Class in python for a gomoku game:
+#
+# Same public API as 'Board', but the stones are also kept in an int8 numpy array (0 empty, 1 'X', 2 'O', 3 other).
+# The line windows of the four directions are strided views of that array, so the whole-board scans
+# (five in a row, empty cells, full board, winning / threat / candidate cells) are a few vectorized operations.
+# numpy is optional: HAS_NUMPY is False when it is not installed and backends.get_board_class falls back to 'Board'
+# without importing this module.
+from __future__ import annotations
+
+from Board import Board
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Directions as (row step, col step), in the same order as ThreatIndex.DIRECTIONS
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+CODES = {'X': 1, 'O': 2}
+OTHER_CODE = 3
+# Candidate cells are the empty cells at most CANDIDATE_RADIUS cells away from a stone, as in Search
+CANDIDATE_RADIUS = 2
+
+
+def line_windows(cells, direction: int, length: int):
+    """
+    :param cells: board_size x board_size array
+    :param direction: index in DIRECTIONS
+    :param length: number of cells of the windows
+    :return: an array of shape (length, rows, cols), [k, i, j] being the k-th cell of the window starting at (i, j),
+             with i counted from length - 1 for the anti-diagonal direction
+    """
+    size = cells.shape[0]
+    count = size - length + 1
+    if count <= 0:
+        return np.zeros((length, 0, 0), dtype=cells.dtype)
+    dr, dc = DIRECTIONS[direction]
+    views = []
+    for k in range(length):
+        if dr == 1:
+            rows = slice(k, k + count)
+        elif dr == -1:
+            rows = slice(length - 1 - k, size - k)
+        else:
+            rows = slice(0, size)
+        cols = slice(k, k + count) if dc == 1 else slice(0, size)
+        views.append(cells[rows, cols])
+    return np.stack(views)
+
+
+def window_start(direction: int, length: int, i: int, j: int) -> tuple(int, int):
+    """
+    :return: the position (x, y) of the first cell of the window [i, j] returned by line_windows
+    """
+    return (i + length - 1, j) if DIRECTIONS[direction][0] == -1 else (i, j)
+
+
+class NumpyBoard(Board):
+    def __init__(self, board_size):
+        if not HAS_NUMPY:
+            raise ImportError("NumpyBoard needs numpy")
+        self._cells = np.zeros((board_size, board_size), dtype=np.int8)
+        super().__init__(board_size)
+
+    def get_cells(self):
+        """
+        :return: the int8 array of the board, 0 for empty, 1 for 'X', 2 for 'O' and 3 for other symbols
+        """
+        return self._cells
+
+    def update_board(self, symbol: str | None, position: tuple(int, int)):
+        """
+        :param symbol: 'X' 'O' or None
+        :param position: position on the board (x, y)
+        :return: True if the move has been played, else False
+        """
+        if not super().update_board(symbol, position):
+            return False
+        if symbol is not None:
+            self._cells[position[0], position[1]] = CODES.get(symbol, OTHER_CODE)
+        return True
+
+    def load_stones(self, stones: list[tuple(tuple(int, int), str)]) -> list[tuple(tuple(int, int), str)]:
+        """
+        :param stones: (position, symbol) of the stones, in play order
+        :return: the stones that have not been played, see Board.load_stones
+        """
+        start = len(self._moves)
+        rejected = super().load_stones(stones)
+        moves = self._moves[start:]
+        if len(moves) > 0:
+            rows = [move[0][0] for move in moves]
+            cols = [move[0][1] for move in moves]
+            self._cells[rows, cols] = [CODES.get(move[1], OTHER_CODE) for move in moves]
+        return rejected
+
+    def pop(self) -> tuple(int, int) | None:
+        """
+        :return: undo the last move played and return its position, None if no move has been played
+        """
+        position = super().pop()
+        if position is not None:
+            self._cells[position[0], position[1]] = 0
+        return position
+
+    def reset_board(self):
+        """
+        :return: reset the board to all None
+        """
+        super().reset_board()
+        self._cells = np.zeros((self._board_size, self._board_size), dtype=np.int8)
+
+    def check_winner(self, symbol: str | None) -> bool:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: True if the player that played the symbol have won, else False
+        """
+        if symbol not in CODES:
+            return super().check_winner(symbol)
+        mine = self._cells == CODES[symbol]
+        return any(bool(line_windows(mine, direction, 5).all(axis=0).any()) for direction in range(4))
+
+    def get_empty_positions(self) -> list[(int, int)]:
+        """
+        :return: return a list of tuples with all the empty positions on the board
+        """
+        rows, cols = np.nonzero(self._cells == 0)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def _pattern_cells(self, mine, empty, direction: int, length: int) -> list[tuple(int, int)]:
+        """
+        :param mine: boolean array of the stones of the player
+        :param empty: boolean array of the empty cells
+        :param direction: index in DIRECTIONS
+        :param length: 5 for the windows with 4 stones and one empty cell, 6 for the threats of three
+        :return: the empty cell completing each matching window, in the order of the windows
+        """
+        cells_mine = line_windows(mine, direction, length)
+        cells_empty = line_windows(empty, direction, length)
+        if length == 5:
+            found = (cells_mine.sum(axis=0) == 4) & (cells_empty.sum(axis=0) == 1)
+            slots = cells_empty.argmax(axis=0)
+        else:
+            found = cells_empty[0] & cells_empty[5] & (cells_mine[1:5].sum(axis=0) == 3) \
+                & (cells_empty[1:5].sum(axis=0) == 1)
+            slots = 1 + cells_empty[1:5].argmax(axis=0)
+        dr, dc = DIRECTIONS[direction]
+        res = []
+        for i, j in zip(*np.nonzero(found)):
+            row, col = window_start(direction, length, int(i), int(j))
+            slot = int(slots[i, j])
+            res.append((row + slot * dr, col + slot * dc))
+        return res
+
+    def get_pattern_masks(self, symbol: str) -> tuple:
+        """
+        :param symbol: 'X' or 'O'
+        :return: (win, threat, candidate) boolean board_size x board_size arrays: the empty cells making five in a row
+                 for symbol, the empty cells completing a threat of three of symbol and the empty cells at most
+                 CANDIDATE_RADIUS cells away from a stone
+        """
+        size = self._board_size
+        empty = self._cells == 0
+        mine = self._cells == CODES[symbol]
+        win = np.zeros((size, size), dtype=bool)
+        threat = np.zeros((size, size), dtype=bool)
+        for direction in range(4):
+            for length, mask in ((5, win), (6, threat)):
+                for row, col in self._pattern_cells(mine, empty, direction, length):
+                    mask[row, col] = True
+        occupied = np.pad(~empty, CANDIDATE_RADIUS)
+        near = np.zeros((size, size), dtype=bool)
+        for i in range(2 * CANDIDATE_RADIUS + 1):
+            for j in range(2 * CANDIDATE_RADIUS + 1):
+                near |= occupied[i:i + size, j:j + size]
+        return win, threat, near & empty
+
+    def scan_threats_of_three(self, symbol: str) -> list[tuple(int, int)]:
+        """
+        :param symbol: 'X' or 'O'
+        :return: the cell completing each threat of three of symbol, in the order Board.block_threat_of_three
+                 returns them, computed from the array instead of the threat index
+        """
+        empty = self._cells == 0
+        mine = self._cells == CODES[symbol]
+        return [cell for direction in range(4) for cell in self._pattern_cells(mine, empty, direction, 6)]
@@ -0,0 +1,148 @@
+# This is an 'OpeningBook' Class in python for a gomoku game:
+#
+# The book is a binary file: a header (magic, version, number of entries) followed by fixed-size entries
+# (canonical position hash, row, column, weight) sorted by hash. Hashes are symmetry-reduced with 'Symmetry',
+# rows and columns are in the canonical coordinates, and the side to move is part of the hash.
+# The file is memory-mapped on the first lookup and searched by bisection, so opening it costs nothing
+# at startup and a lookup reads O(log n) entries. Books are written by build_book.py.
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+
+import Zobrist
+
+# Name of the book in the folder sent by the manager with INFO folder
+BOOK_FILE = "book.bin"
+MAGIC = b"GMKB"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+# canonical hash, row and column of the move in canonical coordinates, weight of the move
+ENTRY = struct.Struct("<QBBH")
+MAX_WEIGHT = 0xFFFF
+
+
+def book_key(board, symbol: str | None) -> tuple(int, int):
+    """
+    :param board: current state of the board (Board Class)
+    :param symbol: player to move
+    :return: (canonical hash of the position with symbol to move, symmetry moving the board to its canonical form)
+    """
+    position_hash, symmetry = board.get_canonical_hash()
+    return position_hash ^ Zobrist.get_query_key("book", symbol), symmetry
+
+
+def write_book(path: str, entries: dict):
+    """
+    :param path: file to write
+    :param entries: canonical hash -> (row, column, weight) of the move in canonical coordinates
+    :return: None
+    """
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(entries)))
+        for key in sorted(entries):
+            row, col, weight = entries[key]
+            file.write(ENTRY.pack(key, row, col, max(0, min(MAX_WEIGHT, weight))))
+
+
+class OpeningBook:
+    def __init__(self, path: str):
+        self._path = path
+        self._loaded = False
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self) -> str:
+        """
+        :return: path of the book file
+        """
+        return self._path
+
+    def __len__(self) -> int:
+        self._load()
+        return self._count
+
+    def _load(self):
+        """
+        :return: None, map the file on the first call, a missing or invalid file gives an empty book
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            self._file = open(self._path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self.close()
+            return
+        if len(self._map) < HEADER.size:
+            self.close()
+            return
+        magic, version, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or len(self._map) < HEADER.size + count * ENTRY.size:
+            self.close()
+            return
+        self._count = count
+
+    def close(self):
+        """
+        :return: None, unmap and close the file
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+
+    def find(self, key: int) -> tuple(int, int, int) | None:
+        """
+        :param key: canonical hash returned by book_key
+        :return: (row, column, weight) of the book move in canonical coordinates, None if the key is not in the book
+        """
+        self._load()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry = ENTRY.unpack_from(self._map, HEADER.size + middle * ENTRY.size)
+            if entry[0] < key:
+                low = middle + 1
+            elif entry[0] > key:
+                high = middle
+            else:
+                return entry[1], entry[2], entry[3]
+        return None
+
+    def lookup(self, board, symbol: str | None) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: player to move
+        :return: the book move for this position, None if it is not in the book or the move is not playable
+        """
+        self._load()
+        if self._count == 0:
+            return None
+        key, symmetry = book_key(board, symbol)
+        entry = self.find(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        move = board.from_canonical((entry[0], entry[1]), symmetry)
+        if not board.is_valid_move(move):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return move
+
+
+def get_book_path(folder: str) -> str:
+    """
+    :param folder: folder sent by the manager with INFO folder
+    :return: path of the opening book in this folder
+    """
+    return os.path.join(folder, BOOK_FILE)
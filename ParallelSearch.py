@@ -0,0 +1,169 @@
+# This is a 'ParallelSearch' Class in python for a gomoku game:
+#
+# Root splitting over a multiprocessing pool: the root candidates are ordered once, dealt round-robin
+# to the workers, and every worker runs the iterative-deepening search on its share until the deadline.
+# The pool is created once and reused for every move; boards travel as Board.serialize() bytes.
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+
+import Board
+from Evaluator import Evaluator
+from Search import Search, WIN_SCORE, MAX_DEPTH
+from TranspositionTable import TranspositionTable
+
+# Memory of one worker process: interpreter, board indexes and its transposition table
+WORKER_MEMORY = 20 * 1024 * 1024
+# Seconds given to the pool to send back the results after the deadline
+RESULT_GRACE = 0.5
+
+# Search of the current worker process, kept between tasks so its transposition table is reused
+_worker_search: Search | None = None
+# Evaluator of the current worker process, created by the first task scoring the leaves with it
+_worker_evaluator: Evaluator | None = None
+
+
+def _search_root_moves(task: tuple) -> tuple:
+    """
+    :param task: (serialized board, symbol, root moves, deadline as time.time(), max depth, evaluate leaves)
+    :return: (list of (depth, score, move) of the completed depths, number of nodes)
+    """
+    global _worker_search, _worker_evaluator
+    data, symbol, moves, deadline, max_depth, evaluate_leaves = task
+    if _worker_search is None:
+        _worker_search = Search(TranspositionTable(WORKER_MEMORY))
+    if evaluate_leaves and _worker_evaluator is None:
+        _worker_evaluator = Evaluator()
+    _worker_search.set_evaluator(_worker_evaluator if evaluate_leaves else None)
+    board = Board.Board.deserialize(data)
+    local_deadline = time.perf_counter() + (deadline - time.time())
+    _worker_search.search(board, symbol, local_deadline, max_depth, moves)
+    return _worker_search.history, _worker_search.nodes
+
+
+def get_max_workers(max_memory: int) -> int:
+    """
+    :param max_memory: memory limit sent by the manager in bytes, 0 for no limit
+    :return: the number of workers the machine and the memory limit allow, the main process included
+    """
+    workers = os.cpu_count() or 1
+    if max_memory > 0:
+        workers = min(workers, max_memory // WORKER_MEMORY - 1)
+    return max(1, workers)
+
+
+class ParallelSearch:
+    def __init__(self, workers: int = 1, evaluate_leaves: bool = False):
+        self._workers = max(1, workers)
+        self._evaluate_leaves = evaluate_leaves
+        self._pool = None
+        self._search = Search()
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.elapsed = 0.0
+
+    def get_workers(self) -> int:
+        """
+        :return: number of worker processes
+        """
+        return self._workers
+
+    def set_workers(self, workers: int):
+        """
+        :param workers: number of worker processes, the running pool is stopped if it changes
+        :return: None
+        """
+        workers = max(1, workers)
+        if workers != self._workers:
+            self.stop()
+            self._workers = workers
+
+    def set_leaf_evaluation(self, evaluate_leaves: bool):
+        """
+        :param evaluate_leaves: True for the workers to score the leaves with an Evaluator, from the next search
+        :return: None
+        """
+        self._evaluate_leaves = evaluate_leaves
+
+    def start(self):
+        """
+        :return: None, create the pool if it is not running
+        """
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self._workers)
+
+    def stop(self):
+        """
+        :return: None, stop the pool and its processes
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def get_stats(self) -> dict:
+        """
+        :return: nodes of all the workers, completed depth, score and time of the last search
+        """
+        return {
+            "workers": self._workers,
+            "nodes": self.nodes,
+            "depth": self.depth,
+            "score": self.score,
+            "elapsed": self.elapsed,
+            "nps": self.nodes / self.elapsed if self.elapsed > 0 else 0.0,
+        }
+
+    def search(self, board: Board, symbol: str, deadline: float, max_depth: int = MAX_DEPTH) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class), left unchanged
+        :param symbol: player to move
+        :param deadline: time.perf_counter() value at which the search must stop
+        :param max_depth: maximum depth in plies
+        :return: the best move of the deepest depth every worker has completed
+        """
+        start = time.perf_counter()
+        self.nodes = 0
+        self.depth = 0
+        moves = self._search.get_candidates(board, symbol)
+        if len(moves) <= 1:
+            return moves[0] if len(moves) == 1 else None
+        moves = self._search.order_moves(board, symbol, moves, None)
+        self.start()
+        shares = [moves[i::self._workers] for i in range(self._workers) if i < len(moves)]
+        wall_deadline = time.time() + (deadline - start)
+        tasks = [(board.serialize(), symbol, share, wall_deadline, max_depth, self._evaluate_leaves)
+                 for share in shares]
+        try:
+            results = self._pool.map_async(_search_root_moves, tasks).get(max(0.0, deadline - start) + RESULT_GRACE)
+        except multiprocessing.TimeoutError:
+            self.stop()
+            self.elapsed = time.perf_counter() - start
+            return moves[0]
+        self.nodes = sum(nodes for _, nodes in results)
+        best_move = self._pick(results)
+        self.elapsed = time.perf_counter() - start
+        return best_move if best_move is not None else moves[0]
+
+    def _pick(self, results: list) -> tuple(int, int) | None:
+        """
+        :param results: (history, nodes) of every worker
+        :return: a proven win if a worker found one, else the best move at the deepest depth completed by all workers
+        """
+        histories = [history for history, _ in results]
+        for history in histories:
+            if len(history) > 0 and history[-1][1] >= WIN_SCORE - MAX_DEPTH:
+                self.depth, self.score = history[-1][0], history[-1][1]
+                return history[-1][2]
+        finished = [history for history in histories if len(history) > 0 and history[-1][1] > -WIN_SCORE + MAX_DEPTH]
+        if len(finished) == 0:
+            finished = [history for history in histories if len(history) > 0]
+        if len(finished) == 0:
+            return None
+        depth = min(history[-1][0] for history in finished)
+        best = max((history[depth - 1] for history in finished), key=lambda entry: entry[1])
+        self.depth, self.score = best[0], best[1]
+        return best[2]
@@ -0,0 +1,125 @@
+# This is a 'Ponder' Class in python for a gomoku game:
+#
+# Pondering: once the AI has played, a background thread predicts the opponent's reply (the transposition
+# table move of the position, else a shallow search) and searches the AI's answer to it until it is stopped.
+# The thread works on its own copy of the board and shares the transposition table of the AI, so when the
+# prediction hits, the search of the next turn finds the pondered depths in the table.
+# The thread never prints, and stop() interrupts its search within one node, so the protocol is not disturbed:
+# the input parser stops it as soon as a new command line has been read.
+from __future__ import annotations
+
+import threading
+import time
+
+import Zobrist
+from Evaluator import Evaluator
+from MoveOrdering import MoveOrdering
+from Search import Search
+from TranspositionTable import TranspositionTable
+
+# Depth and seconds of the search predicting the opponent's reply when the transposition table has no move
+PREDICT_DEPTH = 2
+PREDICT_TIME = 0.2
+
+
+class Ponder:
+    def __init__(self, tt: TranspositionTable, evaluate_leaves: bool = False):
+        self._tt = tt
+        self._evaluate_leaves = evaluate_leaves
+        self._search: Search | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+        self._predicted_hash: int | None = None
+        self.predicted_move: tuple(int, int) | None = None
+        self.predictions = 0
+        self.hits = 0
+        self.depth = 0
+        self.nodes = 0
+
+    def get_stats(self) -> dict:
+        """
+        :return: number of predictions and of hits, depth and nodes of the last ponder search
+        """
+        return {
+            "predictions": self.predictions,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.predictions if self.predictions > 0 else 0.0,
+            "depth": self.depth,
+            "nodes": self.nodes,
+        }
+
+    def set_leaf_evaluation(self, evaluate_leaves: bool):
+        """
+        :param evaluate_leaves: True to score the leaves with an Evaluator like the search of the AI, from the next
+                                start
+        :return: None
+        """
+        self._evaluate_leaves = evaluate_leaves
+
+    def is_running(self) -> bool:
+        """
+        :return: True if the ponder thread is searching
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, board, symbol: str):
+        """
+        :param board: current state of the board (Board Class), with the opponent to move; it is copied
+        :param symbol: symbol of the AI
+        :return: None, start pondering in the background
+        """
+        self.stop()
+        self._stopped = False
+        self._predicted_hash = None
+        self.predicted_move = None
+        # its own evaluator: it follows the copy of the board of the thread, with the same scores as the AI's
+        evaluator = Evaluator() if self._evaluate_leaves else None
+        self._search = Search(self._tt, ordering=MoveOrdering(), evaluator=evaluator)
+        self._thread = threading.Thread(target=self._run, args=(type(board), board.serialize(), symbol), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        :return: None, interrupt the ponder search and wait for the thread to end
+        """
+        self._stopped = True
+        if self._search is not None:
+            self._search.stop()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check_hit(self, board) -> bool:
+        """
+        :param board: state of the board at the start of the AI's turn
+        :return: True if the opponent played the predicted move, the pondered search is then in the transposition table
+        """
+        if self._predicted_hash is None:
+            return False
+        hit = board.get_hash() == self._predicted_hash
+        if hit:
+            self.hits += 1
+        self._predicted_hash = None
+        return hit
+
+    def _run(self, board_class: type, data: bytes, symbol: str):
+        """
+        :param board_class: class of the board to rebuild
+        :param data: board serialized with Board.serialize
+        :param symbol: symbol of the AI
+        :return: None, predict the opponent's reply then search the AI's answer until stopped
+        """
+        board = board_class.deserialize(data)
+        opponent = 'O' if symbol == 'X' else 'X'
+        entry = self._tt.get(board.get_hash() ^ Zobrist.get_query_key("search", opponent))
+        predicted = entry[2] if entry is not None else None
+        if not board.is_valid_move(predicted):
+            predicted = self._search.search(board, opponent, time.perf_counter() + PREDICT_TIME, PREDICT_DEPTH)
+        if self._stopped or not board.update_board(opponent, predicted):
+            return
+        self.predicted_move = predicted
+        self._predicted_hash = board.get_hash()
+        self.predictions += 1
+        self._search.search(board, symbol, float("inf"))
+        self.depth = self._search.depth
+        self.nodes = self._search.nodes
@@ -0,0 +1,149 @@
+# This is a 'Profiler' Class in python for a gomoku game:
+#
+# It records, for every stage of Ai.play_best_move, the wall time, the number of candidate cells tried
+# (Board.trial calls) and the number of board copies, and appends one JSON line per turn to a file.
+# Lines carry the process id and the time so the files of a whole tournament can be concatenated and
+# aggregated with 'python3 Profiler.py FILE...'.
+# The AI only holds a profiler when profiling is enabled, so a disabled profiler costs one None check per stage.
+# json is only imported when a turn is written or aggregated, so importing the module costs nothing at startup.
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+# Environment variable naming the file the profiles are appended to
+PROFILE_ENV = "GOMOKU_PROFILE"
+# Name of the profile file in the folder sent with INFO folder
+PROFILE_FILE = "profile.jsonl"
+
+
+def get_profile_path(folder: str | None = None) -> str | None:
+    """
+    :param folder: folder sent by the manager with INFO folder, None if there is none
+    :return: the file named by GOMOKU_PROFILE if it is set, else PROFILE_FILE in folder, else None
+    """
+    path = os.environ.get(PROFILE_ENV)
+    if path:
+        return path
+    if folder:
+        return os.path.join(folder, PROFILE_FILE)
+    return None
+
+
+class Profiler:
+    def __init__(self, path: str):
+        self._path = path
+        self._turn = 0
+        self._stages: list[dict] = []
+        self._stats: dict | None = None
+        self._start = 0.0
+
+    def get_path(self) -> str:
+        """
+        :return: path of the file the profiles are appended to
+        """
+        return self._path
+
+    def begin_turn(self):
+        """
+        :return: None, start the profile of a new turn
+        """
+        self._turn += 1
+        self._stages = []
+        self._stats = None
+        self._start = time.perf_counter()
+
+    def run_stage(self, name: str, board, compute):
+        """
+        :param name: name of the stage
+        :param board: current state of the board (Board Class)
+        :param compute: function of the stage, called without arguments
+        :return: the result of compute, the stage is recorded with its time, trials and copies
+        """
+        trials, copies = board.get_trial_count(), board.get_copy_count()
+        start = time.perf_counter()
+        result = compute()
+        self._stages.append({
+            "stage": name,
+            "elapsed": time.perf_counter() - start,
+            "candidates": board.get_trial_count() - trials,
+            "copies": board.get_copy_count() - copies,
+        })
+        return result
+
+    def set_stats(self, stats: dict):
+        """
+        :param stats: statistics of the search of the turn, e.g. MCTS.get_stats()
+        :return: None, the statistics are written with the profile of the turn
+        """
+        self._stats = stats
+
+    def end_turn(self, board, symbol: str | None, mode: str, move: tuple(int, int) | None):
+        """
+        :param board: state of the board after the move
+        :param symbol: symbol of the AI
+        :param mode: move selection mode of the AI
+        :param move: move played, the last stage recorded is the one that picked it
+        :return: None, append the profile of the turn to the file
+        """
+        record = {
+            "pid": os.getpid(),
+            "time": time.time(),
+            "turn": self._turn,
+            "size": board._board_size,
+            "stones": len(board.get_played_positions()),
+            "symbol": symbol,
+            "mode": mode,
+            "move": move,
+            "picked": self._stages[-1]["stage"] if len(self._stages) > 0 else None,
+            "elapsed": time.perf_counter() - self._start,
+            "stages": self._stages,
+        }
+        if self._stats is not None:
+            record["stats"] = self._stats
+        import json
+        try:
+            with open(self._path, "a") as file:
+                file.write(json.dumps(record) + "\n")
+        except OSError:
+            pass
+
+
+def aggregate(lines) -> dict:
+    """
+    :param lines: JSON lines written by Profiler.end_turn
+    :return: per stage: number of runs, number of moves picked, total time, candidates and copies
+    """
+    import json
+    stages: dict = {}
+    for line in lines:
+        if line.strip() == "":
+            continue
+        record = json.loads(line)
+        for stage in record["stages"]:
+            total = stages.setdefault(stage["stage"], {"runs": 0, "picked": 0, "elapsed": 0.0,
+                                                       "candidates": 0, "copies": 0})
+            total["runs"] += 1
+            total["elapsed"] += stage["elapsed"]
+            total["candidates"] += stage["candidates"]
+            total["copies"] += stage["copies"]
+        if record["picked"] in stages:
+            stages[record["picked"]]["picked"] += 1
+    return stages
+
+
+def main(paths: list[str]) -> int:
+    lines = []
+    for path in paths:
+        with open(path) as file:
+            lines.extend(file.readlines())
+    print(f"{'stage':>24} {'runs':>7} {'picked':>7} {'total ms':>10} {'mean ms':>9} {'candidates':>11} {'copies':>7}")
+    for name, total in sorted(aggregate(lines).items(), key=lambda item: -item[1]["elapsed"]):
+        print(f"{name:>24} {total['runs']:>7} {total['picked']:>7} {total['elapsed'] * 1e3:>10.1f}"
+              f" {total['elapsed'] * 1e3 / total['runs']:>9.2f} {total['candidates']:>11} {total['copies']:>7}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,158 @@
+# Reading and writing of the piskvork 'pbrain' protocol for the 'InputParser':
+#
+# Commands are read from a buffered line reader and split on spaces and commas. A BOARD command is returned
+# with all the stone lines of its block up to DONE, so the parser handles the block in one pass: parse_stones splits
+# it and Board.load_stones plays every stone at once.
+# CommandBuffer keeps the lines of an unfinished block: the same buffer is fed by a blocking stream (read) and by an
+# asyncio StreamReader (read_async), so the synchronous loop and the event loop parse commands the same way.
+# Output collects the replies of a command and writes them with a single write and flush.
+from __future__ import annotations
+
+import sys
+
+# command -> line ending its block
+BLOCK_COMMANDS = {
+    "board": "DONE",
+}
+
+
+def parse_line(line: str) -> tuple(str, list[str]):
+    """
+    :param line: line sent by the manager
+    :return: (command in lower case, arguments), ('', []) for a blank line
+    """
+    words = line.replace(',', ' ').split()
+    if len(words) == 0:
+        return "", []
+    return words[0].lower(), words[1:]
+
+
+def parse_stones(lines: list[str]) -> tuple(list[tuple(int, int, int)], list[str]):
+    """
+    :param lines: lines of a BOARD block, "x,y,player"
+    :return: (x, y, player) of every well-formed line, and the malformed lines
+    """
+    stones = []
+    malformed = []
+    for line in lines:
+        fields = line.split(",")
+        try:
+            if len(fields) != 3:
+                raise ValueError(line)
+            stones.append((int(fields[0]), int(fields[1]), int(fields[2])))
+        except ValueError:
+            malformed.append(line)
+    return stones, malformed
+
+
+class CommandBuffer:
+    def __init__(self):
+        # (command, arguments, lines) of a block command waiting for its end line
+        self._pending: tuple(str, list[str], list[str]) | None = None
+
+    def push(self, line: str) -> tuple(str, list[str], list[str]) | None:
+        """
+        :param line: next line read from the manager
+        :return: (command, arguments, lines of its block) once the command is complete, else None;
+                 blank lines outside of a block are skipped
+        """
+        line = line.strip()
+        if self._pending is not None:
+            name, arguments, block = self._pending
+            if line.upper() == BLOCK_COMMANDS[name]:
+                self._pending = None
+                return name, arguments, block
+            block.append(line)
+            return None
+        name, arguments = parse_line(line)
+        if name == "":
+            return None
+        if name in BLOCK_COMMANDS:
+            self._pending = (name, arguments, [])
+            return None
+        return name, arguments, []
+
+
+class CommandReader:
+    def __init__(self, stream=None):
+        """
+        :param stream: text stream the commands are read from, None for sys.stdin
+        """
+        self._stream = stream
+        self._buffer = CommandBuffer()
+        self.lines = 0
+        self.commands = 0
+
+    def is_open(self) -> bool:
+        """
+        :return: False if the input stream has been closed
+        """
+        return not (self._stream if self._stream is not None else sys.stdin).closed
+
+    def read(self) -> tuple(str, list[str], list[str]) | None:
+        """
+        :return: the next complete command (command, arguments, lines of its block), None at the end of the input
+        """
+        stream = self._stream if self._stream is not None else sys.stdin
+        readline = stream.readline
+        while True:
+            line = readline()
+            if line == "":
+                return None
+            command = self._push(line)
+            if command is not None:
+                return command
+
+    async def read_async(self, reader) -> tuple(str, list[str], list[str]) | None:
+        """
+        :param reader: asyncio.StreamReader of the manager's input
+        :return: the next complete command, None at the end of the input
+        """
+        while True:
+            line = await reader.readline()
+            if line == b"":
+                return None
+            command = self._push(line.decode())
+            if command is not None:
+                return command
+
+    def _push(self, line: str) -> tuple(str, list[str], list[str]) | None:
+        self.lines += 1
+        command = self._buffer.push(line)
+        if command is not None:
+            self.commands += 1
+        return command
+
+
+class Output:
+    def __init__(self, stream=None):
+        """
+        :param stream: text stream the replies are written to, None for sys.stdout
+        """
+        self._stream = stream
+        self._lines: list[str] = []
+        self.flushes = 0
+
+    def is_open(self) -> bool:
+        """
+        :return: False if the output stream has been closed
+        """
+        return not (self._stream if self._stream is not None else sys.stdout).closed
+
+    def write(self, *values, sep: str = ' '):
+        """
+        :return: None, add a reply line, written by the next flush
+        """
+        self._lines.append(sep.join(map(str, values)))
+
+    def flush(self):
+        """
+        :return: None, write the pending replies at once and flush the stream, nothing if there are none
+        """
+        if len(self._lines) == 0:
+            return
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write("\n".join(self._lines) + "\n")
+        stream.flush()
+        self._lines = []
+        self.flushes += 1
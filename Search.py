@@ -0,0 +1,242 @@
+# This is a 'Search' Class in python for a gomoku game:
+#
+# Iterative-deepening negamax with alpha-beta pruning over the empty cells around the stones.
+# Each depth is searched until the deadline; the move returned is always the best one of the
+# last depth that has been completed, so the search can be stopped at any time.
+from __future__ import annotations
+
+import time
+
+import Zobrist
+from Board import FRONTIER_DISTANCE
+from Evaluator import Evaluator
+from MoveOrdering import MoveOrdering
+from TranspositionTable import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+WIN_SCORE = 1000000
+MAX_DEPTH = 32
+# Candidate cells are the empty cells at most RADIUS cells away from a stone
+RADIUS = 2
+# Number of candidates searched below the root, the best ones by static cell score
+MAX_BRANCHING = 12
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class Search:
+    def __init__(self, tt: TranspositionTable | None = None, radius: int = RADIUS, max_branching: int = MAX_BRANCHING,
+                 ordering: MoveOrdering | None = None, evaluator: Evaluator | None = None):
+        self._tt = tt if tt is not None else TranspositionTable()
+        self._ordering = ordering if ordering is not None else MoveOrdering()
+        self._evaluator = evaluator
+        self._radius = radius
+        self._max_branching = max_branching
+        self._deadline = 0.0
+        self._stopped = False
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.elapsed = 0.0
+        self.history: list[tuple] = []
+
+    def stop(self):
+        """
+        :return: None, make the running search stop at its next node, and every later search stop at once
+        """
+        self._stopped = True
+        self._deadline = 0.0
+
+    def set_evaluator(self, evaluator: Evaluator | None):
+        """
+        :param evaluator: evaluator scoring the leaves, None for the line scores of the threat index
+        :return: None, the transposition table is cleared if the leaf score changes, its scores are on the other scale
+        """
+        if evaluator is not self._evaluator:
+            self._evaluator = evaluator
+            self._tt.clear()
+
+    def get_move_ordering(self) -> MoveOrdering:
+        """
+        :return: the move ordering of the search, with its history and killer moves
+        """
+        return self._ordering
+
+    def get_stats(self) -> dict:
+        """
+        :return: nodes, completed depth, score and time of the last search, and the cutoff statistics of its ordering
+        """
+        ordering = self._ordering.get_stats()
+        return {
+            "nodes": self.nodes,
+            "depth": self.depth,
+            "score": self.score,
+            "elapsed": self.elapsed,
+            "nps": self.nodes / self.elapsed if self.elapsed > 0 else 0.0,
+            "cutoffs": ordering["cutoffs"],
+            "first_move_cutoff_rate": ordering["first_move_cutoff_rate"],
+            "branching_factor": ordering["branching_factor"],
+        }
+
+    def get_candidates(self, board, symbol: str) -> list[tuple(int, int)]:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: player to move
+        :return: the winning move if there is one, else the cells blocking the opponent's fives if there are some,
+                 else every empty cell close to a stone
+        """
+        wins = board.get_winning_positions(symbol)
+        if len(wins) > 0:
+            return [min(wins)]
+        blocks = board.get_winning_positions('O' if symbol == 'X' else 'X')
+        if len(blocks) > 0:
+            return sorted(blocks)
+        if self._radius <= FRONTIER_DISTANCE:
+            return board.get_frontier(self._radius)
+        candidates = set()
+        radius = self._radius
+        for row, col in board.get_played_positions():
+            for i in range(row - radius, row + radius + 1):
+                for j in range(col - radius, col + radius + 1):
+                    if board.is_valid_move((i, j)):
+                        candidates.add((i, j))
+        return list(candidates)
+
+    def order_moves(self, board, symbol: str, moves: list, best_move: tuple(int, int) | None,
+                    ply: int | None = None) -> list:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: player to move
+        :param moves: candidate moves
+        :param best_move: move to try first, e.g. from the transposition table
+        :param ply: distance to the root, to try the killer moves of the ply first
+        :return: the moves sorted from the most to the least promising
+        """
+        return self._ordering.order(board, symbol, moves, best_move, ply)
+
+    def evaluate(self, board, symbol: str) -> int:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: player to move
+        :return: static score of the position for symbol, from the evaluator if the search has one, else from the
+                 line scores of the threat index
+        """
+        if self._evaluator is not None:
+            return self._evaluator.evaluate(board, symbol)
+        return board.get_line_score(symbol) - board.get_line_score('O' if symbol == 'X' else 'X')
+
+    def search(self, board, symbol: str, deadline: float, max_depth: int = MAX_DEPTH,
+               root_moves: list | None = None) -> tuple(int, int) | None:
+        """
+        :param board: current state of the board (Board Class), left unchanged
+        :param symbol: player to move
+        :param deadline: time.perf_counter() value at which the search must stop
+        :param max_depth: maximum depth in plies
+        :param root_moves: moves to search at the root, all the candidates if None
+        :return: the best move of the last completed depth, None if there is no empty cell around the stones
+        """
+        start = time.perf_counter()
+        self._deadline = deadline
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.history = []
+        self._ordering.new_search()
+        moves = self.get_candidates(board, symbol) if root_moves is None else list(root_moves)
+        if len(moves) == 0:
+            self.elapsed = time.perf_counter() - start
+            return None
+        key = board.get_hash() ^ Zobrist.get_query_key("search", symbol)
+        entry = self._tt.get(key)
+        best_move = self.order_moves(board, symbol, moves, entry[2] if entry is not None else None)[0]
+        if len(moves) > 1 or root_moves is not None:
+            for depth in range(1, max_depth + 1):
+                try:
+                    self.score, best_move = self._search_root(board, symbol, depth, moves, best_move)
+                except SearchTimeout:
+                    break
+                self.depth = depth
+                self.history.append((depth, self.score, best_move))
+                if abs(self.score) >= WIN_SCORE - MAX_DEPTH:
+                    break
+        self.elapsed = time.perf_counter() - start
+        return best_move
+
+    def _search_root(self, board, symbol: str, depth: int, moves: list, best_move: tuple(int, int)) -> tuple:
+        """
+        :return: (score, move) of the best root move at this depth
+        """
+        other = 'O' if symbol == 'X' else 'X'
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_score = None
+        for move in self.order_moves(board, symbol, moves, best_move, 0):
+            with board.trial(symbol, move):
+                score = -self._negamax(board, other, depth - 1, -beta, -alpha, 1)
+            if best_score is None or score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+        self._tt.store(board.get_hash() ^ Zobrist.get_query_key("search", symbol), depth, best_score, best_move, EXACT)
+        return best_score, best_move
+
+    def _negamax(self, board, symbol: str, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        :param board: current state of the board (Board Class)
+        :param symbol: player to move
+        :param depth: remaining depth in plies
+        :param alpha: lower bound of the window
+        :param beta: upper bound of the window
+        :param ply: distance to the root, used to prefer the fastest wins
+        :return: score of the position for symbol
+        """
+        self.nodes += 1
+        if self._stopped or time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+        other = 'O' if symbol == 'X' else 'X'
+        # the move that led here made five: the game is over, whatever fours the side to move has
+        if board.check_winner(other):
+            return -(WIN_SCORE - ply)
+        if board.count_fours(symbol) > 0:
+            return WIN_SCORE - ply
+        if depth == 0:
+            return self.evaluate(board, symbol)
+        key = board.get_hash() ^ Zobrist.get_query_key("search", symbol)
+        entry = self._tt.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_depth, tt_score, tt_move, flag = entry
+            if tt_depth >= depth and tt_score is not None:
+                if flag == EXACT:
+                    return tt_score
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, tt_score)
+                elif flag == UPPER_BOUND:
+                    beta = min(beta, tt_score)
+                if alpha >= beta:
+                    return tt_score
+        moves = self.get_candidates(board, symbol)
+        if len(moves) == 0:
+            return 0
+        moves = self.order_moves(board, symbol, moves, tt_move, ply)[:self._max_branching]
+        alpha_start = alpha
+        best_score, best_move = None, None
+        cutoff_index = None
+        for index, move in enumerate(moves):
+            with board.trial(symbol, move):
+                score = -self._negamax(board, other, depth - 1, -beta, -alpha, ply + 1)
+            if best_score is None or score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                cutoff_index = index
+                self._ordering.record_cutoff(symbol, move, depth, ply)
+                break
+        self._ordering.record_node(len(moves) if cutoff_index is None else cutoff_index + 1, cutoff_index)
+        if best_score <= alpha_start:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._tt.store(key, depth, best_score, best_move, flag)
+        return best_score
@@ -0,0 +1,130 @@
+# The 8 symmetries of a square board (4 rotations, each optionally mirrored) and the canonical form of a position.
+#
+# Positions that only differ by a symmetry have the same canonical hash: the smallest of the Zobrist hashes
+# of the 8 transformed positions. The symmetry reaching it maps moves to the canonical coordinates and its
+# inverse maps them back, so a table keyed by canonical hashes answers for the 8 positions at once.
+from __future__ import annotations
+
+import Zobrist
+
+NB_SYMMETRIES = 8
+
+# board_size -> {symbol: [(key of the cell moved by each symmetry) for every cell]}
+_keys_cache: dict = {}
+
+
+def transform(symmetry: int, position: tuple(int, int), board_size: int) -> tuple(int, int):
+    """
+    :param symmetry: index of the symmetry, 0 is the identity
+    :param position: position on the board (x, y)
+    :param board_size: size of the board
+    :return: the position moved by the symmetry
+    """
+    n = board_size - 1
+    row, col = position
+    if symmetry & 4:
+        col = n - col
+    for _ in range(symmetry & 3):
+        row, col = col, n - row
+    return row, col
+
+
+def inverse(symmetry: int) -> int:
+    """
+    :param symmetry: index of the symmetry
+    :return: the index of the symmetry undoing it
+    """
+    return _INVERSES[symmetry]
+
+
+def _find_inverse(symmetry: int) -> int:
+    probe = (1, 2)
+    moved = transform(symmetry, probe, 7)
+    for other in range(NB_SYMMETRIES):
+        if transform(other, moved, 7) == probe:
+            return other
+    raise ValueError(symmetry)
+
+
+_INVERSES = tuple(_find_inverse(symmetry) for symmetry in range(NB_SYMMETRIES))
+
+
+def get_symmetric_keys(board_size: int) -> dict:
+    """
+    :param board_size: size of the board
+    :return: for 'X' and 'O', the Zobrist keys of the cell row * board_size + col moved by each symmetry,
+             shared by every board of this size
+    """
+    keys = _keys_cache.get(board_size)
+    if keys is None:
+        zobrist = Zobrist.get_keys(board_size)
+        cells = range(board_size)
+        keys = {}
+        for symbol, table in zobrist.items():
+            columns = []
+            for symmetry in range(NB_SYMMETRIES):
+                # every symmetry is affine: the index of the moved cell is base + row * row_step + col * col_step
+                base, row_step, col_step = _get_index_steps(symmetry, board_size)
+                columns.append([table[base + row * row_step + col * col_step] for row in cells for col in cells])
+            keys[symbol] = list(zip(*columns))
+        _keys_cache[board_size] = keys
+    return keys
+
+
+def _get_index_steps(symmetry: int, board_size: int) -> tuple(int, int, int):
+    """
+    :return: (index of the cell (0, 0) is moved to, index step of a row, index step of a column) of the symmetry
+    """
+    origin = transform(symmetry, (0, 0), board_size)
+    down = transform(symmetry, (1, 0), board_size)
+    right = transform(symmetry, (0, 1), board_size)
+    base = origin[0] * board_size + origin[1]
+    return base, down[0] * board_size + down[1] - base, right[0] * board_size + right[1] - base
+
+
+def get_symmetric_hashes(board) -> list[int]:
+    """
+    :param board: current state of the board (Board Class)
+    :return: the Zobrist hash of the position moved by each of the 8 symmetries, computed from the stones;
+             Board.get_symmetric_hashes keeps the same values up to date incrementally
+    """
+    size = board._board_size
+    keys = Zobrist.get_keys(size)
+    hashes = [0] * NB_SYMMETRIES
+    for position in board.get_played_positions():
+        symbol = board.get_row_col(position[0], position[1])
+        if symbol not in keys:
+            continue
+        for symmetry in range(NB_SYMMETRIES):
+            row, col = transform(symmetry, position, size)
+            hashes[symmetry] ^= keys[symbol][row * size + col]
+    return hashes
+
+
+def canonical(hashes: list[int]) -> tuple(int, int):
+    """
+    :param hashes: the hashes of the 8 symmetric positions, indexed by symmetry
+    :return: (canonical hash, symmetry moving the position to its canonical form)
+    """
+    symmetry = min(range(NB_SYMMETRIES), key=lambda index: hashes[index])
+    return hashes[symmetry], symmetry
+
+
+def to_canonical(symmetry: int, position: tuple(int, int), board_size: int) -> tuple(int, int):
+    """
+    :param symmetry: symmetry returned by canonical
+    :param position: position on the board (x, y)
+    :param board_size: size of the board
+    :return: the position in the coordinates of the canonical board
+    """
+    return transform(symmetry, position, board_size)
+
+
+def from_canonical(symmetry: int, position: tuple(int, int), board_size: int) -> tuple(int, int):
+    """
+    :param symmetry: symmetry returned by canonical
+    :param position: position in the coordinates of the canonical board
+    :param board_size: size of the board
+    :return: the position on the board (x, y)
+    """
+    return transform(inverse(symmetry), position, board_size)
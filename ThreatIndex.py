@@ -0,0 +1,292 @@
+# This is a 'ThreatIndex' Class in python for a gomoku game:
+#
+# It keeps, for every line window of 5 and 6 cells in the four directions, a bitmask of the occupied
+# cells and a bitmask of the cells of 'X' and of 'O'. A window holding stones of a single player is
+# "owned" by that player, and the owner and number of stones of a window decide which threat set it is in.
+# Placing or removing a stone only touches the <= 20 windows of 5 cells and <= 24 windows of 6 cells
+# through that cell, so the threat queries never scan the board.
+from __future__ import annotations
+
+# Directions as (row step, col step), in the same order as the scans of Board.block_threat_of_three
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+SYMBOLS = ('X', 'O')
+POPCOUNT = [bin(mask).count('1') for mask in range(1 << 6)]
+FIVE_MASK = 0b11111
+ENDS_MASK = 0b100001
+INNER_MASK = 0b011110
+# Score of a 5 cells window holding only stones of one player, by number of stones
+LINE_WEIGHTS = (0, 1, 10, 100, 1000, 100000)
+
+# (board_size, length, position) -> ((window id, slot), ...) shared by every index of the same size
+_windows_cache: dict = {}
+
+
+class ThreatIndex:
+    def __init__(self, board_size: int, compact: bool = False):
+        self._board_size = board_size
+        nb_windows = 4 * board_size * board_size
+        # a bitmask of at most 6 bits fits in a byte: a compact index keeps them in bytearrays, 1 byte per window
+        # instead of 8 for a list slot; copies slice them and keep their type
+        new_masks = (lambda: bytearray(nb_windows)) if compact else (lambda: [0] * nb_windows)
+        self._occupied5 = new_masks()
+        self._occupied6 = new_masks()
+        self._stones5 = {symbol: new_masks() for symbol in SYMBOLS}
+        self._stones6 = {symbol: new_masks() for symbol in SYMBOLS}
+        self._three_in_five = {symbol: set() for symbol in SYMBOLS}
+        self._fours = {symbol: set() for symbol in SYMBOLS}
+        self._fives = {symbol: set() for symbol in SYMBOLS}
+        self._two_in_six = {symbol: set() for symbol in SYMBOLS}
+        self._threes = {symbol: set() for symbol in SYMBOLS}
+        self._scores = {symbol: 0 for symbol in SYMBOLS}
+        self._link_sets()
+
+    def _link_sets(self):
+        """
+        :return: None, index the threat sets by owner and number of stones
+        """
+        # owner -> threat set of its windows, by number of stones in the window
+        self._sets5 = {symbol: (None, None, None, self._three_in_five[symbol], self._fours[symbol],
+                                self._fives[symbol]) for symbol in SYMBOLS}
+        self._sets6 = {symbol: (None, None, self._two_in_six[symbol], self._threes[symbol], None, None, None)
+                       for symbol in SYMBOLS}
+
+    def copy(self) -> ThreatIndex:
+        """
+        :return: an independent copy of the index, made of list and set copies instead of replaying the stones
+        """
+        index = ThreatIndex.__new__(ThreatIndex)
+        index._board_size = self._board_size
+        index._occupied5 = self._occupied5[:]
+        index._occupied6 = self._occupied6[:]
+        index._stones5 = {symbol: masks[:] for symbol, masks in self._stones5.items()}
+        index._stones6 = {symbol: masks[:] for symbol, masks in self._stones6.items()}
+        index._three_in_five = {symbol: set(windows) for symbol, windows in self._three_in_five.items()}
+        index._fours = {symbol: set(windows) for symbol, windows in self._fours.items()}
+        index._fives = {symbol: set(windows) for symbol, windows in self._fives.items()}
+        index._two_in_six = {symbol: set(windows) for symbol, windows in self._two_in_six.items()}
+        index._threes = {symbol: set(windows) for symbol, windows in self._threes.items()}
+        index._scores = dict(self._scores)
+        index._link_sets()
+        return index
+
+    def get_windows(self, position: tuple(int, int), length: int) -> tuple:
+        """
+        :param position: position on the board (x, y)
+        :param length: number of cells of the windows, 5 or 6
+        :return: a tuple of (window id, slot of position in the window) for every window through position
+        """
+        key = (self._board_size, length, position)
+        windows = _windows_cache.get(key)
+        if windows is None:
+            windows = []
+            size = self._board_size
+            for direction, (dr, dc) in enumerate(DIRECTIONS):
+                for slot in range(length):
+                    r0, c0 = position[0] - slot * dr, position[1] - slot * dc
+                    r1, c1 = r0 + (length - 1) * dr, c0 + (length - 1) * dc
+                    if 0 <= r0 < size and 0 <= c0 < size and 0 <= r1 < size and 0 <= c1 < size:
+                        windows.append(((direction * size + r0) * size + c0, slot))
+            windows = tuple(windows)
+            _windows_cache[key] = windows
+        return windows
+
+    def get_cell(self, window: int, slot: int) -> tuple(int, int):
+        """
+        :param window: window id
+        :param slot: index of the cell in the window
+        :return: the position (x, y) of the cell
+        """
+        direction, start = divmod(window, self._board_size * self._board_size)
+        row, col = divmod(start, self._board_size)
+        return row + slot * DIRECTIONS[direction][0], col + slot * DIRECTIONS[direction][1]
+
+    def place(self, symbol: str, position: tuple(int, int)):
+        """
+        :param symbol: symbol of the stone placed on position
+        :param position: position on the board (x, y)
+        :return: None
+        """
+        self._update(symbol, position, True)
+
+    def remove(self, symbol: str, position: tuple(int, int)):
+        """
+        :param symbol: symbol of the stone removed from position
+        :param position: position on the board (x, y)
+        :return: None
+        """
+        self._update(symbol, position, False)
+
+    def place_all(self, stones: list[tuple(tuple(int, int), str)]):
+        """
+        :param stones: (position, symbol) of stones placed on empty cells
+        :return: None, set the bits of all the stones, then rebuild the threat sets and the scores in one pass
+                 over the windows instead of moving the windows from set to set after every stone
+        """
+        for position, symbol in stones:
+            for length, occupied, masks in ((5, self._occupied5, self._stones5), (6, self._occupied6, self._stones6)):
+                mine = masks.get(symbol)
+                for window, slot in self.get_windows(position, length):
+                    bit = 1 << slot
+                    occupied[window] |= bit
+                    if mine is not None:
+                        mine[window] |= bit
+        self._rebuild()
+
+    def _rebuild(self):
+        """
+        :return: None, recompute the threat sets and the scores from the window bitmasks
+        """
+        for sets in (self._three_in_five, self._fours, self._fives, self._two_in_six, self._threes):
+            for threats in sets.values():
+                threats.clear()
+        scores = {symbol: 0 for symbol in SYMBOLS}
+        for length, occupied, stones, sets in ((5, self._occupied5, self._stones5, self._sets5),
+                                               (6, self._occupied6, self._stones6, self._sets6)):
+            x_stones, o_stones = stones['X'], stones['O']
+            for window, occ in enumerate(occupied):
+                if occ == 0 or (length == 6 and occ & ENDS_MASK != 0):
+                    continue
+                owner = 'X' if x_stones[window] == occ else 'O' if o_stones[window] == occ else None
+                if owner is None:
+                    continue
+                threats = sets[owner][POPCOUNT[occ]]
+                if threats is not None:
+                    threats.add(window)
+                if length == 5:
+                    scores[owner] += LINE_WEIGHTS[POPCOUNT[occ]]
+        self._scores.update(scores)
+
+    def _update(self, symbol: str, position: tuple(int, int), placing: bool):
+        """
+        :param symbol: symbol of the stone, stones of other symbols than 'X' and 'O' only block lines
+        :param position: position on the board (x, y)
+        :param placing: True if the stone is placed, False if it is removed
+        :return: None, move the windows through position from their old threat sets to their new ones
+        """
+        scores = self._scores
+        for length, occupied, stones, sets in ((5, self._occupied5, self._stones5, self._sets5),
+                                               (6, self._occupied6, self._stones6, self._sets6)):
+            x_stones, o_stones = stones['X'], stones['O']
+            mine = stones.get(symbol)
+            for window, slot in self.get_windows(position, length):
+                occ = occupied[window]
+                if occ != 0 and (length == 5 or occ & ENDS_MASK == 0):
+                    owner = 'X' if x_stones[window] == occ else 'O' if o_stones[window] == occ else None
+                    if owner is not None:
+                        threats = sets[owner][POPCOUNT[occ]]
+                        if threats is not None:
+                            threats.discard(window)
+                        if length == 5:
+                            scores[owner] -= LINE_WEIGHTS[POPCOUNT[occ]]
+                bit = 1 << slot
+                if placing:
+                    occ |= bit
+                    if mine is not None:
+                        mine[window] |= bit
+                else:
+                    occ &= ~bit
+                    if mine is not None:
+                        mine[window] &= ~bit
+                occupied[window] = occ
+                if occ != 0 and (length == 5 or occ & ENDS_MASK == 0):
+                    owner = 'X' if x_stones[window] == occ else 'O' if o_stones[window] == occ else None
+                    if owner is not None:
+                        threats = sets[owner][POPCOUNT[occ]]
+                        if threats is not None:
+                            threats.add(window)
+                        if length == 5:
+                            scores[owner] += LINE_WEIGHTS[POPCOUNT[occ]]
+
+    def _free_cells(self, occupied: list, window: int, mask: int) -> list[tuple(int, int)]:
+        """
+        :return: the positions of the empty cells of the window among the cells of mask
+        """
+        free = ~occupied[window] & mask
+        return [self.get_cell(window, slot) for slot in range(6) if free >> slot & 1]
+
+    def threats_of_three(self, symbol: str | None) -> list[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the cell completing each threat of three of symbol, in the order Board.block_threat_of_three scans them
+        """
+        return [self._free_cells(self._occupied6, window, INNER_MASK)[0]
+                for window in sorted(self._threes.get(symbol, ()))]
+
+    def winning_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of empty cells that make five in a row for symbol
+        """
+        return {self._free_cells(self._occupied5, window, FIVE_MASK)[0] for window in self._fours.get(symbol, ())}
+
+    def four_making_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of empty cells that give symbol a 5 cells line with 4 stones and one empty cell
+        """
+        return {cell for window in self._three_in_five.get(symbol, ())
+                for cell in self._free_cells(self._occupied5, window, FIVE_MASK)}
+
+    def three_making_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of empty cells that give symbol a new threat of three
+        """
+        return {cell for window in self._two_in_six.get(symbol, ())
+                for cell in self._free_cells(self._occupied6, window, INNER_MASK)}
+
+    def three_defense_positions(self, symbol: str | None) -> set[tuple(int, int)]:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: the set of cells an opponent can play to break the threats of three of symbol
+        """
+        return {cell for window in self._threes.get(symbol, ())
+                for cell in self._free_cells(self._occupied6, window, ENDS_MASK | INNER_MASK)}
+
+    def count_threats_of_three(self, symbol: str | None) -> int:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: number of 6 cells windows with empty ends and 3 stones of symbol in the 4 inner cells
+        """
+        return len(self._threes.get(symbol, ()))
+
+    def count_fours(self, symbol: str | None) -> int:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: number of 5 cells windows with 4 stones of symbol and one empty cell
+        """
+        return len(self._fours.get(symbol, ()))
+
+    def has_five(self, symbol: str | None) -> bool:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: True if symbol has five in a row
+        """
+        return len(self._fives.get(symbol, ())) > 0
+
+    def line_score(self, symbol: str | None) -> int:
+        """
+        :param symbol: 'X' 'O' or None
+        :return: sum of LINE_WEIGHTS over the 5 cells windows holding only stones of symbol
+        """
+        return self._scores.get(symbol, 0)
+
+    def cell_score(self, position: tuple(int, int), symbol: str | None) -> int:
+        """
+        :param position: an empty position on the board (x, y)
+        :param symbol: player about to play on position
+        :return: how much playing position extends the lines of symbol and cuts the lines of the other player
+        """
+        occupied = self._occupied5
+        x_stones, o_stones = self._stones5['X'], self._stones5['O']
+        mine = self._stones5.get(symbol)
+        score = 0
+        for window, _ in self.get_windows(position, 5):
+            occ = occupied[window]
+            if occ == 0:
+                continue
+            if mine is not None and mine[window] == occ:
+                score += LINE_WEIGHTS[POPCOUNT[occ] + 1]
+            elif x_stones[window] == occ or o_stones[window] == occ:
+                score += LINE_WEIGHTS[POPCOUNT[occ]]
+        return score
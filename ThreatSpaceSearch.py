@@ -0,0 +1,152 @@
+# This is a 'ThreatSpaceSearch' Class in python for a gomoku game:
+#
+# It looks for forced wins by only playing threats for the attacker and the forced replies of the defender:
+# - VCF (victory by continuous fours): every attacking move makes a four, the defender must block it.
+# - VCT (victory by continuous threats): attacking moves make fours or threats of three, the defender
+#   may block any cell of the threats or counter with a four of their own.
+# The search is bounded by a depth (attacking moves) and a node budget, and returns the winning line.
+# The positions proven lost for the attacker are remembered with their depth from one search to the next, so the
+# searches of the following turns skip them; reset() forgets them for a new game.
+from __future__ import annotations
+
+import time
+
+import Zobrist
+from MoveOrdering import MoveOrdering
+
+VCF_DEPTH = 12
+VCT_DEPTH = 4
+# Node budgets, VCT trees are much wider than VCF ones
+VCF_NODES = 5000
+VCT_NODES = 1000
+# Failed positions remembered, they are all forgotten when there are more
+MAX_FAILED = 100000
+
+
+class NodeBudgetExceeded(Exception):
+    pass
+
+
+class ThreatSpaceSearch:
+    def __init__(self, vcf_depth: int = VCF_DEPTH, vct_depth: int = VCT_DEPTH,
+                 vcf_nodes: int = VCF_NODES, vct_nodes: int = VCT_NODES, ordering: MoveOrdering | None = None):
+        self._ordering = ordering if ordering is not None else MoveOrdering()
+        self._vcf_depth = vcf_depth
+        self._vct_depth = vct_depth
+        self._vcf_nodes = vcf_nodes
+        self._vct_nodes = vct_nodes
+        self._max_nodes = 0
+        self._board_size = 0
+        # key of the search asked (VCF or VCT, attacker), XORed with the position hashes
+        self._query_key = 0
+        # position hash ^ query key -> depth the attacker has been proven not to win at
+        self._failed: dict = {}
+        self.nodes = 0
+        self.elapsed = 0.0
+
+    def get_stats(self) -> dict:
+        """
+        :return: nodes, time and nodes per second of the last search
+        """
+        return {
+            "nodes": self.nodes,
+            "elapsed": self.elapsed,
+            "nps": self.nodes / self.elapsed if self.elapsed > 0 else 0.0,
+        }
+
+    def reset(self):
+        """
+        :return: None, forget the failed positions of the previous searches
+        """
+        self._failed = {}
+
+    def find_vcf(self, board, attacker: str) -> list[tuple(int, int)] | None:
+        """
+        :param board: current state of the board (Board Class), left unchanged
+        :param attacker: player to move
+        :return: the moves of the winning line, alternately attacker and defender, ending with the five,
+                 None if no VCF has been found within the depth and node budget
+        """
+        return self._find(board, attacker, self._vcf_depth, self._vcf_nodes, False)
+
+    def find_vct(self, board, attacker: str) -> list[tuple(int, int)] | None:
+        """
+        :param board: current state of the board (Board Class), left unchanged
+        :param attacker: player to move
+        :return: the moves of the winning line, alternately attacker and defender, ending with the five,
+                 None if no VCT has been found within the depth and node budget
+        """
+        return self._find(board, attacker, self._vct_depth, self._vct_nodes, True)
+
+    def _find(self, board, attacker: str, depth: int, max_nodes: int, threes: bool) -> list[tuple(int, int)] | None:
+        start = time.perf_counter()
+        self.nodes = 0
+        self._max_nodes = max_nodes
+        if board._board_size != self._board_size or len(self._failed) > MAX_FAILED:
+            self._board_size = board._board_size
+            self.reset()
+        self._query_key = Zobrist.get_query_key("vct" if threes else "vcf", attacker)
+        try:
+            line = self._attack(board, attacker, depth, threes)
+        except NodeBudgetExceeded:
+            line = None
+        self.elapsed = time.perf_counter() - start
+        return line
+
+    def _attack(self, board, attacker: str, depth: int, threes: bool) -> list[tuple(int, int)] | None:
+        """
+        :return: the winning line of attacker to move, None if there is none
+        """
+        self.nodes += 1
+        if self.nodes > self._max_nodes:
+            raise NodeBudgetExceeded()
+        wins = board.get_winning_positions(attacker)
+        if len(wins) > 0:
+            return [min(wins)]
+        if depth == 0:
+            return None
+        key = board.get_hash() ^ self._query_key
+        if self._failed.get(key, -1) >= depth:
+            return None
+        defender = 'O' if attacker == 'X' else 'X'
+        blocks = board.get_winning_positions(defender)
+        if len(blocks) > 1:
+            return None
+        moves = board.get_four_making_positions(attacker)
+        if threes:
+            moves |= board.get_three_making_positions(attacker)
+        if len(blocks) == 1:
+            moves &= blocks
+        for move in self._ordering.order(board, attacker, moves):
+            with board.trial(attacker, move):
+                line = self._defend(board, attacker, depth, threes)
+            if line is not None:
+                return [move] + line
+        self._failed[key] = depth
+        return None
+
+    def _defend(self, board, attacker: str, depth: int, threes: bool) -> list[tuple(int, int)] | None:
+        """
+        :return: the rest of the winning line if attacker wins against every reply of the defender, else None
+        """
+        defender = 'O' if attacker == 'X' else 'X'
+        if board.count_fours(defender) > 0:
+            return None
+        wins = board.get_winning_positions(attacker)
+        if len(wins) > 1:
+            return [min(wins), max(wins)]
+        if len(wins) == 1:
+            replies = wins
+        elif threes and board.count_threats_of_three(attacker) > 0:
+            replies = board.get_three_defense_positions(attacker) | board.get_four_making_positions(defender)
+        else:
+            return None
+        line = None
+        for reply in sorted(replies):
+            with board.trial(defender, reply):
+                rest = self._attack(board, attacker, depth - 1, threes)
+            if rest is None:
+                return None
+            if line is None:
+                line = [reply] + rest
+        return line
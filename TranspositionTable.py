@@ -0,0 +1,106 @@
+# This is a 'TranspositionTable' Class in python for a gomoku game:
+#
+# A bounded map from 64 bits position hashes to (depth, score, best move, bound flag).
+# When full, the least recently used entry is evicted; a deeper result for the same
+# hash is never replaced by a shallower one.
+from __future__ import annotations
+
+from collections import OrderedDict
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionTable:
+    # Measured with tracemalloc: hash, entry tuple, move tuple and OrderedDict node
+    ENTRY_SIZE = 300
+    # Part of the manager's max_memory given to the table, the rest is left to the brain
+    MEMORY_SHARE = 0.5
+    # Used when the manager sends max_memory 0 (no limit)
+    DEFAULT_MEMORY = 64 * 1024 * 1024
+
+    def __init__(self, max_memory: int = 0):
+        self._entries = OrderedDict()
+        self._capacity = 1
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.set_max_memory(max_memory)
+
+    def set_max_memory(self, max_memory: int):
+        """
+        :param max_memory: memory limit of the brain in bytes, as sent by 'INFO max_memory', 0 for no limit
+        :return: None, evict the oldest entries if the table is over its new capacity
+        """
+        budget = int(max_memory * self.MEMORY_SHARE) if max_memory > 0 else self.DEFAULT_MEMORY
+        self._capacity = max(1, budget // self.ENTRY_SIZE)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_capacity(self) -> int:
+        """
+        :return: maximum number of entries
+        """
+        return self._capacity
+
+    def get(self, key: int) -> tuple | None:
+        """
+        :param key: position hash
+        :return: the (depth, score, move, flag) stored for key, None if there is none
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: int, depth: int = 0, score: int | None = None,
+              move: tuple(int, int) | None = None, flag: int = EXACT) -> bool:
+        """
+        :param key: position hash
+        :param depth: search depth the result comes from, 0 for exact queries
+        :param score: evaluation of the position
+        :param move: best move found in the position
+        :param flag: EXACT, LOWER_BOUND or UPPER_BOUND
+        :return: True if the entry has been stored, False if a deeper one was kept
+        """
+        old = self._entries.get(key)
+        if old is not None:
+            self._entries.move_to_end(key)
+            if old[0] > depth:
+                return False
+        self._entries[key] = (depth, score, move, flag)
+        self.stores += 1
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def clear(self):
+        """
+        :return: None, remove every entry, the counters are kept
+        """
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        :return: the size of the table and its hit, miss, store and eviction counters
+        """
+        probes = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "capacity": self._capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes > 0 else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
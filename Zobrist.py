@@ -0,0 +1,42 @@
+# Zobrist keys for a gomoku board:
+#
+# A position is hashed by XORing one random 64 bits key per (cell, symbol) of its stones,
+# so playing or undoing a move updates the hash with a single XOR.
+# Keys come from a fixed seed, so hashes are the same in every process and every session.
+from __future__ import annotations
+
+import random
+
+SEED = 0x5EED_60E0
+SYMBOLS = ('X', 'O')
+
+# board_size -> {symbol: [key of cell row * board_size + col]}
+_keys_cache: dict = {}
+# (query, symbol) -> key
+_query_keys_cache: dict = {}
+
+
+def get_keys(board_size: int) -> dict:
+    """
+    :param board_size: size of the board
+    :return: a dict with, for 'X' and 'O', the list of the keys of every cell in row-major order
+    """
+    keys = _keys_cache.get(board_size)
+    if keys is None:
+        rng = random.Random(SEED + board_size)
+        keys = {symbol: [rng.getrandbits(64) for _ in range(board_size * board_size)] for symbol in SYMBOLS}
+        _keys_cache[board_size] = keys
+    return keys
+
+
+def get_query_key(query: str, symbol: str | None) -> int:
+    """
+    :param query: name of the cached question asked about a position, e.g. 'winning_move'
+    :param symbol: 'X' 'O' or None, the player the question is asked for
+    :return: a 64 bits key to XOR with a position hash, so each question gets its own table entries
+    """
+    key = _query_keys_cache.get((query, symbol))
+    if key is None:
+        key = random.Random(f"{query}/{symbol}").getrandbits(64)
+        _query_keys_cache[(query, symbol)] = key
+    return key
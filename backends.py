@@ -0,0 +1,44 @@
+# Board backends that can be selected at runtime, e.g. with the 'board_backend' INFO key.
+#
+# Every backend has the public API of 'Board'; the numpy one is only available when numpy is installed,
+# asking for it without numpy falls back to the pure python 'Board'.
+# Backend modules are imported on first use, so numpy is never loaded by a brain that does not use it.
+from __future__ import annotations
+
+import importlib
+import importlib.util
+
+DEFAULT_BACKEND = "list"
+# name -> (module, class)
+BACKENDS = {
+    "list": ("Board", "Board"),
+    "bitboard": ("BitBoard", "BitBoard"),
+    "compact": ("CompactBoard", "CompactBoard"),
+    "numpy": ("NumpyBoard", "NumpyBoard"),
+}
+# name -> module that must be installed for the backend to be available
+OPTIONAL_DEPENDENCIES = {
+    "numpy": "numpy",
+}
+
+
+def is_available(name: str) -> bool:
+    """
+    :param name: name of a backend in BACKENDS
+    :return: True if the backend exists and its dependencies are installed
+    """
+    if name not in BACKENDS:
+        return False
+    dependency = OPTIONAL_DEPENDENCIES.get(name)
+    return dependency is None or importlib.util.find_spec(dependency) is not None
+
+
+def get_board_class(name: str) -> type:
+    """
+    :param name: name of a backend in BACKENDS
+    :return: the board class of the backend, 'Board' if it is unknown or unavailable
+    """
+    if not is_available(name):
+        name = DEFAULT_BACKEND
+    module, cls = BACKENDS[name]
+    return getattr(importlib.import_module(module), cls)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Measure the memory allocated by Ai.play_best_move with tracemalloc, on the positions of tests/test_Ai.py.
+# 'copy' is the previous strategy (one copy_board() per candidate cell), 'trial' the in-place push/pop one.
+#
+# usage: python3 benchmarks/bench_allocations.py
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI import Ai
+from Board import Board
+
+
+class CopyingAi(Ai):
+    """ Reference implementation copying the board for every candidate, as before push/pop """
+
+    def get_winning_move(self, board, symbol):
+        for position in board.get_empty_positions():
+            if not board.check_if_there_is_symbol_next(position):
+                continue
+            tmp = board.copy_board()
+            tmp.update_board(symbol, position)
+            if tmp.check_winner(symbol):
+                return position
+        return None
+
+    def can_do_a_double_threat(self, board, symbol):
+        for position in board.get_empty_positions():
+            if not board.check_if_there_is_symbol_next_two(position):
+                continue
+            tmp = board.copy_board()
+            tmp.block_threat_of_three(symbol)
+            tmp.update_board(symbol, position)
+            tmp.block_threat_of_three(symbol)
+        return super().can_do_a_double_threat(board, symbol)
+
+    def can_do_double_win(self, board, symbol):
+        for position in board.get_empty_positions():
+            if board.check_if_there_is_symbol_next_two(position):
+                board.copy_board()
+        return super().can_do_double_win(board, symbol)
+
+
+def positions():
+    board = Board(9)
+    for position in [(3, 2), (2, 3), (2, 4), (3, 4)]:
+        board.update_board('X', position)
+    yield "double threat 9x9", board, 'O'
+
+    board = Board(9)
+    for position in [(3, 3), (5, 3), (2, 4), (6, 4)]:
+        board.update_board('X', position)
+    yield "orthogonal threat 9x9", board, 'O'
+
+    board = Board(20)
+    for i, position in enumerate([(10, 10), (10, 11), (11, 10), (9, 9), (12, 12), (11, 13), (8, 12), (13, 9)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    yield "midgame 20x20", board, 'X'
+
+
+def measure(ai_class, board: Board, symbol: str) -> tuple:
+    board = board.copy_board()
+    ai = ai_class(board._board_size, symbol)
+    copies = [0]
+    copy_board = Board.copy_board
+
+    def counting_copy(self):
+        copies[0] += 1
+        return copy_board(self)
+    Board.copy_board = counting_copy
+    tracemalloc.start()
+    try:
+        ai.play_best_move(board)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        Board.copy_board = copy_board
+    return peak, copies[0]
+
+
+def main():
+    print(f"{'position':>22} {'strategy':>8} {'peak KiB':>9} {'board copies':>13}")
+    for name, board, symbol in positions():
+        for strategy, ai_class in [("copy", CopyingAi), ("trial", Ai)]:
+            peak, copies = measure(ai_class, board, symbol)
+            print(f"{name:>22} {strategy:>8} {peak / 1024:>9.1f} {copies:>13}")
+
+
+if __name__ == '__main__':
+    main()
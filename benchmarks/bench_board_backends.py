@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Compare the list-of-lists 'Board' with the bitboard 'BitBoard', the bytearray 'CompactBoard' and, when numpy is
+# installed, 'NumpyBoard' backends.
+#
+# usage: python3 benchmarks/bench_board_backends.py [board_size ...]
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI import Ai
+from Board import Board
+from BitBoard import BitBoard
+from CompactBoard import CompactBoard
+import backends
+
+BACKENDS = [("Board", Board), ("BitBoard", BitBoard), ("CompactBoard", CompactBoard)]
+if backends.is_available("numpy"):
+    BACKENDS.append(("NumpyBoard", backends.get_board_class("numpy")))
+
+
+def midgame(backend, size: int, nb_moves: int, seed: int = 42):
+    rng = random.Random(seed)
+    board = backend(size)
+    center = size // 2
+    symbol = 'X'
+    played = 0
+    while played < nb_moves:
+        position = (center + rng.randint(-4, 4), center + rng.randint(-4, 4))
+        board.update_board(symbol, position)
+        if board.check_winner(symbol):
+            board.reset_board()
+            played = 0
+            continue
+        symbol = 'O' if symbol == 'X' else 'X'
+        played += 1
+    return board
+
+
+def measure(statement, number: int) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=3)) / number
+
+
+def main(sizes):
+    print(f"{'size':>5} {'backend':>12} {'check_winner':>14} {'empty cells':>13} {'get_winning_move':>18}")
+    for size in sizes:
+        for name, backend in BACKENDS:
+            board = midgame(backend, size, 20)
+            ai = Ai(size, 'X')
+            check = measure(lambda: board.check_winner('X'), 200)
+            empty = measure(board.get_empty_positions, 200)
+            winning = measure(lambda: ai.get_winning_move(board, 'X'), 3)
+            print(f"{size:>5} {name:>12} {check * 1e6:>11.2f} us {empty * 1e6:>10.2f} us {winning * 1e3:>15.2f} ms")
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [15, 20])
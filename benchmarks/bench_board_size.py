@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Move latency against the board size: the same quiet midgame cluster of stones is put in the middle of boards of
+# 15 to 100 cells. The time of the first START of each size (board and AI creation, with the per-size key tables),
+# the time of a heuristic move and the depth and nodes per second of the search within the turn budget are measured.
+# None of them should depend on the size of the board, only on the stones around which the AI searches.
+#
+# usage: python3 benchmarks/bench_board_size.py [board_size ...] [--turn-ms MS]
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI import Ai, HEURISTIC_MODE, SEARCH_MODE
+from Board import Board
+
+SIZES = [15, 20, 30, 50, 75, 100]
+# Offsets from the center of the board of the stones of the midgame position, 'X' and 'O' alternately
+MIDGAME = [(0, 0), (0, 1), (1, 1), (-1, 0), (2, -1), (1, -1), (-2, 1), (2, 2), (-1, 2), (3, 0)]
+
+
+def midgame(size: int) -> Board:
+    board = Board(size)
+    center = size // 2
+    for i, (dx, dy) in enumerate(MIDGAME):
+        board.update_board('X' if i % 2 == 0 else 'O', (center + dx, center + dy))
+    return board
+
+
+def measure_move(size: int, repeat: int) -> float:
+    """
+    :return: the best time in seconds of one heuristic move of a fresh AI on the midgame position
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        board = midgame(size)
+        ai = Ai(size, 'X', mode=HEURISTIC_MODE)
+        start = time.perf_counter()
+        ai.play_best_move(board)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_search(size: int, turn_ms: int) -> dict:
+    """
+    :return: the statistics of the search of one move within turn_ms milliseconds
+    """
+    board = midgame(size)
+    ai = Ai(size, 'X', mode=SEARCH_MODE)
+    ai.set_time_control(turn_ms, 0, 2147483647)
+    ai.play_best_move(board)
+    return ai.get_search().get_stats()
+
+
+def measure_start(size: int) -> float:
+    """
+    :return: the time in seconds to create the first board and AI of this size
+    """
+    start = time.perf_counter()
+    Board(size)
+    Ai(size, 'X')
+    return time.perf_counter() - start
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Measure the move latency against the board size.")
+    parser.add_argument("sizes", nargs="*", type=int)
+    parser.add_argument("--turn-ms", type=int, default=300, help="turn budget of the search mode")
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args(args)
+    print(f"{'size':>5} {'start':>10} {'heuristic':>12} {'search depth':>12} {'nodes/s':>9}")
+    for size in options.sizes or SIZES:
+        start = measure_start(size)
+        heuristic = measure_move(size, options.repeat)
+        search = measure_search(size, options.turn_ms)
+        print(f"{size:>5} {start * 1000:>7.1f} ms {heuristic * 1000:>9.1f} ms {search['depth']:>12} "
+              f"{search['nps']:>9.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Memory per board and copy throughput of the list-of-lists 'Board' and the bytearray 'CompactBoard'.
+# The memory of the cells is measured with sys.getsizeof (the list of rows and the rows, or the buffer). The memory
+# of a whole board, threat index, neighbour counts, empty cells and hashes included, is measured with tracemalloc,
+# for a new board and for a copy of a midgame board; copies per second are measured with copy_board on the midgame.
+#
+# usage: python3 benchmarks/bench_compact_board.py [board_size ...]
+from __future__ import annotations
+
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Board import Board
+from BitBoard import BitBoard
+from CompactBoard import CompactBoard
+
+BACKENDS = [("Board", Board), ("BitBoard", BitBoard), ("CompactBoard", CompactBoard)]
+
+
+def midgame(backend, size: int, nb_moves: int, seed: int = 42):
+    rng = random.Random(seed)
+    board = backend(size)
+    center = size // 2
+    symbol = 'X'
+    while len(board.get_played_positions()) < nb_moves:
+        position = (center + rng.randint(-5, 5), center + rng.randint(-5, 5))
+        if board.update_board(symbol, position):
+            symbol = 'O' if symbol == 'X' else 'X'
+    return board
+
+
+def cells_size(board) -> int:
+    """
+    :return: bytes used by the cells of the board, without the indexes
+    """
+    if isinstance(board, CompactBoard):
+        return sys.getsizeof(board.get_cells())
+    rows = board.get_board()
+    return sys.getsizeof(rows) + sum(sys.getsizeof(row) for row in rows)
+
+
+def allocated_size(create, nb_boards: int = 20) -> float:
+    """
+    :param create: function returning a new board
+    :return: bytes allocated per board, indexes included
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    boards = [create() for _ in range(nb_boards)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del boards
+    return allocated / nb_boards
+
+
+def main(sizes: list[int]):
+    print(f"{'size':>5} {'backend':>13} {'cells':>9} {'new board':>10} {'midgame':>10} {'copies/s':>10}")
+    for size in sizes:
+        for name, backend in BACKENDS:
+            board = midgame(backend, size, 30)
+            number = 200
+            copy = min(timeit.repeat(board.copy_board, number=number, repeat=3)) / number
+            print(f"{size:>5} {name:>13} {cells_size(board):>7} B "
+                  f"{allocated_size(lambda: backend(size)) / 1024:>7.1f} KB "
+                  f"{allocated_size(board.copy_board) / 1024:>7.1f} KB {1 / copy:>10.0f}")
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [15, 20])
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# Static evaluations per second of the pattern table 'Evaluator' against the line scores of the threat index,
+# on seeded midgame positions: one move pushed and popped before each evaluation, as in a search, then the
+# evaluator rebuilt from the whole move stack. Also reports the time to build the pattern table and the nodes
+# per second of a fixed depth search with each evaluation.
+#
+# usage: python3 benchmarks/bench_evaluator.py [board_size] [nb_moves]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Evaluator
+from Board import Board
+from Search import Search
+from TranspositionTable import TranspositionTable
+
+
+def midgame(size: int, nb_moves: int, seed: int = 42) -> Board:
+    rng = random.Random(seed)
+    board = Board(size)
+    center = size // 2
+    symbol = 'X'
+    while len(board.get_played_positions()) < nb_moves:
+        if board.update_board(symbol, (center + rng.randint(-4, 4), center + rng.randint(-4, 4))):
+            symbol = 'O' if symbol == 'X' else 'X'
+    return board
+
+
+def evaluations_per_second(board: Board, evaluate, number: int = 20000) -> float:
+    moves = sorted(board.get_frontier(1))
+    start = time.perf_counter()
+    for i in range(number):
+        board.push('X', moves[i % len(moves)])
+        evaluate(board, 'O')
+        board.pop()
+    return number / (time.perf_counter() - start)
+
+
+def main(size: int, nb_moves: int):
+    start = time.perf_counter()
+    Evaluator.get_pattern_table()
+    print(f"pattern table: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    board = midgame(size, nb_moves)
+    evaluator = Evaluator.Evaluator()
+    line_search = Search(TranspositionTable())
+    print(f"{'evaluation':>12} {'evals/s':>10}")
+    print(f"{'lines':>12} {evaluations_per_second(board, line_search.evaluate):>10.0f}")
+    print(f"{'patterns':>12} {evaluations_per_second(board, evaluator.evaluate):>10.0f}")
+    print(f"{'rebuilt':>12} "
+          f"{evaluations_per_second(board, lambda b, s: Evaluator.Evaluator().evaluate(b, s), 500):>10.0f}")
+
+    print(f"{'search':>12} {'nodes/s':>10}")
+    for name, evaluator in [("lines", None), ("patterns", Evaluator.Evaluator())]:
+        search = Search(TranspositionTable(), evaluator=evaluator)
+        search.search(board, 'X', time.perf_counter() + 3600, 3)
+        stats = search.get_stats()
+        print(f"{name:>12} {stats['nodes'] / stats['elapsed']:>10.0f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 15, int(sys.argv[2]) if len(sys.argv) > 2 else 30)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# Playouts per second and tree size of the Monte Carlo tree search, move by move, over a game played by the
+# MCTS against itself with a fixed time per move. 'reused' is the number of nodes kept from the previous move
+# of the same side when the tree is advanced by the two moves played since.
+#
+# usage: python3 benchmarks/bench_mcts.py [board_size] [ms_per_move] [nb_moves]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Board import Board
+from MCTS import MCTS
+
+
+def main(size: int, ms_per_move: int, nb_moves: int):
+    board = Board(size)
+    board.update_board('X', (size // 2, size // 2))
+    players = {'O': MCTS(seed=1), 'X': MCTS(seed=2)}
+    symbol = 'O'
+    print(f"{'move':>5} {'player':>6} {'playouts':>9} {'playouts/s':>11} {'tree size':>10} {'reused':>8} {'ply':>4}")
+    total_playouts, total_elapsed = 0, 0.0
+    for number in range(1, nb_moves + 1):
+        mcts = players[symbol]
+        move = mcts.search(board, symbol, time.perf_counter() + ms_per_move / 1000)
+        stats = mcts.get_stats()
+        total_playouts += stats["playouts"]
+        total_elapsed += stats["elapsed"]
+        print(f"{number:>5} {symbol:>6} {stats['playouts']:>9} {stats['playouts_per_second']:>11.0f} "
+              f"{stats['tree_size']:>10} {stats['reused']:>8} {stats['max_ply']:>4}")
+        if move is None or not board.update_board(symbol, move) or board.check_winner(symbol):
+            break
+        symbol = 'O' if symbol == 'X' else 'X'
+    print(f"mean: {total_playouts / total_elapsed:.0f} playouts/s")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 15, int(sys.argv[2]) if len(sys.argv) > 2 else 500,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 20)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# Compare the move orderings of the alpha-beta search on seeded midgame positions at a fixed depth:
+# static threat score only, with the history heuristic, with the killer moves, and with both.
+#
+# usage: python3 benchmarks/bench_move_ordering.py [depth] [nb_positions]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Board import Board
+from MoveOrdering import MoveOrdering
+from Search import Search
+from TranspositionTable import TranspositionTable
+
+ORDERINGS = [
+    ("static", dict(history=False, killers=False)),
+    ("history", dict(history=True, killers=False)),
+    ("killers", dict(history=False, killers=True)),
+    ("both", dict(history=True, killers=True)),
+]
+
+
+def positions(nb_positions: int, size: int = 15, nb_moves: int = 12):
+    for seed in range(nb_positions):
+        rng = random.Random(seed)
+        board = Board(size)
+        center = size // 2
+        symbol = 'X'
+        while len(board.get_played_positions()) < nb_moves:
+            if board.update_board(symbol, (center + rng.randint(-3, 3), center + rng.randint(-3, 3))):
+                symbol = 'O' if symbol == 'X' else 'X'
+        if board.count_fours('X') == 0 and board.count_fours('O') == 0:
+            yield board, symbol
+
+
+def main(depth: int, nb_positions: int):
+    print(f"{'ordering':>8} {'nodes':>9} {'time s':>8} {'first-move cutoffs':>19} {'branching':>10}")
+    boards = list(positions(nb_positions))
+    for name, options in ORDERINGS:
+        nodes, elapsed, rates, branching = 0, 0.0, [], []
+        for board, symbol in boards:
+            search = Search(TranspositionTable(), ordering=MoveOrdering(**options))
+            search.search(board, symbol, time.perf_counter() + 3600, depth)
+            stats = search.get_stats()
+            nodes += stats["nodes"]
+            elapsed += stats["elapsed"]
+            rates.append(stats["first_move_cutoff_rate"])
+            branching.append(stats["branching_factor"])
+        print(f"{name:>8} {nodes:>9} {elapsed:>8.2f} {sum(rates) / len(rates) * 100:>18.1f}%"
+              f" {sum(branching) / len(branching):>10.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3, int(sys.argv[2]) if len(sys.argv) > 2 else 8)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Nodes per second of the parallel root search from 1 to N worker processes, on a fixed midgame position.
+#
+# usage: python3 benchmarks/bench_parallel_search.py [max_workers] [seconds_per_move]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Board import Board
+from ParallelSearch import ParallelSearch
+
+
+def midgame() -> Board:
+    board = Board(20)
+    for i, position in enumerate([(10, 10), (10, 11), (11, 10), (9, 9), (12, 12), (11, 13), (8, 12), (13, 9)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    return board
+
+
+def main(max_workers: int, seconds: float):
+    board = midgame()
+    print(f"{'workers':>7} {'nodes':>9} {'depth':>5} {'nodes/s':>9} {'speedup':>7}")
+    reference = None
+    for workers in range(1, max_workers + 1):
+        search = ParallelSearch(workers)
+        search.start()
+        try:
+            search.search(board, 'X', time.perf_counter() + seconds)
+        finally:
+            search.stop()
+        stats = search.get_stats()
+        reference = reference or stats["nps"]
+        print(f"{workers:>7} {stats['nodes']:>9} {stats['depth']:>5} {stats['nps']:>9.0f} "
+              f"{stats['nps'] / reference if reference else 0:>6.2f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1),
+         float(sys.argv[2]) if len(sys.argv) > 2 else 2.0)
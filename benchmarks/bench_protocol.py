@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Throughput of the protocol layer: recorded manager transcripts (benchmarks/transcripts/*.txt, the lines sent by
+# the manager) are replayed through InputParser from memory, and the lines and commands handled per second are
+# reported. By default the AI answers with the first free frontier cell so only the reading, the dispatch and
+# the BOARD blocks are measured; --ai lets the real AI play.
+#
+# usage: python3 benchmarks/bench_protocol.py [TRANSCRIPT ...] [--repeat N] [--ai]
+from __future__ import annotations
+
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Singleton import Singleton
+from input_parser import InputParser
+
+TRANSCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transcripts")
+
+
+class ProtocolOnlyParser(InputParser):
+    """ Parser answering the first free frontier cell instead of searching """
+
+    def _play(self):
+        frontier = self.game_board.get_frontier(1) or self.game_board.get_empty_positions()
+        self._output.write(*frontier[0], sep=',')
+        self._output.flush()
+
+
+def replay(path: str, parser_class: type) -> tuple(float, int, int, int):
+    """
+    :return: (seconds, lines read, commands handled, replies flushed) of one replay of the transcript
+    """
+    with open(path) as file:
+        text = file.read()
+    Singleton._instances.pop(parser_class, None)
+    parser = parser_class(io.StringIO(text), io.StringIO())
+    start = time.perf_counter()
+    while parser.read_input():
+        pass
+    elapsed = time.perf_counter() - start
+    Singleton._instances.pop(parser_class, None)
+    return elapsed, parser._reader.lines, parser._reader.commands, parser._output.flushes
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Replay manager transcripts through the protocol layer.")
+    parser.add_argument("transcripts", nargs="*")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--ai", action="store_true", help="let the AI search instead of answering at once")
+    options = parser.parse_args(args)
+    paths = options.transcripts or sorted(glob.glob(os.path.join(TRANSCRIPTS, "*.txt")))
+    parser_class = InputParser if options.ai else ProtocolOnlyParser
+
+    print(f"{'transcript':<26} {'lines':>6} {'commands':>8} {'flushes':>7} {'ms/replay':>9} "
+          f"{'lines/s':>9} {'commands/s':>10}")
+    for path in paths:
+        runs = [replay(path, parser_class) for _ in range(options.repeat)]
+        elapsed = min(run[0] for run in runs)
+        _, lines, commands, flushes = runs[0]
+        print(f"{os.path.basename(path):<26} {lines:>6} {commands:>8} {flushes:>7} {elapsed * 1000:>9.2f} "
+              f"{lines / elapsed:>9.0f} {commands / elapsed:>10.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# Latency of the random move fallback late in a game: the board is filled except a few cells, then random_play
+# draws from the list of empty cells kept by the board. The rejection sampling random_play used before (random
+# coordinates until an empty cell is hit) is timed on the same positions for comparison, with is_full. Both
+# play the move and undo it, so the threat index updates are in both columns.
+#
+# usage: python3 benchmarks/bench_random_play.py [board_size ...]
+from __future__ import annotations
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Board import Board
+
+
+def rejection_sampling(board: Board, rng: random.Random) -> tuple:
+    """
+    :return: the position the previous random_play would pick, without playing it
+    """
+    size = board._board_size
+    row, col = rng.randint(0, size - 1), rng.randint(0, size - 1)
+    while not board.is_valid_move((row, col)):
+        row, col = rng.randint(0, size - 1), rng.randint(0, size - 1)
+    return row, col
+
+
+def nearly_full(size: int, nb_free: int, seed: int = 0) -> Board:
+    rng = random.Random(seed)
+    positions = [(i, j) for i in range(size) for j in range(size)]
+    rng.shuffle(positions)
+    board = Board(size)
+    board.load_stones([(position, 'X' if index % 2 == 0 else 'O')
+                       for index, position in enumerate(positions[nb_free:])])
+    return board
+
+
+def main(sizes: list[int]):
+    print(f"{'size':>5} {'free':>5} {'random_play us':>15} {'rejection us':>13} {'is_full us':>11}")
+    for size in sizes:
+        for nb_free in [size * size // 2, 10, 1]:
+            board = nearly_full(size, nb_free)
+            board.set_seed(0)
+            rng = random.Random(0)
+            number = 200
+
+            def play():
+                board.random_play('X')
+                board.pop()
+
+            def play_rejection():
+                board.update_board('X', rejection_sampling(board, rng))
+                board.pop()
+
+            fast = min(timeit.repeat(play, number=number, repeat=3)) / number
+            slow = min(timeit.repeat(play_rejection, number=number, repeat=3)) / number
+            full = min(timeit.repeat(board.is_full, number=number, repeat=3)) / number
+            print(f"{size:>5} {nb_free:>5} {fast * 1e6:>15.1f} {slow * 1e6:>13.1f} {full * 1e6:>11.2f}")
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [15, 20, 50, 100])
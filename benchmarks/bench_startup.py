@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# Startup time of the brain: the slowest imports of input_parser (python -X importtime), then the time
+# from launching pbrain-gomoku-ai.py to the answers of ABOUT and START, the manager's first commands.
+# Exits with 1 when the median time to the first OK is over the budget, so it can guard the startup in CI.
+#
+# usage: python3 benchmarks/bench_startup.py [--runs N] [--budget-ms MS] [--top N]
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BRAIN = os.path.join(ROOT, "pbrain-gomoku-ai.py")
+
+# Median milliseconds allowed between the launch of the brain and the OK of START 15
+DEFAULT_BUDGET_MS = 150
+
+
+def import_times(module: str) -> list[tuple(str, int)]:
+    """
+    :return: (module, cumulative microseconds) of every module imported by 'import module', the slowest first
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times.append((name.strip(), int(cumulative)))
+    return sorted(times, key=lambda item: -item[1])
+
+
+def time_to_first_ok() -> tuple(float, float):
+    """
+    :return: seconds from the launch of the brain to its answer to ABOUT, then to the OK of START 15
+    """
+    start = time.perf_counter()
+    brain = subprocess.Popen([sys.executable, BRAIN], cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                             text=True, bufsize=1)
+    try:
+        brain.stdin.write("ABOUT\n")
+        brain.stdin.flush()
+        brain.stdout.readline()
+        about = time.perf_counter() - start
+        brain.stdin.write("START 15\n")
+        brain.stdin.flush()
+        answer = brain.stdout.readline().strip()
+        ok = time.perf_counter() - start
+        if answer != "OK":
+            raise RuntimeError(f"unexpected answer to START: {answer!r}")
+        brain.stdin.write("END\n")
+        brain.stdin.flush()
+        brain.wait(timeout=10)
+    finally:
+        if brain.poll() is None:
+            brain.kill()
+    return about, ok
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Measure the startup time of the brain.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10, help="number of imports listed")
+    options = parser.parse_args(args)
+
+    print(f"{'module':<30} {'cumulative ms':>13}")
+    for name, cumulative in import_times("input_parser")[:options.top]:
+        print(f"{name:<30} {cumulative / 1000:>13.1f}")
+
+    runs = [time_to_first_ok() for _ in range(options.runs)]
+    about = statistics.median(run[0] for run in runs) * 1000
+    ok = statistics.median(run[1] for run in runs) * 1000
+    print(f"\nABOUT answered after {about:.1f} ms, START 15 after {ok:.1f} ms "
+          f"(median of {options.runs}, budget {options.budget_ms:.0f} ms)")
+    if ok > options.budget_ms:
+        print("over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# Nodes per second of the VCF / VCT threat-space search on random midgame positions.
+#
+# usage: python3 benchmarks/bench_threat_search.py [nb_positions]
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Board import Board
+from ThreatSpaceSearch import ThreatSpaceSearch
+
+
+def random_position(rng: random.Random, size: int = 20, nb_moves: int = 30) -> Board:
+    board = Board(size)
+    center = size // 2
+    for turn in range(nb_moves):
+        board.update_board('X' if turn % 2 == 0 else 'O', (center + rng.randint(-4, 4), center + rng.randint(-4, 4)))
+        if board.check_winner('X') or board.check_winner('O'):
+            board.pop()
+            break
+    return board
+
+
+def main(nb_positions: int):
+    rng = random.Random(2024)
+    solver = ThreatSpaceSearch()
+    for name, find in [("VCF", solver.find_vcf), ("VCT", solver.find_vct)]:
+        nodes, elapsed, found = 0, 0.0, 0
+        for _ in range(nb_positions):
+            board = random_position(rng)
+            if find(board, 'X') is not None:
+                found += 1
+            nodes += solver.get_stats()["nodes"]
+            elapsed += solver.get_stats()["elapsed"]
+        print(f"{name}: {found}/{nb_positions} wins found, {nodes} nodes in {elapsed:.2f} s, "
+              f"{nodes / elapsed if elapsed > 0 else 0:.0f} nodes/s")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
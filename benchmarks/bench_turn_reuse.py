@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Per-turn latency of the AI over recorded games (benchmarks/games/*.txt, one 'x,y' move per line, 'X' first),
+# with the search state kept between the turns and with every turn started from nothing (Ai.set_state_reuse).
+# At every ply the AI of the side to move chooses its move on the recorded position, then its move is replaced
+# by the recorded one, so both runs see the same positions whatever they play.
+#
+# usage: python3 benchmarks/bench_turn_reuse.py [GAME ...] [--mode MODE] [--ms N]
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI import Ai, HEURISTIC_MODE, MODES
+from Board import Board
+
+GAMES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games")
+
+
+def load_game(path: str) -> tuple(int, list[tuple(int, int)]):
+    """
+    :return: (board size, moves) of a recorded game, the size is read from the '# NxN' header, 15 without one
+    """
+    size = 15
+    moves = []
+    with open(path) as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith("#"):
+                header = line[1:].replace(",", " ").split()
+                if len(header) > 0 and "x" in header[0]:
+                    size = int(header[0].split("x")[0])
+            elif line != "":
+                x, y = line.split(",")
+                moves.append((int(x), int(y)))
+    return size, moves
+
+
+def replay(size: int, moves: list[tuple(int, int)], mode: str, ms: int, reuse: bool) -> tuple(list[float], dict):
+    """
+    :return: the latency of every turn in seconds and the statistics of the game state of 'X'
+    """
+    board = Board(size)
+    board.set_seed(0)
+    ais = {symbol: Ai(size, symbol, mode=mode) for symbol in ['X', 'O']}
+    for ai in ais.values():
+        ai.set_time_control(ms, 0, 2147483647)
+        ai.set_state_reuse(reuse)
+    latencies = []
+    symbol = 'X'
+    for move in moves:
+        start = time.perf_counter()
+        ais[symbol].play_best_move(board)
+        latencies.append(time.perf_counter() - start)
+        board.pop()
+        board.update_board(symbol, move)
+        symbol = 'O' if symbol == 'X' else 'X'
+    return latencies, ais['X'].get_game_state().get_stats()
+
+
+def main(args: argparse.Namespace) -> int:
+    paths = args.games or sorted(glob.glob(os.path.join(GAMES, "*.txt")))
+    print(f"{'game':>16} {'reuse':>6} {'turns':>6} {'mean ms':>8} {'median ms':>10} {'max ms':>8} {'total ms':>9} "
+          f"{'hit rate':>9}")
+    for path in paths:
+        size, moves = load_game(path)
+        for reuse in [True, False]:
+            latencies, stats = replay(size, moves, args.mode, args.ms, reuse)
+            print(f"{os.path.basename(path):>16} {'on' if reuse else 'off':>6} {len(latencies):>6} "
+                  f"{statistics.mean(latencies) * 1000:>8.2f} {statistics.median(latencies) * 1000:>10.2f} "
+                  f"{max(latencies) * 1000:>8.2f} {sum(latencies) * 1000:>9.1f} {stats['hit_rate'] * 100:>8.1f}%")
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Per-turn latency with and without search state reuse.")
+    parser.add_argument("games", nargs="*", help="recorded games, benchmarks/games/*.txt by default")
+    parser.add_argument("--mode", choices=MODES, default=HEURISTIC_MODE)
+    parser.add_argument("--ms", type=int, default=200, help="turn time of the timed modes in milliseconds")
+    sys.exit(main(parser.parse_args()))
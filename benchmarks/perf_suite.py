@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# Performance regression suite: times the hot paths of the brain on seeded opening, midgame and endgame positions
+# of 15, 20 and 50 cells boards, and whole protocol round trips through InputParser, then saves the results as a
+# JSON baseline or compares them with one.
+# Every case keeps the best of a few repeats, without garbage collection. A fixed pure Python workload is timed
+# with the cases, and the comparison divides every time by it, so a baseline recorded on another machine still gives
+# usable ratios (--raw compares the times themselves). A case is a regression when it is slower than the baseline by
+# more than the threshold, 1.0 (twice as slow) by default as shared machines easily vary by 50%: the default misses
+# every slowdown under 2x, lower it on a quiet machine. The exit code is 1 when there is a regression. Only the
+# standard library is used, nothing is downloaded.
+# A baseline is only meaningful on the machine it was recorded on, so none is tracked: make perf records
+# benchmarks/baselines/baseline.json on its first run, make perf-baseline records it again before changing the code.
+#
+# usage: python3 benchmarks/perf_suite.py [--sizes N ...] [--filter TEXT] [--repeat N] [--output FILE]
+#                                         [--compare BASELINE] [--threshold RATIO] [--raw]
+#        python3 benchmarks/perf_suite.py --output benchmarks/baselines/baseline.json
+#        python3 benchmarks/perf_suite.py --compare benchmarks/baselines/baseline.json
+from __future__ import annotations
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# the profiler would time itself into every move
+os.environ.pop("GOMOKU_PROFILE", None)
+
+from AI import Ai
+from Board import Board
+from Singleton import Singleton
+from input_parser import InputParser
+
+SIZES = [15, 20, 50]
+# Stones of each phase, played around the center of the board
+PHASES = {"opening": 4, "midgame": 30, "endgame": 120}
+DEFAULT_THRESHOLD = 1.0
+DEFAULT_REPEAT = 5
+# Shortest run of the fast cases, below it the timer resolution and the noise of the machine show in the ratios
+MIN_RUN_TIME = 0.005
+BOARD_CASES = ["check_winner", "block_threat_of_three", "copy_board", "get_empty_positions", "play_best_move"]
+
+
+def make_position(size: int, nb_stones: int, seed: int = 0) -> tuple(Board, str):
+    """
+    :return: a board with nb_stones stones played 'X' and 'O' alternately around the center, where no player can
+             make a five in one move, and the player to move
+    """
+    rng = random.Random(seed)
+    board = Board(size)
+    center = size // 2
+    # the stones are spread over a square large enough for them to stay below 2/3 of its cells
+    radius = min(center, max(2, int((nb_stones * 1.5) ** 0.5) // 2 + 1))
+    symbol = 'X'
+    while len(board.get_played_positions()) < nb_stones:
+        position = (center + rng.randint(-radius, radius), center + rng.randint(-radius, radius))
+        if not board.update_board(symbol, position):
+            continue
+        if len(board.get_winning_positions('X')) > 0 or len(board.get_winning_positions('O')) > 0:
+            board.pop()
+            continue
+        symbol = 'O' if symbol == 'X' else 'X'
+    return board, symbol
+
+
+def best_time(function, repeat: int, number: int = 0, setup=None) -> float:
+    """
+    :param function: called with the result of setup, or without arguments if there is no setup
+    :param number: calls of a run, 0 to double it until a run lasts MIN_RUN_TIME
+    :param setup: called before every run, outside of the timing
+    :return: the best time in seconds of one call over repeat runs of number calls, without garbage collection like
+             timeit
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _best_time(function, repeat, number, setup)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _best_time(function, repeat: int, number: int, setup) -> float:
+    if number == 0:
+        number = 1
+        start = time.perf_counter()
+        function()
+        while time.perf_counter() - start < MIN_RUN_TIME:
+            number *= 2
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+    best = float("inf")
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        for _ in range(number):
+            function(argument) if setup is not None else function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def calibrate(repeat: int) -> float:
+    """
+    :return: the best time in seconds of a fixed pure Python workload shaped like the board code (tuples, dicts,
+             lists, method calls), the unit the times are compared in
+    """
+    class Cells:
+        def __init__(self, size: int):
+            self.size = size
+            self.cells = [[None] * size for _ in range(size)]
+            self.index = {}
+
+        def play(self, position: tuple, symbol: str):
+            self.cells[position[0]][position[1]] = symbol
+            self.index[position] = symbol
+
+        def count(self, symbol: str) -> int:
+            return sum(1 for row in self.cells for cell in row if cell == symbol)
+
+    def workload():
+        cells = Cells(15)
+        for i in range(225):
+            cells.play((i % 15, (i * 7) % 15), 'X' if i % 2 == 0 else 'O')
+        copies = [[list(row) for row in cells.cells] for _ in range(4)]
+        return cells.count('X') + len(copies) + len(cells.index)
+
+    return best_time(workload, repeat)
+
+
+def board_cases(size: int, phase: str, repeat: int) -> dict:
+    """
+    :return: case name -> seconds for the board operations and one heuristic move on the position
+    """
+    board, symbol = make_position(size, PHASES[phase])
+    prefix = f"{size}/{phase}"
+    results = {
+        f"check_winner/{prefix}": best_time(lambda: board.check_winner(symbol), repeat),
+        f"block_threat_of_three/{prefix}": best_time(lambda: board.block_threat_of_three(symbol), repeat),
+        f"copy_board/{prefix}": best_time(board.copy_board, repeat),
+        f"get_empty_positions/{prefix}": best_time(board.get_empty_positions, repeat),
+    }
+
+    def play(ai: Ai):
+        ai.play_best_move(board)
+        board.pop()
+
+    # a new AI for every run, so no answer comes from the transposition table of a previous run
+    results[f"play_best_move/{prefix}"] = best_time(play, repeat, 1, setup=lambda: Ai(size, symbol))
+    return results
+
+
+def protocol_transcript(size: int) -> str:
+    """
+    :return: the lines a manager sends for a game: START, INFO, a BOARD with a midgame position, 3 TURN in the
+             corners, away from the moves of the brain, and END
+    """
+    board, _ = make_position(size, PHASES["midgame"])
+    lines = [f"START {size}", "INFO timeout_turn 1000", "BOARD"]
+    for i, position in enumerate(board.get_played_positions()):
+        lines.append(f"{position[0]},{position[1]},{1 if i % 2 == 1 else 2}")
+    lines.append("DONE")
+    lines += [f"TURN {x},{y}" for x, y in [(0, 0), (0, size - 1), (size - 1, 0)]]
+    lines.append("END")
+    return "\n".join(lines) + "\n"
+
+
+def protocol_case(size: int, repeat: int) -> dict:
+    """
+    :return: case name -> seconds of a whole transcript replayed through InputParser with the real AI
+    """
+    text = protocol_transcript(size)
+
+    def replay(_):
+        Singleton._instances.pop(InputParser, None)
+        parser = InputParser(io.StringIO(text), io.StringIO())
+        while parser.read_input():
+            pass
+
+    try:
+        return {f"protocol_round_trip/{size}": best_time(replay, repeat, 1, setup=lambda: None)}
+    finally:
+        Singleton._instances.pop(InputParser, None)
+
+
+def run(sizes: list[int], repeat: int, text_filter: str | None = None) -> dict:
+    """
+    :return: the report of a run: machine, calibration time and case name -> seconds
+    """
+    def wanted(names: list[str]) -> bool:
+        return text_filter is None or any(text_filter in name for name in names)
+
+    # warm up the interpreter and the machine, the first timings of a process are off
+    best_time(lambda: calibrate(1), 1, 20)
+    results = {}
+    calibrations = []
+    for size in sizes:
+        calibrations.append(calibrate(repeat))
+        for phase in PHASES:
+            if wanted([f"{case}/{size}/{phase}" for case in BOARD_CASES]):
+                results.update(board_cases(size, phase, repeat))
+        if wanted([f"protocol_round_trip/{size}"]):
+            results.update(protocol_case(size, repeat))
+    if text_filter is not None:
+        results = {name: seconds for name, seconds in results.items() if text_filter in name}
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "time": time.time(),
+        "calibration": min(calibrations + [calibrate(repeat)]),
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float, raw: bool = False) -> list[tuple]:
+    """
+    :param report: report of the current run
+    :param baseline: report loaded from a baseline file
+    :param threshold: slowdown ratio above which a case is a regression, 1.0 for twice as slow
+    :param raw: True to compare the times themselves instead of the times in calibration units
+    :return: (case, baseline seconds, current seconds, ratio, regression) of every case in both reports
+    """
+    scale = 1.0
+    if not raw and report.get("calibration") and baseline.get("calibration"):
+        scale = baseline["calibration"] / report["calibration"]
+    rows = []
+    for name, seconds in report["results"].items():
+        if name not in baseline["results"]:
+            continue
+        ratio = seconds * scale / baseline["results"][name]
+        rows.append((name, baseline["results"][name], seconds, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Time the hot paths of the brain and compare with a baseline.")
+    parser.add_argument("--sizes", nargs="*", type=int, default=SIZES)
+    parser.add_argument("--filter", help="only run the cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", help="JSON file the report is written to, e.g. a new baseline")
+    parser.add_argument("--compare", help="JSON baseline to compare the run with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio flagged as a regression, 1.0 for twice as slow: smaller slowdowns "
+                             "are not reported")
+    parser.add_argument("--raw", action="store_true", help="compare raw times, not calibrated ones")
+    options = parser.parse_args(args)
+
+    report = run(options.sizes, options.repeat, options.filter)
+    if options.output:
+        os.makedirs(os.path.dirname(os.path.abspath(options.output)), exist_ok=True)
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    if not options.compare:
+        print(f"{'case':<40} {'ms':>10}")
+        for name, seconds in report["results"].items():
+            print(f"{name:<40} {seconds * 1000:>10.4f}")
+        return 0
+
+    with open(options.compare) as file:
+        baseline = json.load(file)
+    rows = compare(report, baseline, options.threshold, options.raw)
+    # a regression is timed again with twice the repeats before being reported, one slow moment of the machine is
+    # not one
+    for name in [row[0] for row in rows if row[4]]:
+        size = int(name.split("/")[1])
+        again = run([size], options.repeat * 2, name)
+        report["results"][name] = min(report["results"][name], again["results"][name])
+    rows = compare(report, baseline, options.threshold, options.raw)
+    print(f"{'case':<40} {'baseline ms':>12} {'ms':>10} {'ratio':>7}")
+    for name, before, seconds, ratio, regression in rows:
+        print(f"{name:<40} {before * 1000:>12.4f} {seconds * 1000:>10.4f} {ratio:>7.2f}"
+              f"{'  REGRESSION' if regression else ''}")
+    regressions = [row for row in rows if row[4]]
+    print(f"{len(regressions)} regression(s) above {options.threshold * 100:.0f}% in {len(rows)} cases")
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
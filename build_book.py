@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# Build an opening book for OpeningBook from self-play games and/or from searches of the opening positions.
+#
+# --games: JSONL files written by selfplay.py; the moves of the winner during the first plies are counted,
+#          the book keeps the most played move of every position.
+# --search: every position reachable in --plies plies through the --width best distinct candidates of each side
+#           is searched to --depth plies, the book keeps the best move found, weighted by SEARCH_WEIGHT.
+# Every position is also stored with the colours swapped, so the book answers whichever player started.
+#
+# usage: python3 build_book.py OUTPUT [--games FILE ...] [--search] [--size N] [--plies N] [--width N] [--depth N]
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+import OpeningBook
+import Symmetry
+from Board import Board
+from Search import Search
+
+# Weight of a searched move, compared to the number of won games playing a move
+SEARCH_WEIGHT = 10
+
+
+def other(symbol: str) -> str:
+    return 'O' if symbol == 'X' else 'X'
+
+
+def swapped(board: Board) -> Board:
+    """
+    :return: a copy of the board with the 'X' and 'O' stones swapped
+    """
+    res = Board(board._board_size)
+    for position in board.get_played_positions():
+        res.update_board(other(board.get_row_col(position[0], position[1])), position)
+    return res
+
+
+def add_move(votes: dict, board: Board, symbol: str, move: tuple(int, int), weight: int):
+    """
+    :param votes: canonical hash -> {canonical move: weight}, updated for the position and its colour swap
+    :param board: position before the move
+    :param symbol: player of the move
+    :param move: move played
+    :param weight: weight added to the move
+    :return: None
+    """
+    for position, player in ((board, symbol), (swapped(board), other(symbol))):
+        key, symmetry = OpeningBook.book_key(position, player)
+        canonical_move = Symmetry.to_canonical(symmetry, move, board._board_size)
+        moves = votes.setdefault(key, {})
+        moves[canonical_move] = moves.get(canonical_move, 0) + weight
+
+
+def add_games(votes: dict, path: str, size: int, plies: int) -> int:
+    """
+    :param path: JSONL file written by selfplay.py
+    :return: number of games used, games of another size or without a winner are skipped
+    """
+    used = 0
+    with open(path) as file:
+        for line in file:
+            if line.strip() == "":
+                continue
+            game = json.loads(line)
+            if game.get("winner_symbol") is None or "line" not in game:
+                continue
+            board = Board(size)
+            moves = [tuple(move) for move in game["line"]]
+            if any(not board.is_position_in_range(move) for move in moves):
+                continue
+            symbol = 'X'
+            for move in moves[:plies]:
+                if symbol == game["winner_symbol"]:
+                    add_move(votes, board, symbol, move, 1)
+                board.update_board(symbol, move)
+                symbol = other(symbol)
+            used += 1
+    return used
+
+
+def add_searches(votes: dict, size: int, plies: int, width: int, depth: int, weight: int) -> int:
+    """
+    :return: number of positions searched
+    """
+    search = Search()
+    board = Board(size)
+    center = (size // 2, size // 2)
+    seen = set()
+    searched = 0
+
+    def expand(symbol: str, ply: int) -> bool:
+        """
+        :return: False if the position, or a symmetric one, has already been expanded
+        """
+        nonlocal searched
+        key = OpeningBook.book_key(board, symbol)[0]
+        if key in seen:
+            return False
+        seen.add(key)
+        if ply == 0:
+            best, candidates = center, [center]
+        else:
+            best = search.search(board, symbol, time.perf_counter() + 3600, depth)
+            candidates = search.order_moves(board, symbol, search.get_candidates(board, symbol), best)
+        if best is None:
+            return True
+        add_move(votes, board, symbol, best, weight)
+        searched += 1
+        if ply + 1 >= plies:
+            return True
+        expanded = 0
+        for move in candidates:
+            if expanded >= width:
+                break
+            with board.trial(symbol, move):
+                if not board.check_winner(symbol) and expand(other(symbol), ply + 1):
+                    expanded += 1
+        return True
+
+    expand('X', 0)
+    return searched
+
+
+def best_moves(votes: dict) -> dict:
+    """
+    :return: canonical hash -> (row, column, weight) of the move with the highest weight, ties broken by position
+    """
+    entries = {}
+    for key, moves in votes.items():
+        move = min(moves, key=lambda candidate: (-moves[candidate], candidate))
+        entries[key] = (move[0], move[1], moves[move])
+    return entries
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Build an opening book from self-play games and searches.")
+    parser.add_argument("output")
+    parser.add_argument("--games", nargs="*", default=[], help="JSONL files written by selfplay.py")
+    parser.add_argument("--search", action="store_true", help="add the best moves of searched opening positions")
+    parser.add_argument("--size", type=int, default=15)
+    parser.add_argument("--plies", type=int, default=4, help="number of plies covered by the book")
+    parser.add_argument("--width", type=int, default=3, help="candidates expanded per position with --search")
+    parser.add_argument("--depth", type=int, default=2, help="depth of the searches with --search")
+    options = parser.parse_args(args)
+    votes: dict = {}
+    for path in options.games:
+        print(f"{path}: {add_games(votes, path, options.size, options.plies)} games", file=sys.stderr)
+    if options.search:
+        searched = add_searches(votes, options.size, options.plies, options.width, options.depth, SEARCH_WEIGHT)
+        print(f"search: {searched} positions", file=sys.stderr)
+    entries = best_moves(votes)
+    OpeningBook.write_book(options.output, entries)
+    print(f"{options.output}: {len(entries)} positions", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
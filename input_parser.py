@@ -1,12 +1,23 @@
-import re
+from __future__ import annotations
+
 import sys
 from Singleton import Singleton
 from AI import Ai
 from Board import Board
+from backends import get_board_class, DEFAULT_BACKEND
+from OpeningBook import get_book_path
+from Profiler import get_profile_path
+from Protocol import BLOCK_COMMANDS, CommandReader, Output, parse_stones
+
+# Board sizes accepted by START
+MIN_BOARD_SIZE = 5
+MAX_BOARD_SIZE = 100
 
 
 class InputParser(metaclass=Singleton):
-    def __init__(self):
+    def __init__(self, stdin=None, stdout=None):
+        self._reader = CommandReader(stdin)
+        self._output = Output(stdout)
         self.timeout_turn = 5000
         self.timeout_match = 0
         self.max_memory = 70000000
@@ -15,29 +26,37 @@ class InputParser(metaclass=Singleton):
         self.rule = 0
         self.evaluate = (0, 0)
         self.folder = "./"
+        self.ai_mode = "heuristic"
+        self.workers = 1
+        self.board_backend = DEFAULT_BACKEND
+        self.profile = 0
+        self.ponder = 0
+        self.reuse_state = 1
+        # 1 for the search mode to score its leaves with the pattern evaluator instead of the line scores
+        self.evaluate_leaves = 0
+        # seed of the random moves, from the command line or INFO seed, -1 to seed from the system
+        self.seed = -1
         self.game_board: Board = None
         self.ai: Ai = None
 
     def are_io_open(self) -> bool:
-        try:
-            sys.stdin.fileno()
-            sys.stdout.fileno()
-            sys.stderr.fileno()
-            return True
-        except ValueError:
-            return False
+        return self._reader.is_open() and self._output.is_open() and not sys.stderr.closed
 
     def start(self, size: str = "15") -> bool:
-        supported_sizes = [i for i in range(25)]
-        if int(size) in supported_sizes:
+        if MIN_BOARD_SIZE <= int(size) <= MAX_BOARD_SIZE:
             try:
-                self.game_board = Board(int(size))
-                self.ai = Ai(int(size), 'X')
+                if self.ai != None:
+                    self.ai.stop_workers()
+                self.game_board = get_board_class(self.board_backend)(int(size))
+                self.ai = Ai(int(size), 'X', self.max_memory)
+                self._configure_all()
+                self._seed_game()
+                self.ai.start_workers()
             except TypeError:
                 return False
-            print("OK")
+            self._output.write("OK")
         else:
-            print("ERROR unsupported size")
+            self._output.write("ERROR unsupported size")
         return True
 
     def turn(self, x: str = "0", y: str = "0") -> bool:
@@ -47,52 +66,214 @@ class InputParser(metaclass=Singleton):
         except TypeError:
             return False
         self.game_board.update_board(self.ai.get_opponent_symbol(), (x, y))
-        x, y = self.ai.play_best_move(self.game_board)
-        print(x, y, sep=',')
+        self._play()
         return True
 
     def begin(self) -> bool:
         if self.ai == None:
             return False
-        x, y = self.ai.play_best_move(self.game_board)
-        print(x, y, sep=',')
+        self._play()
         return True
 
-    def board(self) -> bool:
-        pos = input()
-        while pos != "DONE":
-            try:
-                x, y, player = list(map(int ,pos.split(",")))
-            except Exception:
-                pass
-            if player == 1:
-                self.game_board.update_board(self.ai.get_symbol(), (x, y))
-            if player == 2:
-                self.game_board.update_board(self.ai.get_opponent_symbol(), (x, y))
-            pos = input()
-        x, y = self.ai.play_best_move(self.game_board)
-        print(x, y, sep=',')
+    def board(self, lines: list[str] = ()) -> bool:
+        if self.ai == None:
+            return False
+        symbols = {1: self.ai.get_symbol(), 2: self.ai.get_opponent_symbol()}
+        stones, malformed = parse_stones(lines)
+        for line in malformed:
+            self._output.write("DEBUG malformed BOARD line:", line)
+        for x, y, player in stones:
+            if player not in symbols:
+                self._output.write(f"DEBUG unknown player in BOARD line: {x},{y},{player}")
+        self.game_board.reset_board()
+        self.ai.new_game()
+        rejected = self.game_board.load_stones([((x, y), symbols[player]) for x, y, player in stones
+                                                if player in symbols])
+        for (x, y), _ in rejected:
+            self._output.write(f"DEBUG invalid BOARD position: {x},{y}")
+        self._play()
+        return True
+
+    def restart(self) -> bool:
+        if self.ai == None:
+            return False
+        self.game_board.reset_board()
+        self.ai.new_game()
+        self._seed_game()
+        self._output.write("OK")
         return True
 
+    def _play(self):
+        x, y = self.ai.play_best_move(self.game_board)
+        self._output.write(x, y, sep=',')
+        self._output.flush()
+        self.ai.start_pondering(self.game_board)
+
     def info(self, key: str = "folder", value: str = "./") -> bool:
-        if key not in self.__dict__:
+        if key not in self.INFO_KEYS:
             return True
-        self.__dict__[key] = value
+        if isinstance(getattr(self, key), int):
+            try:
+                value = int(value)
+            except ValueError:
+                return True
+        # the seed restarts the random streams even when it is the same
+        if getattr(self, key) == value and key != "seed":
+            return True
+        setattr(self, key, value)
+        configure = self.INFO_KEYS[key]
+        if configure != None:
+            configure(self)
         return True
 
+    def _seed_game(self):
+        """
+        :return: None, restart the random streams of the board and the AI from the seed, if there is one
+        """
+        if self.game_board == None or self.ai == None or self.seed < 0:
+            return
+        self.game_board.set_seed(self.seed)
+        self.ai.set_seed(self.seed)
+
+    def _configure_board(self):
+        if self.game_board == None:
+            return
+        board_class = get_board_class(self.board_backend)
+        if type(self.game_board) != board_class:
+            self.game_board = board_class.deserialize(self.game_board.serialize())
+            self._seed_game()
+
+    def _configure_ai(self):
+        if self.ai == None:
+            return
+        self.ai.set_max_memory(self.max_memory)
+        self.ai.set_mode(self.ai_mode)
+        self.ai.set_workers(self.workers)
+
+    def _configure_time(self):
+        if self.ai != None:
+            self.ai.set_time_control(self.timeout_turn, self.timeout_match, self.time_left)
+
+    def _configure_pondering(self):
+        if self.ai != None:
+            self.ai.set_pondering(self.ponder != 0)
+
+    def _configure_state_reuse(self):
+        if self.ai != None:
+            self.ai.set_state_reuse(self.reuse_state != 0)
+
+    def _configure_leaf_evaluation(self):
+        if self.ai != None:
+            self.ai.set_leaf_evaluation(self.evaluate_leaves != 0)
+
+    def _configure_files(self):
+        if self.ai == None:
+            return
+        self.ai.set_book_path(get_book_path(self.folder))
+        self.ai.set_profile_path(get_profile_path(self.folder if self.profile else None))
+
+    def _configure_all(self):
+        self._configure_ai()
+        self._configure_time()
+        self._configure_pondering()
+        self._configure_state_reuse()
+        self._configure_leaf_evaluation()
+        self._configure_files()
+
+    # INFO key -> method applying its new value, None for the keys only stored; the other keys are ignored
+    INFO_KEYS = {
+        "timeout_turn": _configure_time,
+        "timeout_match": _configure_time,
+        "time_left": _configure_time,
+        "max_memory": _configure_ai,
+        "ai_mode": _configure_ai,
+        "workers": _configure_ai,
+        "ponder": _configure_pondering,
+        "reuse_state": _configure_state_reuse,
+        "evaluate_leaves": _configure_leaf_evaluation,
+        "folder": _configure_files,
+        "profile": _configure_files,
+        "board_backend": _configure_board,
+        "seed": _seed_game,
+        "game_type": None,
+        "rule": None,
+        "evaluate": None,
+    }
+
     def end(self) -> bool:
+        if self.ai != None:
+            self.ai.stop_pondering()
+            self.ai.stop_workers()
         return False
 
     def about(self) -> bool:
-        print('name="gomoku-ai", version="1.0", author="Paul-Tanguy & EnzoHaegel", country="France"')
+        self._output.write('name="gomoku-ai", version="1.0", author="Paul-Tanguy & EnzoHaegel", country="France"')
         return True
 
+    # command -> handler, the commands of BLOCK_COMMANDS get the lines of their block
+    COMMANDS = {
+        "start": start,
+        "turn": turn,
+        "begin": begin,
+        "restart": restart,
+        "board": board,
+        "info": info,
+        "end": end,
+        "about": about,
+    }
+
+    def execute(self, func: str, arguments: list[str], block: list[str] = ()) -> bool:
+        """
+        :param func: command in lower case
+        :param arguments: arguments of the command
+        :param block: lines of the block of a command of BLOCK_COMMANDS
+        :return: False if the brain must stop; the replies are flushed once, when the command is done
+        """
+        if self.ai != None:
+            self.ai.stop_pondering()
+        handler = self.COMMANDS.get(func)
+        if handler == None:
+            return False
+        try:
+            if func in BLOCK_COMMANDS:
+                return handler(self, block, *arguments)
+            return handler(self, *arguments)
+        finally:
+            self._output.flush()
+
     def read_input(self) -> bool:
         if not self.are_io_open():
             return False
-        func, *arguments = re.split('[\\s,]', input())
-        func = func.lower()
-
-        if func not in [method for method in dir(InputParser) if not method.startswith('__')]:
+        command = self._reader.read()
+        if command == None:
             return False
-        return getattr(self, func)(*arguments)
+        return self.execute(*command)
+
+    async def run_async(self, reader=None):
+        """
+        :param reader: asyncio.StreamReader of the manager's input, None to read sys.stdin
+        :return: None, when END is received or the input is closed; the commands run in a worker thread
+                 so the event loop keeps reading the input during a search
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if reader == None:
+            reader = asyncio.StreamReader()
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        commands: asyncio.Queue = asyncio.Queue()
+
+        async def watch():
+            while True:
+                command = await self._reader.read_async(reader)
+                await commands.put(command)
+                if command == None:
+                    return
+
+        watcher = asyncio.create_task(watch())
+        try:
+            while True:
+                command = await commands.get()
+                if command == None or not await loop.run_in_executor(None, self.execute, *command):
+                    return
+        finally:
+            watcher.cancel()
@@ -7,14 +7,17 @@ from input_parser import InputParser
 def usage(reason, exit_code):
     print(f'\033[91m\033[1m' + reason + '\033[0m')
     print("USAGE")
-    print("")
+    print("    ./pbrain-gomoku-ai [--seed N]")
     print("DESCRIPTION")
+    print("    --seed N    seed of the random moves, for reproducible games (also INFO seed N)")
     sys.exit(exit_code)
 
 
-def gomoku(args) -> int:
+def gomoku(seed) -> int:
     if not InputParser().are_io_open():
         return 84
+    if seed != None:
+        InputParser().seed = seed
     playing = True
 
     while playing:
@@ -26,9 +29,12 @@ def main(args):
     try:
         if "-h" in args:
             usage("Help:", 0)
-        if len(args) != 0:
+        seed = None
+        if len(args) == 2 and args[0] == "--seed":
+            seed = int(args[1])
+        elif len(args) != 0:
             usage("Bad number of arguments", 84)
-        gomoku(args)
+        gomoku(seed)
     except ValueError:
         usage("Value Error", 84)
     except RecursionError:
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# Batch self-play: play many games between two AI configurations in worker processes and aggregate the results.
+#
+# Every game is seeded (seed + game number) so it can be replayed alone, and the two configurations swap
+# colours every game. One JSON line per game is written as soon as it ends, to stdout by default, then a summary
+# gives the score of A against B with its 95% confidence interval, as a win rate and as an Elo difference. The boards
+# and the summary go to stderr, so stdout stays a JSONL stream.
+#
+# usage: python3 selfplay.py [--games N] [--workers N] [--size N] [--seed N] [--output FILE] [--quiet]
+#                            [-a CONFIG] [-b CONFIG]
+#        CONFIG is a mode ('heuristic', 'search' or 'mcts') with an optional turn time in ms, e.g. 'search:200'
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import multiprocessing
+import sys
+import time
+
+from AI import Ai, MODES
+from Board import Board
+
+# z value of a two-sided 95% confidence interval
+Z_95 = 1.96
+
+
+def parse_config(config: str) -> dict:
+    """
+    :param config: 'mode' or 'mode:timeout_turn' with timeout_turn in milliseconds
+    :return: the configuration as a dict with the keys 'name', 'mode' and 'timeout_turn'
+    """
+    mode, _, timeout = config.partition(':')
+    if mode not in MODES:
+        raise ValueError(f"unknown mode '{mode}'")
+    return {"name": config, "mode": mode, "timeout_turn": int(timeout) if timeout else 0}
+
+
+def create_ai(config: dict, size: int, symbol: str) -> Ai:
+    """
+    :param config: configuration returned by parse_config
+    :param size: size of the board
+    :param symbol: symbol of the AI
+    :return: an AI playing symbol with the configuration
+    """
+    ai = Ai(size, symbol, mode=config["mode"])
+    ai.set_time_control(config["timeout_turn"], 0, 2147483647)
+    return ai
+
+
+def play_game(task: tuple) -> dict:
+    """
+    :param task: (game number, seed, size, configuration of A, configuration of B, quiet)
+    :return: the result of the game: winner ('A', 'B' or None), symbols, number of moves, moves played ('X' first)
+             and mean time per move
+    """
+    game, seed, size, config_a, config_b, quiet = task
+    a_symbol = 'X' if game % 2 == 0 else 'O'
+    configs = {a_symbol: config_a, ('O' if a_symbol == 'X' else 'X'): config_b}
+    board = Board(size)
+    board.set_seed(seed)
+    ais = {symbol: create_ai(config, size, symbol) for symbol, config in configs.items()}
+    # each side draws its own random sequence, also when both have the same configuration
+    ais['X'].set_seed(seed * 2)
+    ais['O'].set_seed(seed * 2 + 1)
+    times = {'X': [], 'O': []}
+    symbol = 'X'
+    winner = None
+    moves = 0
+    line = []
+    while not board.is_full():
+        start = time.perf_counter()
+        move = ais[symbol].play_best_move(board)
+        times[symbol].append(time.perf_counter() - start)
+        if move is None:
+            break
+        moves += 1
+        line.append(move)
+        if not quiet:
+            with contextlib.redirect_stdout(sys.stderr):
+                board.print_board()
+        if board.check_winner(symbol):
+            winner = symbol
+            break
+        symbol = 'O' if symbol == 'X' else 'X'
+    return {
+        "game": game,
+        "seed": seed,
+        "x": configs['X']["name"],
+        "o": configs['O']["name"],
+        "a_symbol": a_symbol,
+        "winner": None if winner is None else 'A' if winner == a_symbol else 'B',
+        "winner_symbol": winner,
+        "moves": moves,
+        "line": line,
+        "time_per_move": {s: sum(t) / len(t) if len(t) > 0 else 0.0 for s, t in times.items()},
+    }
+
+
+def elo(score: float) -> float:
+    """
+    :param score: expected score between 0 and 1
+    :return: the Elo difference giving this expected score, infinite at 0 and 1
+    """
+    if score <= 0.0:
+        return -math.inf
+    if score >= 1.0:
+        return math.inf
+    if score == 0.5:
+        return 0.0
+    return -400 * math.log10(1 / score - 1)
+
+
+def summarize(results: list[dict]) -> dict:
+    """
+    :param results: results returned by play_game
+    :return: wins, losses and draws of A, its score and Elo difference against B with their 95% confidence intervals
+    """
+    games = len(results)
+    wins = sum(1 for result in results if result["winner"] == 'A')
+    losses = sum(1 for result in results if result["winner"] == 'B')
+    draws = games - wins - losses
+    score = (wins + draws / 2) / games if games > 0 else 0.5
+    if games > 1:
+        variance = (wins * (1 - score) ** 2 + losses * score ** 2 + draws * (0.5 - score) ** 2) / (games - 1)
+        margin = Z_95 * math.sqrt(variance / games)
+    else:
+        margin = 0.5
+    low, high = max(0.0, score - margin), min(1.0, score + margin)
+    return {
+        "games": games,
+        "wins": wins,
+        "losses": losses,
+        "draws": draws,
+        "score": score,
+        "score_ci": (low, high),
+        "elo": elo(score),
+        "elo_ci": (elo(low), elo(high)),
+        "mean_moves": sum(result["moves"] for result in results) / games if games > 0 else 0.0,
+    }
+
+
+def print_summary(summary: dict, config_a: dict, config_b: dict):
+    print(f"A = {config_a['name']}, B = {config_b['name']}, {summary['games']} games", file=sys.stderr)
+    print(f"A wins {summary['wins']}, loses {summary['losses']}, draws {summary['draws']},"
+          f" mean game length {summary['mean_moves']:.1f} moves", file=sys.stderr)
+    print(f"score of A: {summary['score'] * 100:.1f}%"
+          f" (95% CI {summary['score_ci'][0] * 100:.1f}% - {summary['score_ci'][1] * 100:.1f}%)", file=sys.stderr)
+    print(f"Elo of A - B: {summary['elo']:+.0f} (95% CI {summary['elo_ci'][0]:+.0f} - {summary['elo_ci'][1]:+.0f})",
+          file=sys.stderr)
+
+
+def run(games: int, workers: int, size: int, seed: int, config_a: dict, config_b: dict, output, quiet: bool) -> dict:
+    """
+    :param output: file the results are written to, one JSON line per game in the order the games end
+    :param quiet: if False and there is a single worker, print the board after every move on stderr
+    :return: the summary of the games
+    """
+    tasks = [(game, seed + game, size, config_a, config_b, quiet or workers > 1) for game in range(games)]
+    results = []
+    if workers <= 1:
+        outcomes = map(play_game, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        outcomes = pool.imap_unordered(play_game, tasks)
+    try:
+        for result in outcomes:
+            results.append(result)
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            if not quiet:
+                print(f"game {result['game']}: winner {result['winner']} in {result['moves']} moves", file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+    return summarize(results)
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="Play AI against AI games and aggregate the results.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--size", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="JSONL file of the results, '-' for stdout")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    parser.add_argument("-a", default="heuristic", help="configuration of A, e.g. 'heuristic' or 'search:200'")
+    parser.add_argument("-b", default="heuristic", help="configuration of B")
+    options = parser.parse_args(args)
+    try:
+        config_a, config_b = parse_config(options.a), parse_config(options.b)
+    except ValueError as error:
+        parser.error(str(error))
+    output = sys.stdout if options.output == "-" else open(options.output, "w")
+    try:
+        summary = run(options.games, options.workers, options.size, options.seed, config_a, config_b, output,
+                      options.quiet)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print_summary(summary, config_a, config_b)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -49,3 +49,60 @@ def test_can_do_a_double_threat():
     board.update_board('X', (2, 4))
     board.update_board('X', (6, 4))
     assert ai.can_do_a_double_threat(board, 'X') == (4, 3)
+
+def test_no_board_copy_during_move_selection(monkeypatch):
+    def forbidden_copy(self):
+        raise AssertionError("copy_board called during move selection")
+    monkeypatch.setattr(Board, "copy_board", forbidden_copy)
+    board = Board(9)
+    ai = Ai(board._board_size, 'O')
+    board.update_board('X', (3, 2))
+    board.update_board('X', (2, 3))
+    board.update_board('X', (2, 4))
+    board.update_board('X', (3, 4))
+    board.update_board('O', (5, 5))
+    empty_before = len(board.get_empty_positions())
+    ai.play_best_move(board)
+    assert len(board.get_empty_positions()) == empty_before - 1
+
+def test_transposition_table_cache():
+    board = Board(9)
+    ai = Ai(board._board_size, 'X')
+    for i in range(4):
+        board.update_board('X', (2, i + 2))
+    stats = ai.get_transposition_table().stats()
+    assert stats["hits"] == 0 and stats["misses"] == 0
+    assert ai.get_winning_move(board, 'X') == (2, 1)
+    assert ai.get_winning_move(board, 'X') == (2, 1)
+    assert ai.get_winning_move(board, 'O') == None
+    stats = ai.get_transposition_table().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    with board.trial('O', (2, 1)):
+        assert ai.get_winning_move(board, 'X') == (2, 6)
+    assert ai.get_winning_move(board, 'X') == (2, 1)
+
+
+def test_double_threat_on_a_large_board():
+    board = Board(100)
+    ai = Ai(board._board_size, 'O')
+    for position in [(53, 52), (52, 53), (52, 54), (53, 54)]:
+        board.update_board('X', position)
+    assert ai.can_do_a_double_threat(board, 'X') == (51, 54)
+    assert board.check_winner('X') == False
+
+
+def test_parts_are_created_on_first_use():
+    ai = Ai(15, 'X')
+    ai.set_seed(4)
+    ai.set_book_path("missing_book.bin")
+    assert ai._search is None and ai._mcts is None and ai._evaluator is None and ai._ponder is None
+    assert ai._threat_search is None and ai._state is None and ai._book is None
+    ai.new_game()
+    board = Board(15)
+    board.update_board('O', (7, 7))
+    ai.play_best_move(board)
+    assert ai._mcts is None and ai._search is None and ai._ponder is None
+    other = Ai(15, 'X')
+    other.get_mcts().set_seed(4)
+    assert ai.get_mcts()._random.random() == other.get_mcts()._random.random()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import random
+
+from AI import Ai
+from Board import Board
+from BitBoard import BitBoard
+
+
+def play_random_game(size: int, seed: int, nb_moves: int) -> tuple(Board, BitBoard):
+    rng = random.Random(seed)
+    board = Board(size)
+    bit_board = BitBoard(size)
+    symbol = 'X'
+    positions = [(i, j) for i in range(size) for j in range(size)]
+    rng.shuffle(positions)
+    for position in positions[:nb_moves]:
+        assert board.update_board(symbol, position) == bit_board.update_board(symbol, position)
+        assert board.check_winner('X') == bit_board.check_winner('X')
+        assert board.check_winner('O') == bit_board.check_winner('O')
+        symbol = 'O' if symbol == 'X' else 'X'
+    return board, bit_board
+
+
+def test_class_BitBoard():
+    board = BitBoard(7)
+    assert board._board == [[None for _ in range(7)] for _ in range(7)]
+    assert board.update_board('X', (0, 0))
+    assert not board.update_board('O', (0, 0))
+    assert board.get_row_col(0, 0) == 'X'
+    assert board._last_X_played == (0, 0)
+    assert not board.is_valid_move((7, 7))
+
+
+def test_check_winner_all_directions():
+    for direction in [(1, 0), (0, 1), (1, 1), (-1, 1)]:
+        board = BitBoard(9)
+        start = (4, 0) if direction[0] == -1 else (0, 0)
+        for k in range(5):
+            assert not board.check_winner('X')
+            board.update_board('X', (start[0] + k * direction[0], start[1] + k * direction[1]))
+        assert board.check_winner('X')
+        assert not board.check_winner('O')
+
+
+def test_no_wrap_between_lines():
+    board = BitBoard(7)
+    for position in [(0, 4), (0, 5), (0, 6), (1, 0), (1, 1)]:
+        board.update_board('X', position)
+    assert not board.check_winner('X')
+    board.reset_board()
+    for position in [(4, 6), (5, 6), (6, 6), (0, 0), (1, 0)]:
+        board.update_board('X', position)
+    assert not board.check_winner('X')
+
+
+def test_parity_with_Board():
+    for seed in range(30):
+        size = 6 + seed % 10
+        board, bit_board = play_random_game(size, seed, size * size)
+        assert board.get_empty_positions() == bit_board.get_empty_positions()
+        assert board.is_full() == bit_board.is_full()
+        copy = bit_board.copy_board()
+        assert copy.get_board() == board.get_board()
+        assert copy.check_winner('X') == board.check_winner('X')
+
+
+def test_is_full_BitBoard():
+    board = BitBoard(5)
+    assert not board.is_full()
+    for i in range(5):
+        for j in range(5):
+            board.update_board('X', (i, j))
+    assert board.is_full()
+    board.reset_board()
+    assert not board.is_full()
+    assert not board.check_winner('X')
+
+
+def test_ai_on_BitBoard():
+    board = BitBoard(6)
+    ai = Ai(board._board_size, 'X')
+    for i in range(4):
+        board.update_board('X', (i, i))
+        board.update_board('O', (i + 1, 0))
+    assert ai.get_winning_move(board, 'X') == (4, 4)
+    assert ai.get_opponent_winning_move(board) == (5, 0)
+    assert ai.play_best_move(board) == (4, 4)
+    assert board.check_winner('X')
+
+
+def test_pop_restores_winner():
+    board = BitBoard(7)
+    for i in range(4):
+        board.update_board('X', (i, 0))
+    with board.trial('X', (4, 0)) as played:
+        assert played
+        assert board.check_winner('X')
+    assert not board.check_winner('X')
+    assert board.get_row_col(4, 0) == None
+    assert len(board._empty) == 7 * 7 - 4
+
+
+def test_load_stones():
+    board, bit_board = play_random_game(11, 4, 60)
+    loaded = BitBoard(11)
+    stones = [(position, board.get_row_col(position[0], position[1])) for position in board.get_played_positions()]
+    assert loaded.load_stones(stones) == []
+    assert loaded.get_empty_positions() == bit_board.get_empty_positions()
+    for symbol in ['X', 'O']:
+        assert loaded.check_winner(symbol) == bit_board.check_winner(symbol)
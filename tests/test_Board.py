@@ -142,3 +142,185 @@ def test_block_threat_of_three():
     board.update_board('X', (5, 5))
     assert board.block_threat_of_three('X') == ((4, 4), [(4, 4)])
 
+
+def test_push_pop():
+    board = Board(7)
+    assert board.pop() == None
+    assert board.push('X', (0, 0))
+    assert board.push('O', (1, 1))
+    assert not board.push('X', (1, 1))
+    assert board.push('X', (2, 2))
+    assert board._last_X_played == (2, 2)
+    assert board.pop() == (2, 2)
+    assert board.get_row_col(2, 2) == None
+    assert board._last_X_played == (0, 0)
+    assert board.pop() == (1, 1)
+    assert board._last_O_played == None
+    assert board.pop() == (0, 0)
+    assert board._last_X_played == None
+    assert board.get_board() == Board(7).get_board()
+
+def test_trial():
+    board = Board(7)
+    board.update_board('X', (3, 3))
+    with board.trial('O', (3, 4)) as played:
+        assert played
+        assert board.get_row_col(3, 4) == 'O'
+        assert board._last_O_played == (3, 4)
+    assert board.get_row_col(3, 4) == None
+    assert board._last_O_played == None
+    with board.trial('O', (3, 3)) as played:
+        assert not played
+    assert board.get_row_col(3, 3) == 'X'
+    try:
+        with board.trial('O', (0, 0)):
+            raise ValueError
+    except ValueError:
+        pass
+    assert board.get_row_col(0, 0) == None
+
+def test_copy_board():
+    board = Board(7)
+    board.update_board('X', (5, 5))
+    board.update_board('X', (0, 0))
+    board.update_board('O', (1, 1))
+    copy = board.copy_board()
+    assert copy.get_board() == board.get_board()
+    assert copy._last_X_played == (0, 0)
+    copy.update_board('O', (2, 2))
+    assert board.get_row_col(2, 2) == None
+
+def test_serialize():
+    board = Board(9)
+    board.update_board('X', (4, 4))
+    board.update_board('O', (0, 8))
+    board.update_board('X', (8, 0))
+    data = board.serialize()
+    assert data == bytes([9, 4, 4, 1, 0, 8, 2, 8, 0, 1])
+    copy = Board.deserialize(data)
+    assert copy.get_board() == board.get_board()
+    assert copy.get_hash() == board.get_hash()
+    assert copy._last_X_played == (8, 0)
+
+
+def test_seeded_random_play():
+    moves = []
+    for _ in range(2):
+        board = Board(9)
+        board.set_seed(42)
+        moves.append([board.random_play('X') for _ in range(20)] + [board.is_one_side_tile_empty((4, 4))])
+    assert moves[0] == moves[1]
+
+
+def test_empty_cells_follow_the_moves():
+    import random
+    rng = random.Random(5)
+    board = Board(10)
+    for _ in range(300):
+        if rng.random() < 0.3:
+            board.pop()
+        else:
+            board.update_board(rng.choice(['X', 'O', None]), (rng.randrange(10), rng.randrange(10)))
+        assert sorted(divmod(index, 10) for index in board._empty) == board.get_empty_positions()
+    board.reset_board()
+    assert len(board._empty) == 100
+
+
+def test_random_play_on_a_nearly_full_board():
+    board = Board(50)
+    free = [(3, 4), (49, 49), (25, 25)]
+    board.load_stones([((i, j), 'X' if (i + j // 2) % 2 == 0 else 'O') for i in range(50) for j in range(50)
+                       if (i, j) not in free])
+    board.set_seed(1)
+    played = [board.random_play('X') for _ in range(3)]
+    assert sorted(played) == sorted(free)
+    assert board.is_full()
+    assert board.random_play('X') == None
+
+
+def brute_force_frontier(board: Board, distance: int) -> list:
+    size = board._board_size
+    return [(i, j) for i in range(size) for j in range(size) if board.get_row_col(i, j) == None
+            and any(board.get_row_col(k, l) != None for k in range(max(0, i - distance), min(size, i + distance + 1))
+                    for l in range(max(0, j - distance), min(size, j + distance + 1)))]
+
+
+def test_frontier_follows_push_and_pop():
+    import random
+    rng = random.Random(3)
+    board = Board(8)
+    for step in range(300):
+        if len(board.get_played_positions()) > 0 and rng.random() < 0.4:
+            board.pop()
+        else:
+            board.push(rng.choice(['X', 'O']), (rng.randrange(8), rng.randrange(8)))
+        for distance in [1, 2]:
+            assert board.get_frontier(distance) == brute_force_frontier(board, distance)
+    board.reset_board()
+    assert board.get_frontier() == []
+
+
+def test_neighbours_do_not_wrap_around_the_edges():
+    board = Board(9)
+    board.update_board('X', (8, 8))
+    for position in [(0, 0), (0, 8), (8, 0), (0, 7), (7, 0)]:
+        assert not board.check_if_there_is_symbol_next(position)
+        assert not board.check_if_there_is_symbol_next_two(position)
+    board.update_board('O', (0, 4))
+    assert not board.check_if_there_is_symbol_next((8, 4))
+    assert not board.check_if_there_is_symbol_next_two((7, 4))
+    assert board.check_if_there_is_symbol_next((1, 3))
+    assert board.check_if_there_is_symbol_next_two((2, 6))
+    assert board.get_neighbour_count((7, 7), 1) == 1
+    assert board.get_neighbour_count((6, 6), 2) == 1
+    assert not board.check_if_there_is_symbol_next((9, 9))
+
+
+def test_load_stones_matches_update_board():
+    import random
+    for seed in range(20):
+        rng = random.Random(seed)
+        size = 6 + seed % 10
+        stones = [((rng.randrange(size + 1), rng.randrange(size)), rng.choice(['X', 'O'])) for _ in range(size * 2)]
+        played = Board(size)
+        played.update_board('O', (0, 0))
+        expected = [stone for stone in stones if not played.update_board(stone[1], stone[0])]
+        loaded = Board(size)
+        loaded.update_board('O', (0, 0))
+        assert loaded.load_stones(stones) == expected
+        assert loaded.get_board() == played.get_board()
+        assert loaded.get_played_positions() == played.get_played_positions()
+        assert loaded.get_hash() == played.get_hash()
+        assert loaded.get_symmetric_hashes() == played.get_symmetric_hashes()
+        assert (loaded._last_X_played, loaded._last_O_played) == (played._last_X_played, played._last_O_played)
+        for distance in [1, 2]:
+            assert loaded.get_frontier(distance) == played.get_frontier(distance)
+        for symbol in ['X', 'O']:
+            assert loaded.get_line_score(symbol) == played.get_line_score(symbol)
+            assert loaded.block_threat_of_three(symbol) == played.block_threat_of_three(symbol)
+            assert loaded.get_four_making_positions(symbol) == played.get_four_making_positions(symbol)
+        while loaded.pop() is not None:
+            pass
+        assert loaded.get_hash() == 0 and loaded.get_frontier() == [] and loaded.get_line_score('X') == 0
+
+
+def test_load_stones_rejects_invalid_stones():
+    board = Board(9)
+    rejected = board.load_stones([((4, 4), 'X'), ((4, 4), 'O'), ((9, 0), 'X'), ((-1, 2), 'O'), ((3, 3), None)])
+    assert rejected == [((4, 4), 'O'), ((9, 0), 'X'), ((-1, 2), 'O'), ((3, 3), None)]
+    assert board.get_played_positions() == [(4, 4)]
+
+
+def test_moves_accessors():
+    board = Board(7)
+    board.update_board('X', (3, 3))
+    board.update_board('O', (3, 4))
+    assert board.get_moves() == [((3, 3), 'X'), ((3, 4), 'O')]
+    assert board.get_move_count() == 2
+    last = board.get_move(-1)
+    assert last[:2] == ((3, 4), 'O')
+    assert board.get_move(1) is last
+    board.pop()
+    board.update_board('O', (3, 4))
+    assert board.get_move(1)[:2] == last[:2]
+    assert board.get_move(1) is not last
@@ -0,0 +1,102 @@
+from __future__ import annotations
+import random
+import tracemalloc
+
+from AI import Ai
+from Board import Board
+from CompactBoard import CompactBoard
+
+
+def play_random_game(size: int, seed: int, nb_moves: int) -> tuple(Board, CompactBoard):
+    rng = random.Random(seed)
+    board = Board(size)
+    compact_board = CompactBoard(size)
+    symbol = 'X'
+    positions = [(i, j) for i in range(size) for j in range(size)]
+    rng.shuffle(positions)
+    for position in positions[:nb_moves]:
+        assert board.update_board(symbol, position) == compact_board.update_board(symbol, position)
+        assert board.check_winner('X') == compact_board.check_winner('X')
+        symbol = 'O' if symbol == 'X' else 'X'
+    return board, compact_board
+
+
+def test_class_CompactBoard():
+    board = CompactBoard(7)
+    assert not hasattr(board, "__dict__")
+    assert board.get_board() == [[None for _ in range(7)] for _ in range(7)]
+    assert board.update_board('X', (0, 0))
+    assert not board.update_board('O', (0, 0))
+    assert board.get_row_col(0, 0) == 'X'
+    assert board.get_cells()[0] == 1
+    assert board._last_X_played == (0, 0)
+    assert not board.is_valid_move((7, 7))
+
+
+def test_parity_with_Board():
+    for seed in range(20):
+        size = 6 + seed % 10
+        board, compact_board = play_random_game(size, seed, seed * 7 % (size * size + 1))
+        assert board.get_board() == compact_board.get_board()
+        assert board.get_empty_positions() == compact_board.get_empty_positions()
+        assert board.is_full() == compact_board.is_full()
+        assert board.get_hash() == compact_board.get_hash()
+        assert board.get_symmetric_hashes() == compact_board.get_symmetric_hashes()
+        assert board.get_frontier() == compact_board.get_frontier()
+        for symbol in ['X', 'O']:
+            assert board.block_threat_of_three(symbol) == compact_board.block_threat_of_three(symbol)
+        compact_board.pop()
+        board.pop()
+        assert board.get_board() == compact_board.get_board()
+
+
+def test_copy_is_independent():
+    board, compact_board = play_random_game(12, 3, 30)
+    copy = compact_board.copy_board()
+    assert copy.get_board() == board.get_board()
+    assert copy.get_symmetric_hashes() == board.get_symmetric_hashes()
+    assert copy.get_line_score('O') == board.get_line_score('O')
+    copy.update_board('X', copy.get_empty_positions()[0])
+    assert compact_board.get_board() == board.get_board()
+    assert copy.pop() is not None
+    assert copy.get_played_positions() == board.get_played_positions()
+
+
+def test_conversions():
+    board, compact_board = play_random_game(9, 5, 25)
+    assert CompactBoard.from_lists(board.get_board()).get_board() == board.get_board()
+    assert Board.from_lists(compact_board.get_board()).get_board() == board.get_board()
+    for position in [(0, 0), (4, 4), (8, 3)]:
+        assert compact_board.create_sub_board(position).get_board() == board.create_sub_board(position).get_board()
+
+
+def test_ai_on_CompactBoard():
+    board = CompactBoard(9)
+    ai = Ai(9, 'O')
+    for position in [(3, 2), (2, 3), (2, 4), (3, 4)]:
+        board.update_board('X', position)
+    assert ai.can_do_a_double_threat(board, 'X') == (1, 4)
+    ai.play_best_move(board)
+    assert len(board.get_played_positions()) == 5
+
+
+def allocated_size(create) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    board = create()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del board
+    return allocated
+
+
+def test_indexes_are_compact():
+    board, compact_board = play_random_game(20, 3, 30)
+    assert isinstance(compact_board._near[0], bytearray)
+    assert isinstance(compact_board._threats.copy()._occupied5, bytearray)
+    assert compact_board.copy_board()._empty.typecode == 'H'
+    assert allocated_size(compact_board.copy_board) * 3 < allocated_size(board.copy_board)
+    assert allocated_size(lambda: CompactBoard(20)) * 3 < allocated_size(lambda: Board(20))
+    compact_board.reset_board()
+    assert isinstance(compact_board._near[1], bytearray)
+    assert compact_board.get_symmetric_hashes() == [0] * 8
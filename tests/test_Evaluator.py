@@ -0,0 +1,79 @@
+from __future__ import annotations
+import random
+
+import Evaluator
+from AI import Ai
+from Board import Board
+from Evaluator import BLOCKED, DIRECTIONS, EMPTY, MINE, REACH, classify, encode, get_pattern_table
+
+
+def brute_force_total(board: Board, symbol: str) -> int:
+    size = board._board_size
+    table = get_pattern_table()
+    total = 0
+    for position in board.get_played_positions():
+        if board.get_row_col(position[0], position[1]) != symbol:
+            continue
+        for dr, dc in DIRECTIONS:
+            digits = []
+            for offset in range(-REACH, REACH + 1):
+                i, j = position[0] + offset * dr, position[1] + offset * dc
+                cell = board.get_row_col(i, j) if 0 <= i < size and 0 <= j < size else 'border'
+                digits.append(EMPTY if cell is None else MINE if cell == symbol else BLOCKED)
+            total += table[encode(digits)]
+    return total
+
+
+def test_classify():
+    assert classify([0, 0, 1, 1, 1, 1, 1, 0, 0]) == Evaluator.FIVE
+    assert classify([0, 0, 1, 1, 1, 1, 0, 0, 0]) == Evaluator.OPEN_FOUR
+    assert classify([2, 1, 1, 1, 1, 0, 0, 0, 0]) == Evaluator.FOUR
+    assert classify([0, 1, 0, 1, 1, 0, 0, 0, 0]) == Evaluator.OPEN_THREE
+    assert classify([0, 0, 0, 2, 1, 1, 1, 0, 0]) == Evaluator.THREE
+    assert classify([0, 0, 0, 0, 1, 1, 0, 0, 0]) == Evaluator.OPEN_TWO
+    assert classify([0, 0, 0, 2, 1, 0, 0, 0, 0]) == Evaluator.ONE
+    assert classify([0, 0, 0, 2, 1, 0, 0, 2, 0]) == Evaluator.DEAD
+
+
+def test_incremental_totals_match_the_stones():
+    rng = random.Random(2)
+    board = Board(12)
+    evaluator = Evaluator.Evaluator()
+    for step in range(300):
+        if len(board.get_played_positions()) > 0 and rng.random() < 0.4:
+            board.pop()
+        else:
+            board.push(rng.choice(['X', 'O', 'Z']), (rng.randrange(12), rng.randrange(12)))
+        for symbol in ['X', 'O']:
+            assert evaluator.get_total(board, symbol) == brute_force_total(board, symbol)
+    board.reset_board()
+    assert evaluator.evaluate(board, 'X') == 0
+
+
+def test_evaluator_follows_another_board():
+    evaluator = Evaluator.Evaluator()
+    first, second = Board(9), Board(11)
+    first.update_board('X', (4, 4))
+    second.update_board('O', (5, 5))
+    second.update_board('O', (5, 6))
+    assert evaluator.evaluate(first, 'X') == brute_force_total(first, 'X')
+    assert evaluator.evaluate(second, 'X') == -brute_force_total(second, 'O')
+    assert evaluator.get_line_code(second, (5, 5), 1, 'O') == encode([0, 0, 0, 0, 1, 1, 0, 0, 0])
+
+
+def test_move_score():
+    board = Board(15)
+    evaluator = Evaluator.Evaluator()
+    for position in [(7, 5), (7, 6), (7, 7)]:
+        board.update_board('X', position)
+    open_four = Evaluator.SHAPE_SCORES[Evaluator.OPEN_FOUR]
+    assert evaluator.get_move_score(board, (7, 8), 'X') >= open_four
+    assert evaluator.get_move_score(board, (0, 0), 'X') < open_four
+
+
+def test_ai_plays_the_best_shape_instead_of_a_random_neighbour():
+    board = Board(15)
+    ai = Ai(15, 'O')
+    for i, position in enumerate([(7, 7), (3, 3), (7, 8)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    assert ai.get_evaluated_move(board, 'O') in [(7, 6), (7, 9)]
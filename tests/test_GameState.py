@@ -0,0 +1,80 @@
+from __future__ import annotations
+import random
+
+from AI import Ai
+from Board import Board
+from GameState import GameState
+
+
+def test_three_gains_follow_the_moves():
+    rng = random.Random(4)
+    board = Board(12)
+    state = GameState()
+    for step in range(200):
+        if len(board.get_played_positions()) > 0 and rng.random() < 0.3:
+            board.pop()
+        else:
+            board.push(rng.choice(['X', 'O']), (rng.randrange(12), rng.randrange(12)))
+        state.sync(board)
+        for position in board.get_frontier(2):
+            for symbol in ['X', 'O']:
+                gain = state.get_three_gain(board, symbol, position)
+                before = board.count_threats_of_three(symbol)
+                with board.trial(symbol, position):
+                    assert board.count_threats_of_three(symbol) - before == gain
+    assert state.hits > state.misses
+    assert state.invalidated > 0
+
+
+def test_state_is_dropped_for_another_board():
+    state = GameState()
+    board = Board(9)
+    board.update_board('X', (4, 4))
+    state.sync(board)
+    state.get_three_gain(board, 'X', (4, 5))
+    state.sync(Board(11))
+    assert state.resets == 1
+    other = Board(9)
+    for i in range(20):
+        other.update_board('O', (i // 9, i % 9))
+    state.sync(other)
+    assert state.resets == 2
+
+
+def test_forced_win_line_is_reused():
+    board = Board(15)
+    for position in [(7, 5), (7, 6), (7, 7)]:
+        board.update_board('X', position)
+    for position in [(0, 0), (0, 14), (14, 0)]:
+        board.update_board('O', position)
+    state = GameState()
+    state.set_line(board, 'X', [(7, 8), (7, 9), (7, 4), (7, 3), (7, 2)])
+    assert state.get_line(board, 'X') is None
+    board.update_board('X', (7, 8))
+    board.update_board('O', (7, 9))
+    assert state.get_line(board, 'O') is None
+    assert state.get_line(board, 'X') == [(7, 4), (7, 3), (7, 2)]
+    board.update_board('X', (7, 4))
+    board.update_board('O', (7, 2))
+    assert state.get_line(board, 'X') is None
+    assert state.line_hits == 1
+
+
+def test_reuse_plays_the_same_game():
+    games = []
+    for reuse in [True, False]:
+        board = Board(15)
+        board.set_seed(3)
+        ais = {'X': Ai(15, 'X'), 'O': Ai(15, 'O')}
+        symbol = 'X'
+        for ai in ais.values():
+            ai.set_state_reuse(reuse)
+        for _ in range(40):
+            ais[symbol].play_best_move(board)
+            if board.check_winner(symbol):
+                break
+            symbol = 'O' if symbol == 'X' else 'X'
+        games.append(board.get_played_positions())
+        if reuse:
+            assert ais['X'].get_game_state().get_stats()["hits"] > 0
+    assert games[0] == games[1]
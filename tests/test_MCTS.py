@@ -0,0 +1,79 @@
+from __future__ import annotations
+import time
+
+from AI import Ai, MCTS_MODE
+from Board import Board
+from MCTS import MCTS
+
+
+def far_deadline() -> float:
+    return time.perf_counter() + 60
+
+
+def test_mcts_plays_winning_move():
+    board = Board(15)
+    for i in range(4):
+        board.update_board('X', (7, 5 + i))
+        board.update_board('O', (8 + i % 2, 3 + 3 * i))
+    mcts = MCTS(seed=1)
+    before = board.get_board()
+    assert mcts.search(board, 'X', far_deadline(), max_playouts=2000) in [(7, 4), (7, 9)]
+    assert board.get_board() == before
+    stats = mcts.get_stats()
+    assert stats["playouts"] == 2000
+    assert stats["root_visits"] == 2000
+    assert 1 < stats["tree_size"] <= 2001
+    assert stats["reused"] == 0
+
+
+def test_tree_is_reused_after_two_moves():
+    board = Board(15)
+    board.update_board('X', (7, 7))
+    mcts = MCTS(seed=2)
+    move = mcts.search(board, 'O', far_deadline(), max_playouts=3000)
+    board.update_board('O', move)
+    size = mcts.get_tree_size()
+    mcts.search(board, 'X', far_deadline(), max_playouts=16)
+    assert 0 < mcts.get_stats()["reused"] < size
+    board.update_board('X', mcts.get_best_move())
+    board.update_board('O', (0, 0))
+    mcts.search(board, 'X', far_deadline(), max_playouts=16)
+    assert mcts.get_stats()["reused"] == 0
+
+
+def test_tree_is_capped_by_max_memory():
+    board = Board(15)
+    board.update_board('X', (7, 7))
+    mcts = MCTS(max_memory=100 * MCTS.NODE_SIZE / MCTS.MEMORY_SHARE, seed=3)
+    assert mcts.get_capacity() == 100
+    mcts.search(board, 'O', far_deadline(), max_playouts=500)
+    assert mcts.get_tree_size() == 100
+    assert mcts.get_stats()["playouts"] == 512
+    mcts.set_max_memory(10 * MCTS.NODE_SIZE / MCTS.MEMORY_SHARE)
+    assert mcts.get_tree_size() == 1
+
+
+def test_ai_in_mcts_mode():
+    board = Board(20)
+    ai = Ai(20, 'O', mode=MCTS_MODE)
+    ai.set_time_control(200, 0, 2147483647)
+    board.update_board('X', (10, 10))
+    move = ai.play_best_move(board)
+    assert board.get_row_col(*move) == 'O'
+    assert ai.get_mcts().get_stats()["playouts"] > 0
+    for i in range(3):
+        board.update_board('X', (3, 3 + i))
+    assert ai.play_best_move(board) in [(3, 2), (3, 6)]
+
+
+def test_seeded_searches_are_reproducible():
+    results = []
+    for _ in range(2):
+        board = Board(15)
+        board.update_board('X', (7, 7))
+        board.update_board('O', (7, 8))
+        mcts = MCTS()
+        mcts.set_seed(9)
+        move = mcts.search(board, 'X', far_deadline(), max_playouts=500)
+        results.append((move, mcts.get_tree_size(), mcts.get_stats()["max_ply"]))
+    assert results[0] == results[1]
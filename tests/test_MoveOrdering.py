@@ -0,0 +1,60 @@
+from __future__ import annotations
+import time
+
+from Board import Board
+from MoveOrdering import MoveOrdering, KILLER_SLOTS
+from Search import Search
+
+
+def midgame() -> Board:
+    board = Board(15)
+    for i, position in enumerate([(7, 7), (7, 8), (8, 7), (6, 6), (9, 9), (8, 10), (5, 9), (10, 6)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    return board
+
+
+def test_order_by_tt_move_score_and_killers():
+    board = midgame()
+    ordering = MoveOrdering(history=False)
+    moves = board.get_frontier()
+    ordered = ordering.order(board, 'X', moves)
+    assert sorted(ordered) == sorted(moves)
+    scores = [board.get_cell_score(move, 'X') for move in ordered]
+    assert scores == sorted(scores, reverse=True)
+    assert ordering.order(board, 'X', moves, ordered[-1])[0] == ordered[-1]
+    ties = [move for move in ordered if board.get_cell_score(move, 'X') == scores[-1]]
+    ordering.record_cutoff('X', ties[-1], 1, 2)
+    assert ordering.order(board, 'X', moves, None, 2)[-len(ties)] == ties[-1]
+    assert ordering.order(board, 'X', moves, None, 1)[-1] == ties[-1]
+
+
+def test_history_breaks_ties():
+    board = Board(15)
+    moves = [(0, 0), (0, 1), (14, 14)]
+    ordering = MoveOrdering(killers=False)
+    assert ordering.order(board, 'X', moves) == moves
+    ordering.record_cutoff('X', (14, 14), 2, 1)
+    assert ordering.get_history('X', (14, 14)) == 4
+    assert ordering.order(board, 'X', moves) == [(14, 14), (0, 0), (0, 1)]
+    assert ordering.order(board, 'O', moves) == moves
+    ordering.new_search()
+    assert ordering.get_history('X', (14, 14)) == 2
+
+
+def test_killer_slots():
+    ordering = MoveOrdering()
+    for i in range(KILLER_SLOTS + 2):
+        ordering.record_cutoff('X', (i, i), 1, 3)
+    assert ordering.get_killers(3) == [(i, i) for i in range(KILLER_SLOTS + 1, 1, -1)][:KILLER_SLOTS]
+    assert ordering.get_killers(0) == []
+    ordering.new_search()
+    assert ordering.get_killers(3) == []
+
+
+def test_search_reports_cutoff_statistics():
+    search = Search()
+    search.search(midgame(), 'X', time.perf_counter() + 60, 3)
+    stats = search.get_stats()
+    assert stats["cutoffs"] > 0
+    assert 0.0 < stats["first_move_cutoff_rate"] <= 1.0
+    assert 1.0 <= stats["branching_factor"] <= 12
@@ -0,0 +1,66 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from Board import Board
+
+np = pytest.importorskip("numpy")
+from NumpyBoard import NumpyBoard
+
+
+def play_random_game(size: int, seed: int, nb_moves: int) -> tuple(Board, NumpyBoard):
+    rng = random.Random(seed)
+    board = Board(size)
+    numpy_board = NumpyBoard(size)
+    symbol = 'X'
+    positions = [(i, j) for i in range(size) for j in range(size)]
+    rng.shuffle(positions)
+    for position in positions[:nb_moves]:
+        assert board.update_board(symbol, position) == numpy_board.update_board(symbol, position)
+        symbol = 'O' if symbol == 'X' else 'X'
+    return board, numpy_board
+
+
+def to_set(mask) -> set[tuple(int, int)]:
+    return {(int(i), int(j)) for i, j in zip(*np.nonzero(mask))}
+
+
+def test_parity_with_Board():
+    for seed in range(40):
+        size = 5 + seed % 12
+        board, numpy_board = play_random_game(size, seed, seed * 3 % (size * size + 1))
+        assert board.get_empty_positions() == numpy_board.get_empty_positions()
+        assert board.is_full() == numpy_board.is_full()
+        for symbol in ['X', 'O']:
+            assert board.check_winner(symbol) == numpy_board.check_winner(symbol)
+            assert board.block_threat_of_three(symbol)[1] == numpy_board.scan_threats_of_three(symbol)
+            win, threat, candidates = numpy_board.get_pattern_masks(symbol)
+            if not board.check_winner(symbol):
+                assert to_set(win) == board.get_winning_positions(symbol)
+            assert to_set(threat) == set(board.block_threat_of_three(symbol)[1])
+            assert to_set(candidates) == {position for position in board.get_empty_positions()
+                                          if any(abs(position[0] - row) <= 2 and abs(position[1] - col) <= 2
+                                                 for row, col in board.get_played_positions())}
+
+
+def test_pop_and_reset():
+    board = NumpyBoard(9)
+    for k in range(5):
+        board.update_board('X', (k, 8 - k))
+    assert board.check_winner('X')
+    board.pop()
+    assert not board.check_winner('X')
+    assert board.get_cells()[0, 8] == 1 and board.get_cells()[4, 4] == 0
+    board.reset_board()
+    assert len(board.get_empty_positions()) == 81
+
+
+
+def test_load_stones():
+    board, numpy_board = play_random_game(11, 4, 60)
+    loaded = NumpyBoard(11)
+    stones = [(position, board.get_row_col(position[0], position[1])) for position in board.get_played_positions()]
+    assert loaded.load_stones(stones) == []
+    assert (loaded.get_cells() == numpy_board.get_cells()).all()
+    assert loaded.get_empty_positions() == numpy_board.get_empty_positions()
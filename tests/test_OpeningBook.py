@@ -0,0 +1,79 @@
+from __future__ import annotations
+import os
+
+import OpeningBook
+import Symmetry
+import build_book
+from AI import Ai
+from Board import Board
+
+
+def opening() -> Board:
+    board = Board(15)
+    for i, position in enumerate([(7, 7), (6, 8), (8, 8)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    return board
+
+
+def rotated(board: Board, symmetry: int) -> Board:
+    res = Board(board._board_size)
+    for position in board.get_played_positions():
+        res.update_board(board.get_row_col(position[0], position[1]),
+                         Symmetry.transform(symmetry, position, board._board_size))
+    return res
+
+
+def write(tmp_path, board: Board, symbol: str, move: tuple(int, int)) -> str:
+    votes = {}
+    build_book.add_move(votes, board, symbol, move, 3)
+    path = os.path.join(str(tmp_path), OpeningBook.BOOK_FILE)
+    OpeningBook.write_book(path, build_book.best_moves(votes))
+    return path
+
+
+def test_inverse_symmetries():
+    for symmetry in range(Symmetry.NB_SYMMETRIES):
+        for position in [(0, 0), (1, 2), (14, 3), (7, 7)]:
+            moved = Symmetry.to_canonical(symmetry, position, 15)
+            assert Symmetry.from_canonical(symmetry, moved, 15) == position
+    assert len({Symmetry.transform(symmetry, (1, 2), 15) for symmetry in range(8)}) == 8
+
+
+def test_lookup_on_every_symmetric_position(tmp_path):
+    board = opening()
+    book = OpeningBook.OpeningBook(write(tmp_path, board, 'O', (6, 6)))
+    assert len(book) == 2
+    for symmetry in range(Symmetry.NB_SYMMETRIES):
+        assert book.lookup(rotated(board, symmetry), 'O') == Symmetry.transform(symmetry, (6, 6), 15)
+    assert book.lookup(board, 'X') == None
+    swapped = build_book.swapped(board)
+    assert book.lookup(swapped, 'X') == (6, 6)
+    assert book.hits == 9 and book.misses == 1
+
+
+def test_find_bisects_sorted_entries(tmp_path):
+    path = os.path.join(str(tmp_path), "book.bin")
+    entries = {key * 7919: (key % 15, key % 13, key) for key in range(1, 500)}
+    OpeningBook.write_book(path, entries)
+    book = OpeningBook.OpeningBook(path)
+    assert len(book) == len(entries)
+    for key, entry in entries.items():
+        assert book.find(key) == entry
+    assert book.find(3) == None
+    assert os.path.getsize(path) == OpeningBook.HEADER.size + len(entries) * OpeningBook.ENTRY.size
+
+
+def test_missing_or_invalid_book(tmp_path):
+    assert OpeningBook.OpeningBook(os.path.join(str(tmp_path), "missing.bin")).lookup(opening(), 'O') == None
+    path = os.path.join(str(tmp_path), "bad.bin")
+    with open(path, "wb") as file:
+        file.write(b"not a book")
+    assert len(OpeningBook.OpeningBook(path)) == 0
+
+
+def test_ai_plays_the_book_move(tmp_path):
+    board = opening()
+    ai = Ai(15, 'O')
+    ai.set_book_path(write(tmp_path, board, 'O', (0, 0)))
+    assert ai.play_best_move(board) == (0, 0)
+    assert ai.get_opening_book().hits == 1
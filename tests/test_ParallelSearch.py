@@ -0,0 +1,49 @@
+from __future__ import annotations
+import time
+
+from AI import Ai
+from Board import Board
+from ParallelSearch import ParallelSearch, get_max_workers, WORKER_MEMORY
+from Search import WIN_SCORE
+
+
+def test_get_max_workers():
+    assert get_max_workers(0) >= 1
+    assert get_max_workers(WORKER_MEMORY) == 1
+    assert get_max_workers(3 * WORKER_MEMORY) <= 2
+
+
+def test_pick_deepest_common_depth():
+    search = ParallelSearch(2)
+    results = [([(1, 10, (0, 0)), (2, 5, (0, 0)), (3, 7, (0, 0))], 100),
+               ([(1, 20, (1, 1)), (2, 4, (1, 1))], 50)]
+    assert search._pick(results) == (0, 0)
+    assert search.get_stats()["depth"] == 2
+    results.append(([(1, WIN_SCORE - 1, (2, 2))], 1))
+    assert search._pick(results) == (2, 2)
+    assert search._pick([([], 0)]) == None
+
+
+def test_parallel_search():
+    board = Board(15)
+    for i, position in enumerate([(7, 7), (7, 8), (8, 7), (6, 6), (9, 7), (8, 8)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    search = ParallelSearch(2)
+    try:
+        move = search.search(board, 'X', time.perf_counter() + 1.0, 2)
+        assert board.is_valid_move(move)
+        assert search.get_stats()["nodes"] > 0
+        assert search.get_stats()["depth"] == 2
+        board.update_board('X', (10, 7))
+        board.update_board('O', (5, 5))
+        assert search.search(board, 'X', time.perf_counter() + 1.0) in [(6, 7), (11, 7)]
+    finally:
+        search.stop()
+
+
+def test_ai_workers_are_capped():
+    ai = Ai(15, 'X', 2 * WORKER_MEMORY)
+    assert ai.set_workers(8) == 1
+    ai.set_max_memory(0)
+    assert ai.set_workers(1) == 1
+    ai.stop_workers()
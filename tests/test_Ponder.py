@@ -0,0 +1,76 @@
+from __future__ import annotations
+import os
+import subprocess
+import sys
+import time
+
+import Zobrist
+from AI import Ai, SEARCH_MODE
+from Board import Board
+
+BRAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pbrain-gomoku-ai.py")
+
+
+def midgame() -> Board:
+    board = Board(15)
+    for i, position in enumerate([(7, 7), (7, 8), (8, 7), (6, 6), (9, 9), (8, 10), (5, 9), (10, 6), (6, 8)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    return board
+
+
+def test_stop_is_immediate():
+    board = midgame()
+    ai = Ai(15, 'X', mode=SEARCH_MODE)
+    ai.set_pondering(True)
+    ai.start_pondering(board)
+    time.sleep(0.2)
+    assert ai.get_ponder().is_running()
+    start = time.perf_counter()
+    ai.stop_pondering()
+    assert time.perf_counter() - start < 0.1
+    assert not ai.get_ponder().is_running()
+    assert board.get_played_positions() == midgame().get_played_positions()
+
+
+def test_disabled_in_heuristic_mode():
+    ai = Ai(15, 'X')
+    ai.set_pondering(True)
+    ai.start_pondering(midgame())
+    assert not ai.get_ponder().is_running()
+
+
+def test_hit_reuses_the_pondered_search():
+    board = midgame()
+    ai = Ai(15, 'X', mode=SEARCH_MODE)
+    ai.set_time_control(200, 0, 2147483647)
+    ai.set_pondering(True)
+    ai.start_pondering(board)
+    time.sleep(0.5)
+    ai.stop_pondering()
+    ponder = ai.get_ponder()
+    assert ponder.predicted_move != None and ponder.depth >= 1
+    board.update_board('O', ponder.predicted_move)
+    key = board.get_hash() ^ Zobrist.get_query_key("search", 'X')
+    assert ai.get_transposition_table().get(key) != None
+    ai.play_best_move(board)
+    assert ponder.get_stats()["hits"] == 1
+
+
+def test_protocol_is_quiet_while_pondering():
+    brain = subprocess.Popen([sys.executable, BRAIN], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+
+    def send(line: str):
+        brain.stdin.write(line + "\n")
+        brain.stdin.flush()
+
+    for line in ["START 15", "INFO ai_mode search", "INFO timeout_turn 300", "INFO ponder 1", "BEGIN"]:
+        send(line)
+    assert brain.stdout.readline().strip() == "OK"
+    row, col = map(int, brain.stdout.readline().strip().split(","))
+    time.sleep(0.3)
+    send(f"TURN {row + 1},{col}")
+    assert len(brain.stdout.readline().strip().split(",")) == 2
+    time.sleep(0.3)
+    send("END")
+    assert brain.wait(timeout=5) == 0
+    assert brain.stdout.read() == ""
@@ -0,0 +1,57 @@
+from __future__ import annotations
+import json
+
+from AI import Ai
+from Board import Board
+import Profiler
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(Profiler.PROFILE_ENV, raising=False)
+    assert Profiler.get_profile_path() == None
+    assert Ai(9, 'X').get_profiler() == None
+
+
+def test_profile_path(monkeypatch, tmp_path):
+    monkeypatch.delenv(Profiler.PROFILE_ENV, raising=False)
+    assert Profiler.get_profile_path(str(tmp_path)) == str(tmp_path / Profiler.PROFILE_FILE)
+    monkeypatch.setenv(Profiler.PROFILE_ENV, str(tmp_path / "env.jsonl"))
+    assert Profiler.get_profile_path(str(tmp_path)) == str(tmp_path / "env.jsonl")
+    assert Ai(9, 'X').get_profiler().get_path() == str(tmp_path / "env.jsonl")
+
+
+def test_one_line_per_turn(tmp_path):
+    path = str(tmp_path / "profile.jsonl")
+    board = Board(9)
+    for position in [(3, 2), (2, 3), (2, 4), (3, 4)]:
+        board.update_board('X', position)
+    ai = Ai(9, 'O')
+    ai.set_profile_path(path)
+    ai.play_best_move(board)
+    ai.play_best_move(board)
+    with open(path) as file:
+        lines = file.readlines()
+    records = [json.loads(line) for line in lines]
+    assert [record["turn"] for record in records] == [1, 2]
+    assert records[0]["stages"][0]["stage"] == "winning_move"
+    assert records[0]["picked"] == records[0]["stages"][-1]["stage"]
+    assert all(stage["copies"] == 0 for record in records for stage in record["stages"])
+    assert sum(stage["candidates"] for stage in records[0]["stages"]) > 0
+    totals = Profiler.aggregate(lines)
+    assert totals["winning_move"]["runs"] == 2
+    assert sum(total["picked"] for total in totals.values()) == 2
+
+
+def test_mcts_stats_are_recorded(tmp_path):
+    path = str(tmp_path / "profile.jsonl")
+    board = Board(15)
+    board.update_board('X', (7, 7))
+    ai = Ai(15, 'O', mode="mcts")
+    ai.set_time_control(100, 0, 2147483647)
+    ai.set_profile_path(path)
+    ai.play_best_move(board)
+    with open(path) as file:
+        record = json.loads(file.readline())
+    assert record["picked"] == "mcts"
+    assert record["stats"]["playouts"] > 0
+    assert record["stats"]["tree_size"] > 1
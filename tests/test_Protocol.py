@@ -0,0 +1,174 @@
+from __future__ import annotations
+import asyncio
+import io
+
+import pytest
+
+from Protocol import CommandBuffer, CommandReader, Output, parse_line, parse_stones
+from Singleton import Singleton
+from input_parser import InputParser
+
+
+@pytest.fixture
+def parser_factory():
+    def create(text: str) -> tuple(InputParser, io.StringIO):
+        Singleton._instances.pop(InputParser, None)
+        stdout = io.StringIO()
+        return InputParser(io.StringIO(text), stdout), stdout
+
+    yield create
+    Singleton._instances.pop(InputParser, None)
+
+
+def test_parse_line():
+    assert parse_line("TURN 10,5\n") == ("turn", ["10", "5"])
+    assert parse_line("INFO timeout_turn 1000") == ("info", ["timeout_turn", "1000"])
+    assert parse_line("  \n") == ("", [])
+
+
+def test_parse_stones():
+    assert parse_stones(["1,2,1", "3,4,2", "5,6", "a,b,1", "7,8,9,1"]) == ([(1, 2, 1), (3, 4, 2)],
+                                                                         ["5,6", "a,b,1", "7,8,9,1"])
+
+
+def test_board_block_is_returned_at_once():
+    buffer = CommandBuffer()
+    assert buffer.push("BOARD\n") is None
+    assert buffer.push("7,7,1\n") is None
+    assert buffer.push("7,8,2\n") is None
+    assert buffer.push("DONE\n") == ("board", [], ["7,7,1", "7,8,2"])
+    assert buffer.push("\n") is None
+    assert buffer.push("BEGIN\n") == ("begin", [], [])
+
+
+def test_reader_counts_lines_and_commands():
+    reader = CommandReader(io.StringIO("START 15\nBOARD\n1,1,1\nDONE\n"))
+    assert reader.read() == ("start", ["15"], [])
+    assert reader.read() == ("board", [], ["1,1,1"])
+    assert reader.read() is None
+    assert reader.lines == 4
+    assert reader.commands == 2
+
+
+def test_output_flushes_once():
+    stream = io.StringIO()
+    output = Output(stream)
+    output.write("OK")
+    output.write(7, 8, sep=',')
+    assert stream.getvalue() == ""
+    output.flush()
+    output.flush()
+    assert stream.getvalue() == "OK\n7,8\n"
+    assert output.flushes == 1
+
+
+def test_one_flush_per_command(parser_factory):
+    parser, stdout = parser_factory("ABOUT\nSTART 9\nBOARD\n4,4,1\n4,5,2\nnot a stone\nDONE\nEND\n")
+    while parser.read_input():
+        pass
+    lines = stdout.getvalue().splitlines()
+    assert lines[0].startswith("name=")
+    assert lines[1] == "OK"
+    assert lines[2] == "DEBUG malformed BOARD line: not a stone"
+    assert len(lines[3].split(",")) == 2
+    assert parser._output.flushes == 3
+    assert parser.game_board.get_row_col(4, 4) == 'X'
+    assert parser.game_board.get_row_col(4, 5) == 'O'
+
+
+def test_board_replaces_the_position(parser_factory):
+    parser, stdout = parser_factory("START 9\nBOARD\n4,4,1\nDONE\nBOARD\n2,2,2\n2,2,1\nbad\n20,1,1\nDONE\n")
+    while parser.read_input():
+        pass
+    lines = stdout.getvalue().splitlines()
+    assert lines[2:5] == ["DEBUG malformed BOARD line: bad", "DEBUG invalid BOARD position: 2,2",
+                          "DEBUG invalid BOARD position: 20,1"]
+    row, col = map(int, lines[5].split(","))
+    assert sorted(parser.game_board.get_played_positions()) == sorted([(2, 2), (row, col)])
+    assert parser.game_board.get_row_col(2, 2) == 'O'
+
+
+def test_start_accepts_large_boards(parser_factory):
+    parser, stdout = parser_factory("START 100\nSTART 101\nSTART 4\nBEGIN\n")
+    while parser.read_input():
+        pass
+    lines = stdout.getvalue().splitlines()
+    assert lines[:3] == ["OK", "ERROR unsupported size", "ERROR unsupported size"]
+    assert parser.game_board._board_size == 100
+    assert lines[3] == "50,50"
+
+
+def test_restart_starts_a_new_game(parser_factory):
+    parser, stdout = parser_factory("START 9\nBEGIN\nTURN 0,0\nRESTART\nBEGIN\n")
+    while parser.read_input():
+        pass
+    lines = stdout.getvalue().splitlines()
+    assert lines[0] == "OK"
+    assert lines[3] == "OK"
+    row, col = map(int, lines[4].split(","))
+    assert parser.game_board.get_played_positions() == [(row, col)]
+    assert parser.ai.get_game_state().resets == 1
+
+
+def test_info_seed_makes_the_random_moves_reproducible(parser_factory):
+    moves = []
+    for _ in range(2):
+        parser, stdout = parser_factory("START 9\nINFO seed 3\n")
+        while parser.read_input():
+            pass
+        moves.append([parser.game_board.random_play('X') for _ in range(10)])
+    assert moves[0] == moves[1]
+    assert parser.seed == 3
+
+
+def test_info_only_sets_known_keys(parser_factory):
+    parser, stdout = parser_factory("START 9\nINFO ai 0\nINFO _output 0\nINFO game_board 0\nINFO timeout_turn 300\n")
+    while parser.read_input():
+        pass
+    assert parser.ai != 0 and parser.game_board != 0
+    assert parser._output.is_open()
+    assert parser.timeout_turn == 300
+
+
+def test_time_info_does_not_reconfigure_the_ai(parser_factory, monkeypatch):
+    parser, stdout = parser_factory("START 9\n")
+    parser.read_input()
+    calls = []
+    monkeypatch.setattr(parser.ai, "set_max_memory", lambda max_memory: calls.append(max_memory))
+    for line in ["timeout_turn 300", "time_left 10000", "max_memory 70000000"]:
+        parser.execute("info", line.split())
+    assert calls == []
+    assert parser.ai.get_turn_budget() == pytest.approx(0.3 * 0.8 - 0.05)
+    parser.execute("info", ["max_memory", "1000000"])
+    assert calls == [1000000]
+
+
+def test_info_evaluate_leaves(parser_factory):
+    parser, stdout = parser_factory("START 9\n")
+    parser.read_input()
+    assert parser.ai.get_search()._evaluator is None
+    parser.execute("info", ["evaluate_leaves", "1"])
+    assert parser.ai.get_search()._evaluator is parser.ai.get_evaluator()
+
+
+def test_unknown_command_stops(parser_factory):
+    parser, stdout = parser_factory("FOO\n")
+    assert not parser.read_input()
+    assert stdout.getvalue() == ""
+
+
+def test_run_async(parser_factory):
+    parser, stdout = parser_factory("")
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"START 9\nBOARD\n4,4,2\nDONE\n")
+        reader.feed_data(b"END\n")
+        reader.feed_eof()
+        await parser.run_async(reader)
+
+    asyncio.run(run())
+    lines = stdout.getvalue().splitlines()
+    assert lines[0] == "OK"
+    assert len(lines[1].split(",")) == 2
+    assert parser.game_board.get_row_col(4, 4) == 'O'
@@ -0,0 +1,124 @@
+from __future__ import annotations
+import time
+
+from AI import Ai
+from Board import Board
+from Evaluator import Evaluator
+from Search import Search, WIN_SCORE
+
+
+def far_deadline() -> float:
+    return time.perf_counter() + 60
+
+
+def test_search_plays_winning_move():
+    board = Board(15)
+    for i in range(4):
+        board.update_board('X', (7, 5 + i))
+        board.update_board('O', (8, 5 + i))
+    search = Search()
+    assert search.search(board, 'X', far_deadline()) in [(7, 4), (7, 9)]
+    assert search.search(board, 'O', far_deadline()) in [(8, 4), (8, 9)]
+
+
+def test_search_blocks_opponent_five():
+    board = Board(15)
+    for i in range(4):
+        board.update_board('O', (3 + i, 3 + i))
+    board.update_board('X', (2, 2))
+    board.update_board('X', (10, 10))
+    assert Search().search(board, 'X', far_deadline()) == (7, 7)
+
+
+def test_search_finds_open_four():
+    board = Board(15)
+    for i in range(3):
+        board.update_board('X', (7, 6 + i))
+    board.update_board('O', (0, 0))
+    board.update_board('O', (14, 14))
+    search = Search()
+    move = search.search(board, 'X', far_deadline(), 3)
+    assert move in [(7, 5), (7, 9)]
+    assert search.score == WIN_SCORE - 2
+    assert board.get_played_positions() == [(7, 6), (7, 7), (7, 8), (0, 0), (14, 14)]
+
+
+def test_search_scores_five_above_opponent_four():
+    board = Board(15)
+    for i in range(4):
+        board.update_board('X', (3 + i, 7))
+        board.update_board('O', (3 + i, 9))
+    search = Search()
+    assert search.search(board, 'X', far_deadline(), 4, root_moves=[(7, 7), (9, 7)]) == (7, 7)
+    assert search.score == WIN_SCORE - 1
+
+
+def test_search_stops_at_deadline():
+    board = Board(20)
+    for i, position in enumerate([(10, 10), (10, 11), (11, 10), (9, 9), (12, 12), (11, 13)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    hash_before = board.get_hash()
+    search = Search()
+    start = time.perf_counter()
+    move = search.search(board, 'X', start + 0.2)
+    assert time.perf_counter() - start < 0.5
+    assert board.is_valid_move(move)
+    assert board.get_hash() == hash_before
+    assert search.search(board, 'X', start) != None
+    assert search.get_stats()["depth"] == 0
+
+
+def test_ai_search_mode():
+    board = Board(15)
+    ai = Ai(board._board_size, 'O', mode="search")
+    assert ai.get_mode() == "search"
+    assert not ai.set_mode("unknown")
+    ai.set_time_control(300, 0, 2147483647)
+    assert 0 < ai.get_turn_budget() < 0.3
+    assert ai.play_best_move(board) == (7, 7)
+    board.update_board('X', (7, 8))
+    start = time.perf_counter()
+    move = ai.play_best_move(board)
+    assert time.perf_counter() - start < 0.3
+    assert board.get_row_col(move[0], move[1]) == 'O'
+
+
+def test_search_leaves_use_the_evaluator(monkeypatch):
+    board = Board(15)
+    for position, symbol in [((7, 7), 'X'), ((6, 6), 'O'), ((5, 7), 'X'), ((6, 7), 'O')]:
+        board.update_board(symbol, position)
+    evaluator = Evaluator()
+    scores = []
+
+    def evaluate(board, symbol):
+        score = Evaluator.evaluate(evaluator, board, symbol)
+        scores.append(score)
+        return score
+
+    monkeypatch.setattr(evaluator, "evaluate", evaluate)
+    search = Search(evaluator=evaluator)
+    search.search(board, 'X', far_deadline(), max_depth=1)
+    # at depth 1 every leaf is a root move of 'X' evaluated for 'O'
+    assert len(scores) > 0
+    assert search.score == -min(scores)
+
+
+def test_leaf_evaluation_is_opt_in():
+    ai = Ai(15, 'X', mode="search")
+    assert ai.get_search()._evaluator is None
+    ai.get_transposition_table().store(1, 1, 0)
+    ai.set_leaf_evaluation(True)
+    assert ai.get_search()._evaluator is ai.get_evaluator()
+    assert ai.get_ponder()._evaluate_leaves
+    # the scores stored with the line scores are on another scale
+    assert len(ai.get_transposition_table()) == 0
+    ai.set_leaf_evaluation(False)
+    assert ai.get_search()._evaluator is None
+
+
+def test_turn_budget_uses_time_left():
+    ai = Ai(15, 'X')
+    ai.set_time_control(5000, 100000, 2500)
+    assert ai.get_turn_budget() < 0.1
+    ai.set_time_control(0, 0, 2147483647)
+    assert ai.get_turn_budget() > 0
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import random
+
+import Symmetry
+import Zobrist
+from AI import Ai
+from Board import Board
+
+
+def random_board(rng: random.Random, size: int, nb_moves: int) -> Board:
+    board = Board(size)
+    symbol = 'X'
+    while len(board.get_played_positions()) < nb_moves:
+        if board.update_board(symbol, (rng.randrange(size), rng.randrange(size))):
+            symbol = 'O' if symbol == 'X' else 'X'
+    return board
+
+
+def moved(board: Board, symmetry: int) -> Board:
+    res = Board(board._board_size)
+    for position in board.get_played_positions():
+        res.update_board(board.get_row_col(position[0], position[1]),
+                         Symmetry.transform(symmetry, position, board._board_size))
+    return res
+
+
+def test_symmetries_form_a_group():
+    size = 9
+    cells = [(i, j) for i in range(size) for j in range(size)]
+    images = set()
+    for symmetry in range(Symmetry.NB_SYMMETRIES):
+        image = [Symmetry.transform(symmetry, cell, size) for cell in cells]
+        assert sorted(image) == cells
+        images.add(tuple(image))
+        for other in range(Symmetry.NB_SYMMETRIES):
+            composed = tuple(Symmetry.transform(other, cell, size) for cell in image)
+            assert any(composed == tuple(Symmetry.transform(s, cell, size) for cell in cells)
+                       for s in range(Symmetry.NB_SYMMETRIES))
+    assert len(images) == Symmetry.NB_SYMMETRIES
+
+
+def test_incremental_hashes_match_the_stones():
+    rng = random.Random(5)
+    board = Board(10)
+    for _ in range(200):
+        if len(board.get_played_positions()) > 0 and rng.random() < 0.4:
+            board.pop()
+        else:
+            board.push(rng.choice(['X', 'O']), (rng.randrange(10), rng.randrange(10)))
+        assert board.get_symmetric_hashes() == Symmetry.get_symmetric_hashes(board)
+        assert board.get_symmetric_hashes()[0] == board.get_hash()
+    board.reset_board()
+    assert board.get_symmetric_hashes() == [0] * Symmetry.NB_SYMMETRIES
+
+
+def test_symmetric_positions_share_the_canonical_key():
+    rng = random.Random(11)
+    for _ in range(50):
+        size = rng.randint(5, 16)
+        board = random_board(rng, size, rng.randint(0, 12))
+        key = board.get_canonical_hash()[0]
+        for symmetry in range(Symmetry.NB_SYMMETRIES):
+            assert moved(board, symmetry).get_canonical_hash()[0] == key
+        assert board.copy_board().get_canonical_hash() == board.get_canonical_hash()
+
+
+def test_moves_round_trip_through_canonical_coordinates():
+    rng = random.Random(17)
+    for _ in range(50):
+        size = rng.randint(5, 16)
+        board = random_board(rng, size, rng.randint(1, 12))
+        _, symmetry = board.get_canonical_hash()
+        for position in board.get_empty_positions():
+            assert board.from_canonical(board.to_canonical(position, symmetry), symmetry) == position
+        assert board.to_canonical(None, symmetry) == None
+        for symmetry in range(Symmetry.NB_SYMMETRIES):
+            other = moved(board, symmetry)
+            _, other_symmetry = other.get_canonical_hash()
+            for position in board.get_played_positions():
+                canonical = board.to_canonical(position, board.get_canonical_hash()[1])
+                mapped = other.from_canonical(canonical, other_symmetry)
+                assert other.get_row_col(mapped[0], mapped[1]) == board.get_row_col(position[0], position[1])
+
+
+def test_ai_cache_answers_symmetric_positions():
+    board = Board(15)
+    for i in range(4):
+        board.update_board('X', (2, 3 + i))
+    ai = Ai(15, 'O')
+    assert ai.get_winning_move(board, 'X') == (2, 2)
+    for symmetry in range(1, Symmetry.NB_SYMMETRIES):
+        other = moved(board, symmetry)
+        stats = ai.get_transposition_table().stats()
+        move = ai.get_winning_move(other, 'X')
+        assert ai.get_transposition_table().stats()["hits"] == stats["hits"] + 1
+        assert move in other.get_winning_positions('X')
+
+
+def test_symmetric_keys_follow_transform():
+    for size in [1, 2, 5, 8, 13]:
+        zobrist = Zobrist.get_keys(size)
+        keys = Symmetry.get_symmetric_keys(size)
+        for row in range(size):
+            for col in range(size):
+                for symmetry in range(Symmetry.NB_SYMMETRIES):
+                    moved = Symmetry.transform(symmetry, (row, col), size)
+                    assert keys['X'][row * size + col][symmetry] == zobrist['X'][moved[0] * size + moved[1]]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+import random
+
+from Board import Board
+
+
+def scan_threat_of_three(board: Board, symbol: str | None) -> tuple(int, int) | None:
+    """ The full-board scan Board.block_threat_of_three used before the threat index """
+    grid = board._board
+    res = []
+    directions = [(1, 0, range(len(grid) - 4), range(len(grid))), (0, 1, range(len(grid)), range(len(grid) - 4)),
+                  (1, 1, range(len(grid) - 4), range(len(grid) - 4)), (-1, 1, range(4, len(grid)), range(len(grid) - 4))]
+    for dr, dc, rows, cols in directions:
+        for i in rows:
+            for j in cols:
+                if board.is_valid_move((i, j)) and board.is_valid_move((i + 5 * dr, j + 5 * dc)):
+                    empty = []
+                    for k in range(1, 5):
+                        if grid[i + k * dr][j + k * dc] != symbol and grid[i + k * dr][j + k * dc] != None:
+                            empty = []
+                            break
+                        if board.is_valid_move((i + k * dr, j + k * dc)):
+                            empty.append((i + k * dr, j + k * dc))
+                    if len(empty) == 1:
+                        res.append(empty[0])
+    if len(res) > 0:
+        return res[0], res
+    return None, []
+
+
+def scan_winning_positions(board: Board, symbol: str) -> set:
+    res = set()
+    for position in board.get_empty_positions():
+        with board.trial(symbol, position):
+            if board.check_winner(symbol):
+                res.add(position)
+    return res
+
+
+def test_threat_of_three_matches_scan():
+    for seed in range(60):
+        rng = random.Random(seed)
+        size = rng.randint(5, 16)
+        board = Board(size)
+        center = size // 2
+        for turn in range(rng.randint(1, size * 2)):
+            position = (center + rng.randint(-4, 4), center + rng.randint(-4, 4))
+            board.update_board('X' if turn % 2 == 0 else 'O', position)
+            if board.check_winner('X') or board.check_winner('O'):
+                break
+        for symbol in ['X', 'O', None]:
+            assert board.block_threat_of_three(symbol) == scan_threat_of_three(board, symbol)
+        for symbol in ['X', 'O']:
+            if not board.check_winner(symbol):
+                assert board.get_winning_positions(symbol) == scan_winning_positions(board, symbol)
+
+
+def test_index_follows_pop_and_reset():
+    board = Board(9)
+    for i in range(3):
+        board.update_board('X', (4, i + 2))
+    assert board.count_threats_of_three('X') == 2
+    assert board.count_fours('X') == 0
+    with board.trial('X', (4, 5)):
+        assert board.count_fours('X') == 2
+        assert board.get_winning_positions('X') == {(4, 1), (4, 6)}
+        with board.trial('O', (4, 6)):
+            assert board.get_winning_positions('X') == {(4, 1)}
+            assert board.count_threats_of_three('X') == 0
+    assert board.block_threat_of_three('X') == scan_threat_of_three(board, 'X')
+    assert board.get_winning_positions('X') == set()
+    board.reset_board()
+    assert board.count_threats_of_three('X') == 0
+    assert board.block_threat_of_three('X') == (None, [])
+
+
+def test_copy_keeps_index():
+    board = Board(9)
+    for i in range(4):
+        board.update_board('O', (i, i))
+    copy = board.copy_board()
+    assert copy.get_winning_positions('O') == {(4, 4)}
+    assert copy.count_fours('O') == 1
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from AI import Ai
+from Board import Board
+from ThreatSpaceSearch import ThreatSpaceSearch
+
+# Known positions: (board size, 'X' stones, 'O' stones, attacker, VCF expected)
+VCF_PUZZLES = [
+    # double four in one move
+    (15, [(7, 4), (7, 5), (7, 6), (4, 7), (5, 7), (6, 7)], [(7, 3), (3, 7)], 'X', True),
+    # four, forced block, then double four
+    (15, [(2, 2), (2, 3), (2, 4), (3, 5), (4, 5), (5, 6), (5, 7), (5, 8)], [(2, 1), (5, 9), (1, 5)], 'X', True),
+    # four on the edge of the board, then four-four
+    (10, [(0, 1), (0, 2), (0, 3), (1, 4), (2, 4), (3, 5), (3, 6), (3, 7)], [(0, 0), (4, 4), (3, 8)], 'X', True),
+    # the same shapes for 'O'
+    (15, [(2, 1), (5, 9), (1, 5)], [(2, 2), (2, 3), (2, 4), (3, 5), (4, 5), (5, 6), (5, 7), (5, 8)], 'O', True),
+    # a blocked three only, no VCF
+    (15, [(7, 4), (7, 5), (7, 6)], [(7, 3), (7, 7)], 'X', False),
+    # the defender has a five to play first
+    (15, [(7, 4), (7, 5), (7, 6), (4, 7), (5, 7), (6, 7)], [(7, 3), (10, 0), (10, 1), (10, 2), (10, 3)], 'X', False),
+]
+
+
+def make_board(size: int, x_stones: list, o_stones: list) -> Board:
+    board = Board(size)
+    for position in x_stones:
+        assert board.update_board('X', position)
+    for position in o_stones:
+        assert board.update_board('O', position)
+    return board
+
+
+def check_winning_line(board: Board, attacker: str, line: list, fours_only: bool):
+    defender = 'O' if attacker == 'X' else 'X'
+    for index, move in enumerate(line):
+        symbol = attacker if index % 2 == 0 else defender
+        if symbol == attacker and index < len(line) - 1 and fours_only:
+            with board.trial(attacker, move):
+                assert board.count_fours(attacker) > 0
+        if symbol == defender:
+            assert board.get_winning_positions(defender) == set()
+        assert board.push(symbol, move)
+    assert board.check_winner(attacker)
+    for _ in line:
+        board.pop()
+
+
+def test_vcf_puzzles():
+    for size, x_stones, o_stones, attacker, expected in VCF_PUZZLES:
+        board = make_board(size, x_stones, o_stones)
+        hash_before = board.get_hash()
+        solver = ThreatSpaceSearch()
+        line = solver.find_vcf(board, attacker)
+        assert board.get_hash() == hash_before
+        assert (line != None) == expected
+        if line != None:
+            assert len(line) % 2 == 1
+            check_winning_line(board, attacker, line, True)
+        assert solver.get_stats()["nodes"] > 0
+
+
+def test_vct_double_three():
+    board = make_board(15, [(7, 5), (7, 6), (8, 7), (9, 7)], [(0, 0), (0, 14)])
+    solver = ThreatSpaceSearch()
+    assert solver.find_vcf(board, 'X') == None
+    line = solver.find_vct(board, 'X')
+    assert line != None
+    assert line[0] == (7, 7)
+    check_winning_line(board, 'X', line, False)
+
+
+def test_vct_defender_counter_four():
+    board = make_board(15, [(7, 5), (7, 6), (8, 7), (9, 7)], [(0, 0), (0, 1), (0, 2), (3, 3)])
+    assert ThreatSpaceSearch().find_vct(board, 'X') == None
+
+
+def test_failures_are_remembered_between_searches():
+    board = make_board(15, [(7, 4), (7, 5), (7, 6), (3, 3), (3, 4)], [(7, 3), (7, 7), (2, 2)])
+    solver = ThreatSpaceSearch()
+    assert solver.find_vct(board, 'X') == None
+    nodes = solver.get_stats()["nodes"]
+    assert solver.find_vct(board, 'X') == None
+    assert solver.get_stats()["nodes"] < nodes
+    assert solver.find_vct(board, 'O') == None
+    solver.reset()
+    assert solver.find_vct(board, 'X') == None
+    assert solver.get_stats()["nodes"] == nodes
+
+
+def test_node_budget():
+    board = make_board(15, *VCF_PUZZLES[1][1:3])
+    solver = ThreatSpaceSearch(vcf_nodes=0)
+    assert solver.find_vcf(board, 'X') == None
+    assert solver.get_stats()["nodes"] == 1
+
+
+def test_play_best_move_uses_vcf():
+    size, x_stones, o_stones, _, _ = VCF_PUZZLES[1]
+    board = make_board(size, x_stones, o_stones)
+    ai = Ai(size, 'X')
+    line = ThreatSpaceSearch().find_vcf(board, 'X')
+    assert ai.play_best_move(board) == line[0]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from Board import Board
+from TranspositionTable import TranspositionTable, LOWER_BOUND
+
+
+def test_store_and_get():
+    table = TranspositionTable()
+    assert table.get(42) == None
+    assert table.store(42, 3, 100, (1, 2), LOWER_BOUND)
+    assert table.get(42) == (3, 100, (1, 2), LOWER_BOUND)
+    assert table.stats()["hits"] == 1
+    assert table.stats()["misses"] == 1
+
+
+def test_deeper_entry_is_kept():
+    table = TranspositionTable()
+    table.store(1, 5, 10, (0, 0))
+    assert not table.store(1, 2, 20, (1, 1))
+    assert table.get(1) == (5, 10, (0, 0), 0)
+    assert table.store(1, 6, 30, (2, 2))
+    assert table.get(1)[2] == (2, 2)
+
+
+def test_memory_cap_and_eviction():
+    table = TranspositionTable(10 * TranspositionTable.ENTRY_SIZE)
+    assert table.get_capacity() == 5
+    for key in range(5):
+        table.store(key)
+    table.get(0)
+    table.store(5)
+    assert len(table) == 5
+    assert table.stats()["evictions"] == 1
+    assert table.get(1) == None
+    assert table.get(0) != None
+    table.set_max_memory(4 * TranspositionTable.ENTRY_SIZE)
+    assert len(table) == 2
+    assert table.stats()["evictions"] == 4
+    assert TranspositionTable(0).get_capacity() == TranspositionTable.DEFAULT_MEMORY // TranspositionTable.ENTRY_SIZE
+
+
+def test_zobrist_hash_is_incremental():
+    board = Board(9)
+    assert board.get_hash() == 0
+    board.update_board('X', (1, 1))
+    board.update_board('O', (2, 2))
+    other = Board(9)
+    other.update_board('O', (2, 2))
+    other.update_board('X', (1, 1))
+    assert board.get_hash() == other.get_hash() != 0
+    with board.trial('X', (3, 3)):
+        assert board.get_hash() != other.get_hash()
+    assert board.get_hash() == other.get_hash()
+    assert board.copy_board().get_hash() == board.get_hash()
+    board.reset_board()
+    assert board.get_hash() == 0
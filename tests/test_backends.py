@@ -0,0 +1,39 @@
+from __future__ import annotations
+import os
+import subprocess
+import sys
+
+from Board import Board
+from BitBoard import BitBoard
+import backends
+
+
+def test_get_board_class():
+    assert backends.get_board_class("list") is Board
+    assert backends.get_board_class("bitboard") is BitBoard
+    assert backends.get_board_class("unknown") is Board
+    if backends.is_available("numpy"):
+        from NumpyBoard import NumpyBoard
+        assert backends.get_board_class("numpy") is NumpyBoard
+
+
+def test_fallback_without_numpy(monkeypatch):
+    monkeypatch.setitem(backends.OPTIONAL_DEPENDENCIES, "numpy", "numpy_is_not_installed")
+    assert not backends.is_available("numpy")
+    assert backends.get_board_class("numpy") is Board
+
+
+def test_switch_keeps_the_stones():
+    board = Board(9)
+    for i, position in enumerate([(4, 4), (4, 5), (5, 5)]):
+        board.update_board('X' if i % 2 == 0 else 'O', position)
+    switched = backends.get_board_class("bitboard").deserialize(board.serialize())
+    assert switched.get_board() == board.get_board()
+    assert switched.get_hash() == board.get_hash()
+
+
+def test_startup_imports_are_lazy():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "import sys, input_parser; print(sorted({'numpy', 'multiprocessing'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,52 @@
+from __future__ import annotations
+import io
+import json
+import math
+
+import pytest
+
+import selfplay
+
+
+def test_parse_config():
+    assert selfplay.parse_config("heuristic") == {"name": "heuristic", "mode": "heuristic", "timeout_turn": 0}
+    assert selfplay.parse_config("search:200")["timeout_turn"] == 200
+    with pytest.raises(ValueError):
+        selfplay.parse_config("minimax")
+
+
+def test_games_are_reproducible():
+    config = selfplay.parse_config("heuristic")
+    task = (1, 7, 9, config, config, True)
+    first, second = selfplay.play_game(task), selfplay.play_game(task)
+    del first["time_per_move"], second["time_per_move"]
+    assert first == second
+    assert first["a_symbol"] == 'O'
+
+
+def test_summarize():
+    results = [{"winner": 'A', "moves": 10}] * 6 + [{"winner": 'B', "moves": 20}] * 2 + [{"winner": None, "moves": 30}] * 2
+    summary = selfplay.summarize(results)
+    assert (summary["wins"], summary["losses"], summary["draws"]) == (6, 2, 2)
+    assert summary["score"] == pytest.approx(0.7)
+    assert summary["score_ci"][0] < 0.7 < summary["score_ci"][1]
+    assert summary["elo"] == pytest.approx(147.2, abs=0.1)
+    assert summary["elo_ci"][0] < summary["elo"] < summary["elo_ci"][1]
+    assert math.copysign(1.0, selfplay.elo(0.5)) == 1.0
+
+
+def test_run_writes_one_line_per_game():
+    output = io.StringIO()
+    config = selfplay.parse_config("heuristic")
+    summary = selfplay.run(3, 1, 9, 0, config, config, output, True)
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert sorted(line["game"] for line in lines) == [0, 1, 2]
+    assert summary["games"] == 3
+
+
+def test_main_writes_only_jsonl_to_stdout(capsys):
+    assert selfplay.main(["--games", "2", "--workers", "1", "--size", "9"]) == 0
+    captured = capsys.readouterr()
+    lines = [json.loads(line) for line in captured.out.splitlines()]
+    assert sorted(line["game"] for line in lines) == [0, 1]
+    assert "score of A" in captured.err